@@ -16,6 +16,33 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_DB: str
+    # 지정 시 위 MySQL 설정 대신 사용 (예: 벤치마크용 sqlite://...)
+    DB_URL: str | None = None
+    # 앱 시작 시 스키마 생성 여부 (기본: 꺼짐 -> 배포 시 `aerich upgrade` 1회로 마이그레이션)
+    # 워커마다 생성하면 기동이 느리고 동시 기동 시 DDL 이 경합한다. 로컬/벤치마크 sqlite 에서만 켠다.
+    DB_GENERATE_SCHEMAS: bool = False
+    # DB 연결 풀: 모든 워커의 연결 수 합 상한 (MySQL max_connections 보다 작게), 워커 수로 나눠 풀 크기 결정
+    DB_CONNECTION_BUDGET: int = 120
+    # 풀을 나눠 쓸 워커 수, 0 이면 WEB_CONCURRENCY (gunicorn/uvicorn 워커 수), 없으면 1
+    DB_POOL_WORKERS: int = 0
+    # 워커 기동 시 미리 여는 연결 수 / 워커당 풀 크기 상한
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 50
+    # 연결 획득 대기 상한(초), 넘으면 503
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS: float = 5.0
+    # 워커당 예산 중 목록/채널 보드 조회용 읽기 풀 비율, 0 이면 읽기 풀 없음 (DB_URL 사용 시에도 없음)
+    DB_READ_POOL_SHARE: float = 0.25
+    # 읽기 복제본: 지정 시 read 연결이 primary 대신 복제본을 가리킴 (계정/DB 이름은 primary 와 같음)
+    # CACHE_BACKEND=redis 필요: 쓰기 후 고정이 캐시 무효화로 워커 간 전달됨, local 이면 라우팅 비활성화
+    DB_READ_HOST: str | None = None
+    DB_READ_PORT: int | None = None
+    # 지정 시 위 복제본 설정 대신 사용 (예: 로컬 테스트용 두 번째 sqlite://...)
+    DB_READ_URL: str | None = None
+    # 쓰기 후 이 시간(초) 동안 관련 읽기는 primary 로 (read-your-writes)
+    DB_READ_PIN_SECONDS: float = 5.0
+    # 복제 지연이 이 값(초)을 넘거나 확인 실패 시 모든 읽기를 primary 로
+    DB_REPLICA_MAX_LAG_SECONDS: float = 2.0
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 1.0
 
     SECRET_KEY: str
 
@@ -26,6 +53,72 @@ class Settings(BaseSettings):
     MAIL_SERVER: str
     MAIL_FROM_NAME: str
 
+    # 채널 할당 백엔드: local(워커 단일) | mysql_slots(워커 간 공유)
+    CHANNEL_ALLOCATION_BACKEND: str = "local"
+    # 시설(facility)별 채널 수, 선언 순서대로 채널 번호를 이어서 부여
+    # 예: CHANNEL_FACILITIES='{"seoul": 64, "busan": 32}' -> seoul 1-64, busan 65-96 (첫 시설이 기본)
+    CHANNEL_FACILITIES: dict[str, int] = {"default": 16}
+    # 시설마다 빈 채널이 이 수 이하로 남으면 정적 채널이 배정된 사용자만 시작 가능
+    CHANNEL_PRIORITY_RESERVE: int = 0
+    # 채널 보드 스냅샷 최대 재사용 시간(초), 다른 워커의 변경 반영 지연 상한
+    CHANNEL_BOARD_MAX_AGE_SECONDS: float = 1.0
+    # 채널 보드 한 페이지 채널 수 (페이지마다 따로 만들고 무효화)
+    CHANNEL_BOARD_PAGE_SIZE: int = 64
+    # 인증용 사용자 캐시 TTL(초), local 캐시 + 워커 여럿이면 사용자 삭제/권한 회수가 다른 워커에 전달되지 않아 꺼짐
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    # 캐시 백엔드: local(워커별 LRU+TTL) | redis(워커 간 공유 + 무효화 pub/sub)
+    CACHE_BACKEND: str = "local"
+    CACHE_REDIS_URL: str = "redis://127.0.0.1:6379/0"
+    CACHE_REDIS_POOL_SIZE: int = 8
+    CACHE_MAX_ENTRIES: int = 10000
+    # 관리자 스트리머 목록 캐시 TTL(초), 쓰기 경로에서 즉시 무효화
+    STREAMER_LIST_CACHE_TTL_SECONDS: float = 60.0
+    # bcrypt 스레드 풀 크기 / 대기 작업 상한 (초과 시 503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    # 관리자 사용자 일괄 등록 최대 행 수
+    USER_IMPORT_MAX_ROWS: int = 1000
+
+    # Janus (비활성화 시 방 생성/삭제 없이 room id 만 기록)
+    JANUS_ENABLED: bool = False
+    JANUS_WS_URL: str = "ws://127.0.0.1:8188"
+    JANUS_ADMIN_KEY: str | None = None
+    JANUS_REQUEST_TIMEOUT_SECONDS: float = 5.0
+    # 반환된 room id 재사용 대기 시간(초)
+    JANUS_ROOM_ID_COOLDOWN_SECONDS: float = 5.0
+
+    # 스트림 이력: live_histories 보존 일수, 지나면 live_history_archives 로 배치 이동
+    LIVE_HISTORY_RETENTION_DAYS: int = 90
+    # 아카이브 보존 개월 수 (없으면 삭제하지 않음)
+    LIVE_HISTORY_ARCHIVE_RETENTION_MONTHS: int | None = None
+    LIVE_HISTORY_ARCHIVE_BATCH_SIZE: int = 1000
+    LIVE_HISTORY_ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+    LIVE_HISTORY_ARCHIVE_ENABLED: bool = True
+
+    # 스트림 heartbeat: 이 시간(초) 동안 heartbeat 가 없으면 reaper 가 종료 처리 (Janus 방에 송출자가 있으면 유지)
+    LIVE_HEARTBEAT_TIMEOUT_SECONDS: float = 120.0
+    LIVE_REAPER_INTERVAL_SECONDS: float = 30.0
+    LIVE_REAPER_BATCH_SIZE: int = 100
+    LIVE_REAPER_ENABLED: bool = True
+
+    # 응답 압축 (Accept-Encoding 협상, br 은 brotli 패키지가 설치된 경우만), 이 크기(바이트) 미만은 그대로
+    HTTP_COMPRESSION_ENABLED: bool = True
+    HTTP_COMPRESSION_MIN_SIZE: int = 1024
+    HTTP_GZIP_LEVEL: int = 6
+    HTTP_BROTLI_QUALITY: int = 5
+
+    # 요청 헤더 X-Profile: 1 로 Server-Timing 응답 헤더 허용
+    METRICS_PROFILE_HEADER_ENABLED: bool = True
+    # 이벤트 루프 지연 측정 주기(초)
+    METRICS_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+
+    # 로그: 큐에 쌓고 백그라운드 스레드가 stdout 으로 기록
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True
+    # DEBUG 로그는 N 개 중 1개만 기록 (채널 할당 로그 등)
+    LOG_DEBUG_SAMPLE_EVERY: int = 10
+    # 큐가 가득 차면 새 로그는 버림
+    LOG_QUEUE_SIZE: int = 10000
 
     class Config:
         env_file = os.environ.get("ENV_FILE") or "/Users/hanswell/PycharmProjects/ICS/envs/.env.local"
@@ -0,0 +1,25 @@
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from tortoise import connections
+from tortoise.backends.base.client import TransactionalDBClient
+
+# 복제본 허용 읽기 범위에서 쓸 연결 이름 (app.core.db_routing.read_routing.reads() 가 설정)
+read_connection_name: ContextVar[Optional[str]] = ContextVar("read_connection_name", default=None)
+
+
+class Router:
+    """Tortoise DB 라우터 (TORTOISE_ORM["routers"])
+
+    쓰기와 기본 읽기는 default(primary). 복제본 허용 범위 안의 읽기만 read 연결로 보내고,
+    트랜잭션 안에서는 항상 트랜잭션 연결을 쓴다 (채널 할당 등 쓰기 경로는 primary 전용).
+    """
+
+    def db_for_read(self, model: Any) -> Optional[str]:
+        name = read_connection_name.get()
+        if name is None or isinstance(connections.get("default"), TransactionalDBClient):
+            return None
+        return name
+
+    def db_for_write(self, model: Any) -> Optional[str]:
+        return None
@@ -1,4 +1,6 @@
 import os
+from typing import Any
+
 from app.configs import settings
 
 DB_URL = (
@@ -6,35 +8,91 @@ DB_URL = (
     f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DB}"
 )
 
+# 목록/채널 보드 조회용 읽기 풀 연결 이름
+READ_CONNECTION = "read"
+
 TORTOISE_APP_MODELS = [
     "aerich.models",
     "app.models.user_model",
     "app.models.live_model",
+    "app.models.live_history_model",
+    "app.models.channel_slot_model",
 ]
 
-TORTOISE_ORM = {
-    "connections": {
-        "default": {
-            "engine": "tortoise.backends.mysql",
-            "credentials": {
-                "host": settings.DB_HOST,
-                "port": settings.DB_PORT,
-                "user": settings.DB_USER,
-                "password": settings.DB_PASSWORD,
-                "database": settings.DB_DB,
-                "connect_timeout": 5,
-                "minsize": 15,
-                "maxsize": 500,
-                "pool_recycle": 3600,
-            },
+
+def worker_count() -> int:
+    """DB 연결 예산을 나눠 쓸 워커 수 (DB_POOL_WORKERS, 없으면 WEB_CONCURRENCY)"""
+    if settings.DB_POOL_WORKERS > 0:
+        return settings.DB_POOL_WORKERS
+    try:
+        return max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
+def pool_sizes(
+    workers: int, budget: int, read_share: float, min_size: int, max_size: int
+) -> dict[str, tuple[int, int]]:
+    """연결 이름 -> (minsize, maxsize), 워커당 예산(budget / workers)을 쓰기/읽기 풀로 나눔"""
+    per_worker = max(1, budget // workers)
+    read = min(int(per_worker * read_share), max_size)
+    write = min(max(1, per_worker - read), max_size)
+    sizes = {"default": (min(min_size, write), write)}
+    if read > 0:
+        sizes[READ_CONNECTION] = (min(min_size, read), read)
+    return sizes
+
+
+def _mysql_connection(minsize: int, maxsize: int, host: str | None = None, port: int | None = None) -> dict[str, Any]:
+    return {
+        "engine": "tortoise.backends.mysql",
+        "credentials": {
+            "host": host or settings.DB_HOST,
+            "port": port or settings.DB_PORT,
+            "user": settings.DB_USER,
+            "password": settings.DB_PASSWORD,
+            "database": settings.DB_DB,
+            "connect_timeout": 5,
+            "minsize": minsize,
+            "maxsize": maxsize,
+            "pool_recycle": 3600,
         },
-    },
+    }
+
+
+if settings.DB_URL:
+    # sqlite 등 단일 연결 -> 풀 크기/읽기 풀 없음
+    POOL_SIZES: dict[str, tuple[int, int]] = {}
+    DB_CONNECTIONS: dict[str, Any] = {"default": settings.DB_URL}
+else:
+    POOL_SIZES = pool_sizes(
+        worker_count(),
+        settings.DB_CONNECTION_BUDGET,
+        settings.DB_READ_POOL_SHARE,
+        settings.DB_POOL_MIN_SIZE,
+        settings.DB_POOL_MAX_SIZE,
+    )
+    DB_CONNECTIONS = {name: _mysql_connection(*sizes) for name, sizes in POOL_SIZES.items()}
+    if settings.DB_READ_HOST and READ_CONNECTION in POOL_SIZES:
+        DB_CONNECTIONS[READ_CONNECTION] = _mysql_connection(
+            *POOL_SIZES[READ_CONNECTION], host=settings.DB_READ_HOST, port=settings.DB_READ_PORT
+        )
+if settings.DB_READ_URL:
+    DB_CONNECTIONS[READ_CONNECTION] = settings.DB_READ_URL
+
+# read 연결이 primary 의 별도 풀이 아닌 복제본인지 (복제 지연 확인 대상)
+READ_IS_REPLICA = READ_CONNECTION in DB_CONNECTIONS and bool(settings.DB_READ_URL or settings.DB_READ_HOST)
+
+TORTOISE_ORM: dict[str, Any] = {
+    "connections": DB_CONNECTIONS,
     "apps": {
         "models": {
             "models": TORTOISE_APP_MODELS,
             "default_connection": "default",
         },
     },
-    # "routers": ["app.configs.database_config.Router"],
     "timezone": "Asia/Seoul",
 }
+if READ_CONNECTION in DB_CONNECTIONS:
+    # 복제본 허용 읽기만 read 연결로 (app.core.db_routing.read_routing.reads), read 연결이 없으면 라우터 없이 모두 default
+    TORTOISE_ORM["routers"] = ["app.configs.database_config.Router"]
@@ -1,11 +1,16 @@
+import copy
 import os
 from datetime import datetime, timedelta
 from typing import Any, Optional, List
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 
+from app.configs import settings
+from app.configs.database_settings import worker_count
+from app.core.cache import cache
+from app.core.db_routing import read_routing
+from app.core.user_cache import UserCache
 from app.dtos.user.user_profile_update_request import UserProfileUpdateRequest
 from app.models.user_model import User, UserRole
 
@@ -15,6 +20,34 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+
+def user_cache_ttl(ttl: float, shared_cache: bool, workers: int) -> float:
+    """인증 사용자 캐시 TTL (0 이면 캐시하지 않음)
+
+    local 캐시는 무효화가 다른 워커에 전달되지 않아, 워커가 여럿이면 권한이 회수되거나 삭제된 사용자가
+    다른 워커에서 TTL 동안 계속 인증된다. 그래서 워커가 둘 이상이면 공유 캐시(CACHE_BACKEND=redis)를 요구한다.
+    워커 수는 DB_POOL_WORKERS/WEB_CONCURRENCY 로 판단하므로 uvicorn --workers 만 쓰면 함께 설정해야 한다.
+    """
+    if not shared_cache and workers > 1:
+        return 0.0
+    return ttl
+
+
+# 인증용 사용자 캐시 -> 요청마다 User 조회하지 않음 (공유 캐시 백엔드면 워커 간 공유)
+user_cache = UserCache(
+    ttl=user_cache_ttl(settings.USER_CACHE_TTL_SECONDS, cache.shared, worker_count()),
+    shared=cache if cache.shared else None,
+)
+# 다른 워커에서 무효화된 사용자는 로컬 사본도 제거
+cache.on_invalidate(
+    "user", lambda key: user_cache.invalidate(user_id=int(key)) if key else user_cache.clear()
+)
+
+
+async def invalidate_user_cache(user_id: int) -> None:
+    """사용자 정보/권한 변경 후 호출 -> 모든 워커의 캐시에서 제거"""
+    await cache.invalidate("user", str(user_id))
+
 credentials_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="Could not validate credentials",
@@ -23,20 +56,54 @@ credentials_exception = HTTPException(
 
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    return await get_user_from_token(token)
+
+
+async def get_user_from_token(token: str) -> User:
+    """토큰 검증 후 사용자 조회 (WebSocket 등 Depends 밖에서도 사용)
+
+    토큰의 uid 클레임으로 캐시를 먼저 보고, 없을 때만 PK 로 DB 조회한다.
+    캐시 객체는 여러 요청이 함께 보므로 요청마다 사본을 돌려준다 (수정/저장해도 캐시는 그대로).
+    """
+    # jose 는 첫 인증 요청에서 import (워커 기동 시간 단축, 이후에는 sys.modules 조회만)
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])  # SECRET_KEY: str
-        username: Optional[str] = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        user = await User.get(username=username)
+    except JWTError:
+        raise credentials_exception
+    username: Optional[str] = payload.get("sub")
+    if username is None:
+        raise credentials_exception
+    user_id: Optional[int] = payload.get("uid")
+
+    user = user_cache.get(user_id=user_id, username=username)
+    if user is None and user_id is not None:
+        user = await user_cache.get_shared(user_id)
+        if user is not None and user.username != username:
+            # 공유 캐시 값이 오래된 경우 (무효화 누락 등) DB 로 확인
+            user = None
+    if user is None:
+        if user_id is not None:
+            # 복제본 허용 (이 사용자의 정보가 최근에 바뀌었으면 primary)
+            with read_routing.reads("user", str(user_id)):
+                user = await User.get_or_none(id=user_id)
+        else:
+            # uid 클레임이 없는 이전 토큰
+            user = await User.get_or_none(username=username)
         if user is None:
             raise credentials_exception
-        return user
-    except JWTError:
+        user_cache.set(user)
+        await user_cache.set_shared(user)
+    if user.username != username:
         raise credentials_exception
+    return copy.copy(user)
 
 
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+    """sub(username) 외에 uid/role 클레임을 함께 담으면 인증 시 PK 조회/캐시 키로 사용"""
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
@@ -56,6 +123,12 @@ class RoleChecker:
             )
         return current_user
 
+
+def token_claims_for(user: User) -> dict[str, Any]:
+    """액세스 토큰 클레임 (username, id, role)"""
+    role = user.role.value if isinstance(user.role, UserRole) else str(user.role)
+    return {"sub": user.username, "uid": user.id, "role": role}
+
 require_admin = RoleChecker([UserRole.ADMIN])
 require_streamer = RoleChecker([UserRole.STREAMER])
 require_any_user = RoleChecker([UserRole.ADMIN, UserRole.STREAMER])
@@ -0,0 +1,145 @@
+import abc
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.configs import settings
+from app.core.metrics import Counter, registry
+
+logger = logging.getLogger(__name__)
+
+cache_requests_total = registry.register(Counter("ics_cache_requests_total", "캐시 조회 수", ("namespace", "result")))
+
+# 무효화 핸들러: 키 ("" 이면 네임스페이스 전체)
+InvalidateHandler = Callable[[str], None]
+# 메시지 핸들러: 다른 워커가 publish 한 본문 ("" 이면 구독이 끊겨 메시지를 놓쳤을 수 있음)
+MessageHandler = Callable[[str], None]
+
+
+class CacheBackend(abc.ABC):
+    """bytes 키-값 캐시 + 워커 간 무효화 알림
+
+    키는 "네임스페이스:키" 형식. invalidate() 는 공유 키를 지우고 모든 워커(자기 자신 포함)의
+    on_invalidate 핸들러를 호출해 프로세스 로컬 사본도 버리게 한다.
+    publish() 는 같은 구독 채널로 다른 워커의 on_message 핸들러에 메시지를 전달한다.
+    """
+
+    name = "base"
+    # 다른 워커와 값을 공유하는지 (False 면 프로세스 로컬)
+    shared = False
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[InvalidateHandler]] = {}
+        self._message_handlers: dict[str, list[MessageHandler]] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._get(key)
+        cache_requests_total.inc(1, key.split(":", 1)[0], "hit" if value is not None else "miss")
+        return value
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """ttl 초 동안 값 저장"""
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """키 삭제 (없는 키는 무시)"""
+
+    @abc.abstractmethod
+    async def _get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 만료되면 None), 히트/미스 집계는 get() 에서"""
+
+    async def _broadcast(self, namespace: str, key: str) -> None:
+        """다른 워커에 무효화 전달 (로컬 백엔드는 없음)"""
+
+    def on_invalidate(self, namespace: str, handler: InvalidateHandler) -> None:
+        self._handlers.setdefault(namespace, []).append(handler)
+
+    def _dispatch(self, namespace: str, key: str) -> None:
+        for handler in self._handlers.get(namespace, ()):
+            try:
+                handler(key)
+            except Exception:
+                logger.exception("캐시 무효화 핸들러 실패", extra={"namespace": namespace, "key": key})
+
+    def _dispatch_all(self) -> None:
+        for namespace in list(self._handlers):
+            self._dispatch(namespace, "")
+        for topic in list(self._message_handlers):
+            self._deliver(topic, "")
+
+    def on_message(self, topic: str, handler: MessageHandler) -> None:
+        self._message_handlers.setdefault(topic, []).append(handler)
+
+    def _deliver(self, topic: str, payload: str) -> None:
+        for handler in self._message_handlers.get(topic, ()):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("캐시 메시지 핸들러 실패", extra={"topic": topic})
+
+    async def publish(self, topic: str, payload: str) -> None:
+        """다른 워커의 on_message 핸들러에 전달 (자기 워커는 호출한 쪽에서 처리, 로컬 백엔드는 없음)"""
+
+    async def invalidate(self, namespace: str, key: str = "") -> None:
+        """쓰기 경로에서 호출: 공유 키 삭제 + 모든 워커의 로컬 사본 무효화"""
+        self._dispatch(namespace, key)
+        await self.delete(f"{namespace}:{key}")
+        await self._broadcast(namespace, key)
+
+
+class LocalCache(CacheBackend):
+    """프로세스 로컬 LRU + TTL (단일 워커/개발용 기본값)
+
+    무효화가 다른 워커에 전달되지 않으므로, 워커가 여럿이면 한 워커의 쓰기가 다른 워커의 사본에는
+    TTL 이 지날 때까지 반영되지 않는다 (인증 사용자 캐시는 이 경우 꺼짐, auth.user_cache_ttl 참고).
+    """
+
+    name = "local"
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+def get_cache_backend(name: str) -> CacheBackend:
+    if name == LocalCache.name:
+        return LocalCache(max_entries=settings.CACHE_MAX_ENTRIES)
+    if name == "redis":
+        # 공유 캐시를 쓸 때만 import
+        from app.core.redis_cache import RedisCache
+
+        return RedisCache(settings.CACHE_REDIS_URL, pool_size=settings.CACHE_REDIS_POOL_SIZE)
+    raise ValueError(f"알 수 없는 캐시 백엔드: {name}")
+
+
+cache = get_cache_backend(settings.CACHE_BACKEND)
@@ -0,0 +1,144 @@
+import gzip
+from collections import OrderedDict
+from typing import Any, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Counter, registry
+
+http_compressed_responses_total = registry.register(
+    Counter("ics_http_compressed_responses_total", "압축해서 보낸 응답 수", ("encoding",))
+)
+http_compression_saved_bytes_total = registry.register(
+    Counter("ics_http_compression_saved_bytes_total", "압축으로 줄인 응답 바이트", ("encoding",))
+)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+_brotli: Any = None
+
+
+def brotli_module() -> Any:
+    """brotli 패키지 (선택 의존성, 없으면 None -> gzip 만 협상)"""
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli  # type: ignore[import-not-found]
+        except ImportError:
+            brotli = False
+        _brotli = brotli
+    return _brotli or None
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool) -> Optional[str]:
+    """Accept-Encoding 에서 쓸 인코딩 (br 우선, q=0 은 제외), 없으면 None"""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    candidates = ("br", "gzip") if brotli_available else ("gzip",)
+    best = max(candidates, key=lambda name: accepted.get(name, accepted.get("*", 0.0)))
+    return best if accepted.get(best, accepted.get("*", 0.0)) > 0 else None
+
+
+class CompressionMiddleware:
+    """JSON/텍스트 응답 gzip/brotli 압축 (순수 ASGI)
+
+    - minimum_size 미만, 스트리밍(more_body), 이미 인코딩된 응답, 200 이외 응답은 그대로
+    - ETag 가 있는 본문(채널 보드 등)은 (ETag, 인코딩)별 압축 결과를 재사용하고, 압축한 응답의 ETag 는 W/ 로 바꾼다
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_entries: int = 256,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_entries = cache_entries
+        self._compressed: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def compress(self, body: bytes, encoding: str, etag: Optional[str] = None) -> bytes:
+        key = (etag, encoding) if etag else None
+        if key is not None:
+            cached = self._compressed.get(key)
+            if cached is not None:
+                self._compressed.move_to_end(key)
+                return cached
+        if encoding == "br":
+            compressed: bytes = brotli_module().compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        if key is not None:
+            self._compressed[key] = compressed
+            if len(self._compressed) > self.cache_entries:
+                self._compressed.popitem(last=False)
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+        encoding = negotiate_encoding(accept_encoding, brotli_module() is not None) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough or message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            passthrough = True
+            start["headers"] = list(start.get("headers", []))
+            headers = MutableHeaders(raw=start["headers"])
+            content_type = headers.get("content-type", "")
+            if (
+                start["status"] != 200
+                or "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            etag = headers.get("etag")
+            compressed = self.compress(body, encoding, etag)
+            http_compressed_responses_total.inc(1, encoding)
+            http_compression_saved_bytes_total.inc(len(body) - len(compressed), encoding)
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
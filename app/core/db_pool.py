@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from functools import wraps
+from typing import Any, Callable
+
+import tortoise
+from fastapi import HTTPException, status
+from tortoise import connections
+from tortoise.backends.base.client import TransactionContextPooled
+
+from app.configs import settings
+from app.configs.database_settings import POOL_SIZES, worker_count
+from app.core.metrics import Counter, Histogram, registry
+
+logger = logging.getLogger(__name__)
+
+# install() 이 바꾸는 Tortoise 내부(MySQLClient.create_connection 의 _pool, TransactionContextPooled.__aenter__)를
+# 확인한 버전 (major.minor), 다른 버전이면 계측하지 않음
+TESTED_TORTOISE_VERSIONS = ("0.25",)
+
+db_pool_wait_seconds = registry.register(Histogram("ics_db_pool_wait_seconds", "DB 연결 획득 대기 시간", ("pool",)))
+db_pool_timeouts_total = registry.register(
+    Counter("ics_db_pool_acquire_timeouts_total", "획득 대기 시간 초과로 거절된 요청 수", ("pool",))
+)
+
+
+class MonitoredPool:
+    """asyncmy 풀 프록시: 획득 대기 시간/대기 수 기록, 대기 상한을 넘으면 503
+
+    Tortoise 가 쓰는 acquire/release 만 가로채고 나머지(close, wait_closed 등)는 원래 풀로 넘긴다.
+    """
+
+    def __init__(self, pool: Any, name: str, acquire_timeout: float):
+        self._pool = pool
+        self.name = name
+        self.acquire_timeout = acquire_timeout
+        self.waiting = 0
+
+    async def acquire(self) -> Any:
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(self._pool.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            db_pool_timeouts_total.inc(1, self.name)
+            logger.warning("DB 연결 획득 시간 초과", extra={"pool": self.name, "stats": self.stats()})
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            )
+        finally:
+            self.waiting -= 1
+            db_pool_wait_seconds.observe(time.perf_counter() - started, self.name)
+
+    def release(self, connection: Any) -> Any:
+        # 코루틴이 아님 (asyncmy 가 돌려주는 future 를 그대로 반환)
+        return self._pool.release(connection)
+
+    def stats(self) -> dict[str, int]:
+        size = self._pool.size
+        idle = self._pool.freesize
+        return {
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": self.waiting,
+            "max_size": self._pool.maxsize,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+
+class PoolMonitor:
+    """MySQL 연결 풀 계측 (풀이 만들어질 때마다 MonitoredPool 로 감쌈)"""
+
+    def __init__(self, acquire_timeout: float):
+        self.acquire_timeout = acquire_timeout
+        self.pools: dict[str, MonitoredPool] = {}
+        self._installed = False
+
+    def wrap(self, name: str, pool: Any) -> MonitoredPool:
+        monitored = MonitoredPool(pool, name, self.acquire_timeout)
+        self.pools[name] = monitored
+        return monitored
+
+    def install(self) -> None:
+        """MySQL 클라이언트의 풀 생성/트랜잭션 진입을 계측 (첫 쿼리 전, 앱 시작 시 1회)"""
+        if self._installed:
+            return
+        if not tortoise_supported(tortoise.__version__):
+            logger.warning(
+                "확인하지 않은 Tortoise 버전이라 DB 연결 풀 계측 비활성화",
+                extra={"tortoise": tortoise.__version__, "tested": TESTED_TORTOISE_VERSIONS},
+            )
+            return
+        self._installed = True
+        from tortoise.backends.mysql.client import MySQLClient
+
+        MySQLClient.create_connection = self._wrap_create_connection(MySQLClient.create_connection)  # type: ignore[method-assign]
+        TransactionContextPooled.__aenter__ = _reset_on_failed_enter(TransactionContextPooled.__aenter__)  # type: ignore[method-assign]
+        if POOL_SIZES:
+            logger.info("DB 연결 풀", extra={"workers": worker_count(), "sizes": POOL_SIZES})
+
+    def _wrap_create_connection(self, create_connection: Callable[..., Any]) -> Callable[..., Any]:
+        monitor = self
+
+        @wraps(create_connection)
+        async def wrapper(client: Any, with_db: bool) -> None:
+            await create_connection(client, with_db)
+            if client._pool is not None and not isinstance(client._pool, MonitoredPool):
+                client._pool = monitor.wrap(client.connection_name, client._pool)
+
+        return wrapper
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+
+def tortoise_supported(version: str) -> bool:
+    """install() 이 의존하는 Tortoise 내부 구현을 확인한 버전인지"""
+    return ".".join(version.split(".")[:2]) in TESTED_TORTOISE_VERSIONS
+
+
+def _reset_on_failed_enter(enter: Callable[..., Any]) -> Callable[..., Any]:
+    """트랜잭션 진입(연결 획득/BEGIN)이 실패하면 연결 반환 + 연결 컨텍스트 복원
+
+    Tortoise 는 풀에서 연결을 받기 전에 현재 태스크의 연결을 트랜잭션으로 바꿔 두고,
+    진입 실패 시에는 __aexit__ 이 불리지 않는다. 그대로 두면 획득 시간 초과 후에도
+    같은 태스크(백그라운드 작업 등)가 끊긴 트랜잭션을 계속 쓴다.
+    """
+
+    @wraps(enter)
+    async def wrapper(self: TransactionContextPooled) -> Any:
+        try:
+            return await enter(self)
+        except BaseException:
+            if self.client._connection is not None and self.client._parent._pool:
+                await self.client._parent._pool.release(self.client._connection)
+                self.client._connection = None
+            token = getattr(self, "token", None)
+            if token is not None:
+                connections.reset(token)
+            raise
+
+    return wrapper
+
+
+pool_monitor = PoolMonitor(acquire_timeout=settings.DB_POOL_ACQUIRE_TIMEOUT_SECONDS)
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import math
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator, Optional
+
+from tortoise import connections
+from tortoise.exceptions import OperationalError
+
+from app.configs import settings
+from app.configs.database_config import read_connection_name
+from app.configs.database_settings import (
+    DB_CONNECTIONS,
+    READ_CONNECTION,
+    READ_IS_REPLICA,
+)
+from app.core.cache import cache
+from app.core.metrics import Counter, Gauge, registry
+
+logger = logging.getLogger(__name__)
+
+db_reads_routed_total = registry.register(
+    Counter("ics_db_reads_routed_total", "복제본 허용 읽기 범위의 연결 선택 수", ("target", "reason"))
+)
+
+# 쓰기 후 무효화가 방송되는 캐시 네임스페이스 -> 같은 키의 읽기를 primary 로 고정
+PINNED_NAMESPACES = ("user", "streamers", "channel_board")
+
+# 복제 상태 조회 (MySQL 8.0.22+ / 이전 버전)
+REPLICA_STATUS_QUERIES = (
+    ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+    ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+)
+
+
+def replica_routing_blocker(is_replica: bool, shared_cache: bool) -> Optional[str]:
+    """복제본으로 읽기를 보낼 수 없는 이유 (없으면 None)
+
+    쓰기 후 고정은 캐시 무효화를 타고 다른 워커에 전달되는데, local 캐시는 같은 워커 안에서만 전달한다.
+    워커 수는 프로세스 안에서 믿을 수 없으므로 (uvicorn --workers 등) 워커가 하나여도 공유 캐시를 요구한다.
+    """
+    if is_replica and not shared_cache:
+        return "읽기 복제본은 공유 캐시(CACHE_BACKEND=redis)가 있어야 사용 (쓰기 후 고정이 다른 워커에 전달되지 않음)"
+    return None
+
+
+class ReadRouting:
+    """복제본 허용 읽기 라우팅
+
+    reads() 범위 안의 읽기만 Router 가 read 연결로 보낸다. 다음 경우에는 primary:
+    - 범위의 (네임스페이스, 키)가 최근 쓰기로 고정됨 (read-your-writes)
+    - 복제 지연이 max_lag 초과이거나 아직/더 이상 확인되지 않음
+
+    고정은 cache.on_invalidate 로 받으므로 공유 캐시(redis)일 때만 모든 워커에 전달된다.
+    복제본인데 공유 캐시가 없으면 disabled_reason 을 남기고 라우팅을 끈다 (모든 읽기 primary).
+    """
+
+    def __init__(
+        self, pin_seconds: float, max_lag: float, enabled: bool, is_replica: bool, disabled_reason: Optional[str] = None
+    ):
+        self.pin_seconds = pin_seconds
+        self.max_lag = max_lag
+        self.enabled = enabled and disabled_reason is None
+        self.is_replica = is_replica
+        self.disabled_reason = disabled_reason
+        # (네임스페이스, 키) -> 고정 만료 시각, 키 "" 는 네임스페이스 전체
+        self._pins: dict[tuple[str, str], float] = {}
+        # primary 의 별도 풀이면 지연 없음, 복제본이면 첫 확인 전까지 알 수 없음(None)
+        self.lag: Optional[float] = None if is_replica else 0.0
+
+    def pin(self, namespace: str, key: str = "") -> None:
+        now = time.monotonic()
+        if len(self._pins) > 1024:
+            self._pins = {pin: until for pin, until in self._pins.items() if until > now}
+        self._pins[(namespace, key)] = now + self.pin_seconds
+
+    def is_pinned(self, namespace: str, key: Optional[str] = None) -> bool:
+        """key 가 None 이면 네임스페이스 안의 아무 키라도 고정됐는지"""
+        now = time.monotonic()
+        if key is not None:
+            return self._pins.get((namespace, ""), 0.0) > now or self._pins.get((namespace, key), 0.0) > now
+        return any(until > now for (pinned, _), until in self._pins.items() if pinned == namespace)
+
+    @property
+    def healthy(self) -> bool:
+        return self.lag is not None and self.lag <= self.max_lag
+
+    def _target(self, namespace: str, key: Optional[str]) -> tuple[Optional[str], str]:
+        if not self.enabled:
+            return None, "disabled"
+        if self.is_pinned(namespace, key):
+            return None, "pinned"
+        if not self.healthy:
+            return None, "lag"
+        return READ_CONNECTION, "ok"
+
+    @contextmanager
+    def reads(self, namespace: str, key: Optional[str] = None) -> Iterator[None]:
+        """복제본 허용 읽기 범위 (트랜잭션/쓰기는 범위 안에서도 primary)"""
+        name, reason = self._target(namespace, key)
+        if self.enabled:
+            db_reads_routed_total.inc(1, "read" if name else "primary", reason)
+        token = read_connection_name.set(name)
+        try:
+            yield
+        finally:
+            read_connection_name.reset(token)
+
+
+read_routing = ReadRouting(
+    pin_seconds=settings.DB_READ_PIN_SECONDS,
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    enabled=READ_CONNECTION in DB_CONNECTIONS,
+    is_replica=READ_IS_REPLICA,
+    disabled_reason=replica_routing_blocker(READ_IS_REPLICA, cache.shared),
+)
+
+for _namespace in PINNED_NAMESPACES:
+    cache.on_invalidate(_namespace, partial(read_routing.pin, _namespace))
+
+registry.register(
+    Gauge(
+        "ics_db_replica_lag_seconds",
+        "읽기 복제본 지연 (확인 전/실패 시 NaN)",
+        callback=lambda: math.nan if read_routing.lag is None else read_routing.lag,
+    )
+)
+
+
+async def pin_primary_reads(namespace: str, key: str = "") -> None:
+    """무효화할 캐시가 없는 쓰기(가입 등) 후 호출 -> 관련 읽기를 primary 로 고정 (공유 캐시면 모든 워커)"""
+    await cache.invalidate(namespace, key)
+
+
+class ReplicaLagMonitor:
+    """interval 마다 복제본의 복제 지연을 읽어 read_routing.lag 갱신"""
+
+    def __init__(self, routing: ReadRouting, interval: float):
+        self.routing = routing
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def probe(self) -> float:
+        connection = connections.get(READ_CONNECTION)
+        if connection.capabilities.dialect != "mysql":
+            return 0.0
+        error: Optional[Exception] = None
+        for query, column in REPLICA_STATUS_QUERIES:
+            try:
+                _, rows = await connection.execute_query(query)
+            except OperationalError as exc:
+                error = exc
+                continue
+            if not rows:
+                # 복제 설정이 없는 서버 (로컬 테스트용 별도 DB 등)
+                return 0.0
+            behind = rows[0].get(column)
+            # NULL: 복제 중단
+            return math.inf if behind is None else float(behind)
+        raise error  # type: ignore[misc]
+
+    async def run_once(self) -> None:
+        was_healthy = self.routing.healthy
+        try:
+            self.routing.lag = await self.probe()
+        except Exception:
+            self.routing.lag = None
+            if was_healthy:
+                logger.exception("복제 지연 확인 실패, 읽기를 primary 로 전환")
+            return
+        if was_healthy != self.routing.healthy:
+            logger.warning(
+                "읽기 복제본 상태 변경",
+                extra={"healthy": self.routing.healthy, "lag": self.routing.lag},
+            )
+
+    async def _run_forever(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self.routing.disabled_reason is not None:
+            logger.error("읽기 복제본 라우팅 비활성화", extra={"reason": self.routing.disabled_reason})
+            return
+        if self._task is None and self.routing.enabled and self.routing.is_replica:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+replica_lag_monitor = ReplicaLagMonitor(read_routing, interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS)
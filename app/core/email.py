@@ -1,10 +1,16 @@
-import os
+from typing import TYPE_CHECKING
 
 from app.configs.base_settings import settings
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
 
+if TYPE_CHECKING:
+    from fastapi_mail import FastMail
+
+# fastapi_mail 은 비밀번호 재설정에서만 쓰므로 첫 사용 시 import (워커 기동 시간 단축)
+
+
+def get_fast_mail() -> "FastMail":
+    from fastapi_mail import ConnectionConfig, FastMail
 
-def get_fast_mail() -> FastMail:
     conf = ConnectionConfig(
         MAIL_USERNAME=settings.MAIL_USERNAME,
         MAIL_PASSWORD=settings.MAIL_PASSWORD,
@@ -19,6 +25,8 @@ def get_fast_mail() -> FastMail:
     return FastMail(conf)
 
 async def send_temp_password_to_email(email: str, temp_password: str) -> None:
+    from fastapi_mail import MessageSchema
+
     message = MessageSchema(
         subject="임시 비밀번호 안내",
         recipients=[email],
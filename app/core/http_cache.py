@@ -0,0 +1,44 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+# 폴링 클라이언트가 매번 재검증하도록 (변경이 없으면 304 로 본문 없이 응답)
+CACHE_CONTROL = "no-cache"
+
+
+def etag_for(body: bytes) -> str:
+    """본문 내용 해시 ETag (strong)"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    # 약한 비교: 압축 미들웨어가 붙인 W/ 접두사는 무시
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 가 현재 ETag 와 일치하는지 (*, 여러 태그, W/ 접두사 허용)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+
+def conditional_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """JSON 본문 응답, If-None-Match 일치 시 본문 없이 304"""
+    etag = etag or etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def conditional_model_response(request: Request, model: BaseModel) -> Response:
+    """서비스가 만든 응답 모델을 한 번만 직렬화해 conditional_response 로"""
+    return conditional_response(request, model.model_dump_json().encode())
@@ -0,0 +1,155 @@
+import itertools
+import json
+import logging
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 앱 로거 루트 (모듈에서는 logging.getLogger(__name__) 사용)
+APP_LOGGER = "app"
+REQUEST_ID_HEADER = b"x-request-id"
+
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+# LogRecord 기본 속성 (나머지는 extra 로 넘긴 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+
+class RequestIdFilter(logging.Filter):
+    """호출한 쪽(요청 컨텍스트)에서 request id 를 레코드에 기록"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = current_request_id.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 레코드는 every 개 중 1개만 통과 (채널 할당 등 잦은 로그)"""
+
+    def __init__(self, every: int = 1):
+        super().__init__()
+        self.every = max(1, every)
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        return next(self._counter) % self.every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON (extra 로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            payload["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버림 (요청 처리 경로를 막지 않음)"""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 포맷은 리스너 스레드에서, 인자만 여기서 확정 (이후 객체 변경 영향 방지)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """QueueHandler -> 백그라운드 스레드(QueueListener) -> stdout"""
+
+    def __init__(self) -> None:
+        self.handler: Optional[NonBlockingQueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+
+    def start(
+        self, level: str = "INFO", debug_sample_every: int = 1, json_format: bool = True, max_queue: int = 10000
+    ) -> None:
+        if self._listener is not None:
+            return
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max_queue)
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(
+            JsonFormatter()
+            if json_format
+            else logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+        )
+        self.handler = NonBlockingQueueHandler(log_queue)
+        self.handler.addFilter(DebugSamplingFilter(debug_sample_every))
+        self.handler.addFilter(RequestIdFilter())
+
+        logger = logging.getLogger(APP_LOGGER)
+        logger.setLevel(level.upper())
+        logger.addHandler(self.handler)
+        logger.propagate = False
+
+        self._listener = QueueListener(log_queue, output, respect_handler_level=True)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 쓰고 스레드 종료"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        if self.handler is not None:
+            logging.getLogger(APP_LOGGER).removeHandler(self.handler)
+            self.handler = None
+
+
+log_pipeline = LogPipeline()
+
+
+class RequestIdMiddleware:
+    """X-Request-ID 헤더(없으면 생성)를 컨텍스트에 두고 응답 헤더로 돌려줌 (순수 ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        raw = dict(scope["headers"]).get(REQUEST_ID_HEADER)
+        request_id = raw.decode("latin-1")[:64] if raw else uuid.uuid4().hex
+        token = current_request_id.set(request_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_id.reset(token)
@@ -0,0 +1,299 @@
+import asyncio
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+# 지연 분포 기본 버킷(초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+
+
+class Gauge:
+    """값을 저장하거나, 렌더링 시점에 callback 으로 읽는 게이지
+
+    labelnames 가 있으면 callback 은 {레이블 값 튜플: 값} 을 돌려준다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Optional[Callable[[], Any]] = None,
+        labelnames: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = labelnames
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        if self.labelnames:
+            for labels, value in (self.callback() if self.callback else {}).items():
+                yield f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+            return
+        yield f"{self.name} {self.callback() if self.callback else self.value}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> (버킷별 개수, 합계, 전체 개수)
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * len(self.buckets), [0.0, 0.0])
+        counts, totals = series
+        index = bisect_left(self.buckets, value)
+        if index < len(counts):
+            counts[index] += 1
+        totals[0] += value
+        totals[1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, (total, count)) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            inf_labels = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            yield f"{self.name}_bucket{inf_labels} {int(count)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {int(count)}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[Any] = []
+
+    def register(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_seconds = registry.register(
+    Histogram("ics_http_request_seconds", "HTTP 요청 처리 시간", ("method", "route", "status"))
+)
+db_queries_total = registry.register(Counter("ics_db_queries_total", "DB 쿼리 수", ("route",)))
+db_query_seconds = registry.register(Histogram("ics_db_query_seconds", "DB 쿼리 시간", ("route",)))
+channel_acquire_seconds = registry.register(
+    Histogram("ics_channel_acquire_seconds", "채널 할당 대기+처리 시간", ("backend",))
+)
+event_loop_lag_seconds = registry.register(Histogram("ics_event_loop_lag_seconds", "이벤트 루프 지연"))
+
+
+def _stat(source: Any, key: str) -> Any:
+    """source.stats() 의 key 값 (게이지 callback)"""
+    return source.stats()[key]
+
+
+def _pool_stat(monitor: Any, key: str) -> dict[tuple[str, ...], Any]:
+    """PoolMonitor.stats() 의 풀별 key 값 (pool 레이블 게이지 callback)"""
+    return {(name,): stats[key] for name, stats in monitor.stats().items()}
+
+
+def register_password_hasher_metrics(hasher: Any) -> None:
+    """PasswordHasher.stats() 값을 게이지로 노출"""
+    for key, documentation in (
+        ("pending", "bcrypt 대기/실행 중 작업 수"),
+        ("completed", "완료된 bcrypt 작업 수"),
+        ("rejected", "대기열 초과로 거절된 bcrypt 작업 수"),
+        ("busy_seconds", "bcrypt 누적 실행 시간"),
+        ("wait_seconds", "bcrypt 누적 스레드 풀 대기 시간"),
+    ):
+        registry.register(Gauge(f"ics_password_hash_{key}", documentation, callback=partial(_stat, hasher, key)))
+
+
+def register_db_pool_metrics(monitor: Any) -> None:
+    """PoolMonitor.stats() 값을 풀(pool 레이블)별 게이지로 노출"""
+    for key, documentation in (
+        ("in_use", "사용 중인 DB 연결 수"),
+        ("idle", "유휴 DB 연결 수"),
+        ("waiting", "DB 연결 획득 대기 중인 요청 수"),
+        ("max_size", "DB 연결 풀 크기 상한"),
+    ):
+        registry.register(
+            Gauge(
+                f"ics_db_pool_{key}",
+                documentation,
+                callback=partial(_pool_stat, monitor, key),
+                labelnames=("pool",),
+            )
+        )
+
+
+# ---------- 요청 단위 수집 ----------
+
+
+class RequestStats:
+    __slots__ = ("route", "db_queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.route = "unmatched"
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+# 클라이언트 메서드끼리 서로 호출할 때 중복 집계 방지
+_in_db_call: ContextVar[bool] = ContextVar("_in_db_call", default=False)
+
+PROFILE_HEADER = b"x-profile"
+
+
+class MetricsMiddleware:
+    """라우트별 지연 히스토그램 + 요청별 DB 쿼리 수/시간 수집 (순수 ASGI)
+
+    요청 헤더 `X-Profile: 1` 이면 응답에 Server-Timing/X-DB-Queries 헤더를 붙인다.
+    """
+
+    def __init__(self, app: ASGIApp, profile_header: bool = True):
+        self.app = app
+        self.profile_header = profile_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        profile = self.profile_header and dict(scope["headers"]).get(PROFILE_HEADER) == b"1"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if profile:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (
+                            b"server-timing",
+                            f'app;dur={elapsed:.2f}, db;dur={stats.db_seconds * 1000:.2f};desc="{stats.db_queries} queries"'.encode(),
+                        )
+                    )
+                    headers.append((b"x-db-queries", str(stats.db_queries).encode()))
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            stats.route = getattr(route, "path", "unmatched")
+            http_request_seconds.observe(time.perf_counter() - started, scope["method"], stats.route, str(status_code))
+            if stats.db_queries:
+                db_queries_total.inc(stats.db_queries, stats.route)
+                db_query_seconds.observe(stats.db_seconds, stats.route)
+            current_request_stats.reset(token)
+
+
+# ---------- Tortoise 쿼리 계측 ----------
+
+DB_METHODS = ("execute_query", "execute_query_dict", "execute_insert", "execute_many", "execute_script")
+
+
+def _wrap_db_method(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    @wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats = current_request_stats.get()
+        if stats is None or _in_db_call.get():
+            return await method(*args, **kwargs)
+        flag = _in_db_call.set(True)
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            stats.db_queries += 1
+            stats.db_seconds += time.perf_counter() - started
+            _in_db_call.reset(flag)
+
+    wrapper.__ics_instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _all_subclasses(cls: type) -> Iterable[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+def instrument_tortoise() -> None:
+    """로드된 모든 Tortoise DB 클라이언트 클래스의 execute_* 를 계측 (Tortoise.init 이후 호출)"""
+    for client_class in _all_subclasses(BaseDBAsyncClient):
+        for name in DB_METHODS:
+            method = client_class.__dict__.get(name)
+            if method is not None and not getattr(method, "__ics_instrumented__", False):
+                setattr(client_class, name, _wrap_db_method(method))
+
+
+# ---------- 이벤트 루프 지연 ----------
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """interval 마다 깨어나 예정 시각 대비 지연을 기록"""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        event_loop_lag_seconds.observe(max(0.0, loop.time() - expected))
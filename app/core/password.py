@@ -0,0 +1,103 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.configs import settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+
+    bcrypt 는 연산 중 GIL 을 놓으므로 스레드 풀로도 병렬 처리된다.
+    대기 중인 작업이 max_pending 을 넘으면 503 으로 즉시 거절한다.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        self._context: Optional["CryptContext"] = None
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        # 지표
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    @property
+    def context(self) -> "CryptContext":
+        """passlib/bcrypt 는 첫 해시/검증 시 로드 (워커 기동 시간 단축)"""
+        if self._context is None:
+            from passlib.context import CryptContext
+
+            self._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        return self._context
+
+    async def hash(self, password: str) -> str:
+        # context 접근(첫 로드 포함)도 스레드 풀에서
+        return await self._run(lambda: self.context.hash(password))
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """여러 비밀번호를 워커 수만큼씩 병렬 해시 (대량 등록이 대기열 상한을 혼자 채우지 않도록)"""
+        hashed: list[str] = []
+        for start in range(0, len(passwords), self.max_workers):
+            chunk = passwords[start : start + self.max_workers]
+            hashed.extend(await asyncio.gather(*(self.hash(password) for password in chunk)))
+        return hashed
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(lambda: self.context.verify(password, hashed_password))
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            )
+        self.pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self.pending)
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        try:
+            result, waited, busy = await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        self.wait_seconds += waited
+        self.busy_seconds += busy
+        return result
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "max_pending_seen": self.max_pending_seen,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "busy_seconds": round(self.busy_seconds, 6),
+            "wait_seconds": round(self.wait_seconds, 6),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
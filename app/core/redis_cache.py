@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import uuid
+from typing import Any, Optional
+from urllib.parse import unquote, urlsplit
+
+from app.core.cache import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+class RedisError(Exception):
+    """Redis 에러 응답 또는 프로토콜 오류"""
+
+
+def _encode_command(args: tuple[Any, ...]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+class RedisConnection:
+    """RESP2 연결 1개 (요청-응답 순서대로 사용)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, *args: Any) -> None:
+        self.writer.write(_encode_command(args))
+        await self.writer.drain()
+
+    async def command(self, *args: Any) -> Any:
+        await self.send(*args)
+        return await self.read_reply()
+
+    async def read_reply(self) -> Any:
+        line = await self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Redis 연결이 종료되었습니다.")
+        prefix, rest = line[:1], line[1:-2]
+        if prefix == b"+":
+            return rest.decode()
+        if prefix == b"-":
+            raise RedisError(rest.decode())
+        if prefix == b":":
+            return int(rest)
+        if prefix == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            return (await self.reader.readexactly(length + 2))[:-2]
+        if prefix == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [await self.read_reply() for _ in range(length)]
+        raise RedisError(f"알 수 없는 Redis 응답: {line!r}")
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+# 캐시 실패는 요청 실패로 이어지지 않게 미스로 처리
+REDIS_FAILURES = (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError, RedisError)
+
+
+class RedisCache(CacheBackend):
+    """Redis 프로토콜 캐시 (워커 간 공유)
+
+    - 명령용 연결 풀 + 무효화 구독 전용 연결 1개
+    - 구독 연결이 끊겼다 다시 붙으면 그 사이 알림을 놓쳤을 수 있으므로 로컬 사본을 모두 비움
+    - Redis 장애 시 조회는 미스, 쓰기/삭제는 무시 (DB 조회로 대체)
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, pool_size: int = 8, timeout: float = 1.0, prefix: str = "ics:"):
+        super().__init__()
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.prefix = prefix
+        self.channel = f"{prefix}invalidate"
+        self.message_channel = f"{prefix}messages"
+        self.instance_id = uuid.uuid4().hex[:12]
+        self._idle: list[RedisConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self._subscriber_task: Optional[asyncio.Task[None]] = None
+
+    async def _connect(self) -> RedisConnection:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        connection = RedisConnection(reader, writer)
+        try:
+            if self.password:
+                await asyncio.wait_for(connection.command("AUTH", self.password), self.timeout)
+            if self.db:
+                await asyncio.wait_for(connection.command("SELECT", self.db), self.timeout)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def execute(self, *args: Any) -> Any:
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                result = await asyncio.wait_for(connection.command(*args), self.timeout)
+            except RedisError:
+                # 에러 응답은 정상적으로 읽혔으므로 연결 재사용
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                # 응답을 다 읽지 못한 연결은 버림
+                connection.close()
+                raise
+            self._idle.append(connection)
+            return result
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        try:
+            value: Optional[bytes] = await self.execute("GET", self.prefix + key)
+            return value
+        except REDIS_FAILURES as e:
+            logger.warning("Redis 조회 실패", extra={"key": key, "error": str(e)})
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self.execute("SET", self.prefix + key, value, "PX", max(1, int(ttl * 1000)))
+        except REDIS_FAILURES as e:
+            logger.warning("Redis 저장 실패", extra={"key": key, "error": str(e)})
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.execute("DEL", *(self.prefix + key for key in keys))
+        except REDIS_FAILURES as e:
+            logger.warning("Redis 삭제 실패", extra={"keys": keys, "error": str(e)})
+
+    async def _broadcast(self, namespace: str, key: str) -> None:
+        try:
+            await self.execute("PUBLISH", self.channel, f"{self.instance_id} {namespace}:{key}")
+        except REDIS_FAILURES as e:
+            logger.warning("Redis 무효화 알림 실패", extra={"namespace": namespace, "error": str(e)})
+
+    async def publish(self, topic: str, payload: str) -> None:
+        try:
+            await self.execute("PUBLISH", self.message_channel, f"{self.instance_id} {topic} {payload}")
+        except REDIS_FAILURES as e:
+            logger.warning("Redis 메시지 전달 실패", extra={"topic": topic, "error": str(e)})
+
+    def _on_message(self, channel: bytes, message: str) -> None:
+        origin, _, target = message.partition(" ")
+        if origin == self.instance_id:
+            # 자기 자신은 invalidate()/publish 호출한 쪽에서 이미 처리
+            return
+        if channel == self.message_channel.encode():
+            topic, _, payload = target.partition(" ")
+            self._deliver(topic, payload)
+            return
+        namespace, _, key = target.partition(":")
+        self._dispatch(namespace, key)
+
+    async def _subscribe_loop(self) -> None:
+        backoff = 0.1
+        while True:
+            try:
+                connection = await self._connect()
+                try:
+                    await connection.send("SUBSCRIBE", self.channel, self.message_channel)
+                    # 채널마다 구독 확인 응답 1개
+                    for _ in range(2):
+                        reply = await asyncio.wait_for(connection.read_reply(), self.timeout)
+                        if not (isinstance(reply, list) and reply[0] == b"subscribe"):
+                            raise RedisError(f"구독 실패: {reply!r}")
+                    self._dispatch_all()
+                    backoff = 0.1
+                    while True:
+                        reply = await connection.read_reply()
+                        if isinstance(reply, list) and len(reply) == 3 and reply[0] == b"message":
+                            self._on_message(reply[1], reply[2].decode())
+                finally:
+                    connection.close()
+            except REDIS_FAILURES as e:
+                logger.warning("Redis 구독 연결 끊김, 재연결", extra={"error": str(e), "retry_in": backoff})
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 5.0)
+
+    async def start(self) -> None:
+        if self._subscriber_task is None:
+            self._subscriber_task = asyncio.create_task(self._subscribe_loop())
+
+    async def close(self) -> None:
+        if self._subscriber_task is not None:
+            self._subscriber_task.cancel()
+            try:
+                await self._subscriber_task
+            except asyncio.CancelledError:
+                pass
+            self._subscriber_task = None
+        while self._idle:
+            self._idle.pop().close()
@@ -0,0 +1,39 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+_orjson: Any = None
+# orjson 설치 여부 (첫 호출 전에는 None)
+_HAS_ORJSON: Optional[bool] = None
+
+
+def orjson_module() -> Any:
+    """orjson 패키지 (선택 의존성, 없으면 None -> 표준 json)"""
+    global _orjson, _HAS_ORJSON
+    if _HAS_ORJSON is None:
+        try:
+            import orjson
+        except ImportError:
+            _HAS_ORJSON = False
+        else:
+            _orjson = orjson
+            _HAS_ORJSON = True
+    return _orjson
+
+
+class ModelJSONResponse(JSONResponse):
+    """서비스가 만든 응답 모델을 그대로 직렬화하는 JSON 응답
+
+    라우트가 ModelJSONResponse(모델) 을 돌려주면 FastAPI 의 response_model 재검증/직렬화를 건너뛰고
+    model_dump_json 한 번으로 끝낸다 (서비스에서 이미 검증한 모델만).
+    앱 기본 응답 클래스로도 쓰며, 이때는 FastAPI 가 만든 dict 를 orjson 으로 직렬화한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        orjson = orjson_module()
+        if orjson is None:
+            return super().render(content)
+        return bytes(orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS))
@@ -0,0 +1,84 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.cache import CacheBackend
+from app.models.user_model import User
+
+
+class UserCache:
+    """인증용 사용자 캐시 (TTL + 최대 크기, 프로세스 로컬 + 선택적 공유 캐시)
+
+    shared 가 있으면 로컬 미스 시 공유 캐시(다른 워커가 채운 행)를 먼저 본다.
+    관리자 수정/삭제/권한 변경 등 쓰기 경로에서는 auth.invalidate_user_cache() 로 모든 워커에서 지운다.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10000, shared: Optional[CacheBackend] = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.shared = shared
+        self._by_id: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self._id_by_username: dict[str, int] = {}
+
+    def get(self, user_id: Optional[int] = None, username: Optional[str] = None) -> Optional[User]:
+        if user_id is None and username is not None:
+            user_id = self._id_by_username.get(username)
+        if user_id is None:
+            return None
+        entry = self._by_id.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            self.invalidate(user_id=user_id)
+            return None
+        self._by_id.move_to_end(user_id)
+        return user
+
+    def set(self, user: User) -> None:
+        self.invalidate(user_id=user.id)
+        if self.ttl <= 0:
+            return
+        self._by_id[user.id] = (time.monotonic() + self.ttl, user)
+        self._id_by_username[user.username] = user.id
+        while len(self._by_id) > self.max_size:
+            _, (_, oldest) = self._by_id.popitem(last=False)
+            self._id_by_username.pop(oldest.username, None)
+
+    def invalidate(self, user_id: Optional[int] = None, username: Optional[str] = None) -> None:
+        if user_id is None and username is not None:
+            user_id = self._id_by_username.get(username)
+        if user_id is None:
+            return
+        entry = self._by_id.pop(user_id, None)
+        if entry is not None:
+            self._id_by_username.pop(entry[1].username, None)
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._id_by_username.clear()
+
+    # ---------- 공유 캐시 ----------
+
+    @staticmethod
+    def shared_key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    async def get_shared(self, user_id: int) -> Optional[User]:
+        """공유 캐시에서 사용자 행 복원 후 로컬에도 저장"""
+        if self.shared is None:
+            return None
+        raw = await self.shared.get(self.shared_key(user_id))
+        if raw is None:
+            return None
+        user = User._init_from_db(**json.loads(raw))
+        self.set(user)
+        return user
+
+    async def set_shared(self, user: User) -> None:
+        if self.shared is None:
+            return
+        row = {column: getattr(user, field) for field, column in User._meta.fields_db_projection.items()}
+        raw = json.dumps(row, default=lambda value: value.isoformat()).encode()
+        await self.shared.set(self.shared_key(user.id), raw, self.ttl)
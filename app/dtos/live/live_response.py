@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
+
+# 목록/채널 보드 응답 형태: full(전체 필드) | summary(보드 타일용 요약)
+ResponseView = Literal["full", "summary"]
 
 
 class LiveStreamResponse(BaseModel):
@@ -29,6 +32,22 @@ class LiveStreamResponse(BaseModel):
         from_attributes = True
 
 
+class LiveStreamSummary(BaseModel):
+    """보드용 스트림 요약 (설명/태그/썸네일/타임스탬프 제외)"""
+    id: int
+    user_id: int
+    username: str
+    full_name: str
+    channel_number: int
+    janus_room_id: int
+    stream_category: str
+    stream_title: str
+    is_public: bool
+    started_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ChannelInfo(BaseModel):
     """채널 정보"""
     channel_number: int
@@ -37,16 +56,58 @@ class ChannelInfo(BaseModel):
 
 
 class AllChannelResponse(BaseModel):
-    """전체 채널 정보 응답"""
+    """채널 보드 응답 (시설 1곳의 한 페이지)"""
     channels: List[ChannelInfo]
+    total_channels: int  # 시설 전체 채널 수
+    active_channels: int  # 이 페이지의 활성 채널 수
+    facility: str = "default"
+    page: int = 0
+    page_count: int = 1
+
+
+class ChannelSummaryInfo(BaseModel):
+    """채널 정보 (요약)"""
+    channel_number: int
+    is_active: bool
+    stream_info: Optional[LiveStreamSummary] = None
+
+
+class AllChannelSummaryResponse(BaseModel):
+    """채널 보드 응답 (요약, view=summary)"""
+    channels: List[ChannelSummaryInfo]
     total_channels: int
     active_channels: int
+    facility: str = "default"
+    page: int = 0
+    page_count: int = 1
+
+
+class FacilityInfo(BaseModel):
+    """시설(채널 풀) 정보"""
+    name: str
+    first_channel: int
+    last_channel: int
+    total_channels: int
+    page_count: int  # 채널 보드 페이지 수
+
+
+class FacilityListResponse(BaseModel):
+    """시설 목록 응답 (첫 시설이 기본)"""
+    facilities: List[FacilityInfo]
 
 
 class LiveStreamListResponse(BaseModel):
     """라이브 스트림 목록 응답"""
     streams: List[LiveStreamResponse]
     total_count: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서, 마지막 페이지면 None
+
+
+class LiveStreamSummaryListResponse(BaseModel):
+    """라이브 스트림 목록 응답 (요약, view=summary)"""
+    streams: List[LiveStreamSummary]
+    total_count: int
+    next_cursor: Optional[str] = None
 
 
 class StreamStartResponse(BaseModel):
@@ -63,6 +124,12 @@ class StreamStopResponse(BaseModel):
     duration: int
 
 
+class StreamHeartbeatResponse(BaseModel):
+    """스트림 heartbeat 응답"""
+    success: bool
+    timeout_seconds: float  # 이 시간 안에 다음 heartbeat 를 보내야 스트림 유지
+
+
 class StreamUpdateResponse(BaseModel):
     """스트림 업데이트 응답"""
     success: bool
@@ -76,3 +143,29 @@ class ErrorResponse(BaseModel):
     error_code: str
     message: str
     details: str
+
+
+class LiveHistoryResponse(BaseModel):
+    """종료된 스트림 이력"""
+    id: int
+    user_id: Optional[int] = None
+    username: str
+    full_name: str
+    channel_number: int
+    janus_room_id: int
+    stream_category: str
+    stream_title: str
+    stream_description: Optional[str] = None
+    tags: List[str]
+    is_public: bool
+    quality_setting: str
+    started_at: datetime
+    ended_at: datetime
+    duration: int
+    end_reason: str
+
+
+class LiveHistoryListResponse(BaseModel):
+    """종료된 스트림 이력 목록 응답"""
+    histories: List[LiveHistoryResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서, 마지막 페이지면 None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+# 관리자: 사용자 추가 (정적 채널 할당)
+class AdminUserAddRequest(BaseModel):
+    username: str
+    password: str
+    full_name: str
+    affiliation: str | None = None
+    channel_number: int
+    facility: str | None = None  # 없으면 기본 시설
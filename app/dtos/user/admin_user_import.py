@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from app.dtos.user.admin_user_add_request import AdminUserAddRequest
+
+
+# 관리자: 사용자 일괄 등록 행 (CSV/JSON)
+class AdminUserImportRow(AdminUserAddRequest):
+    email: str | None = None  # 없으면 {username}@example.local
+
+
+class AdminUserImportError(BaseModel):
+    row: int  # 1부터 (CSV 는 헤더 다음 줄이 1)
+    username: str | None = None
+    message: str
+
+
+class AdminUserImportResponse(BaseModel):
+    created: int
+    errors: list[AdminUserImportError]
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+# 관리자: 사용자 정보 변경 (이름, 소속, 채널, 시설, 비밀번호)
+class AdminUserUpdateRequest(BaseModel):
+    full_name: str | None = None
+    affiliation: str | None = None
+    channel_number: int | None = None
+    facility: str | None = None
+    password: str | None = None
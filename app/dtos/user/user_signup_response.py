@@ -10,6 +10,7 @@ class UserSignupResponse(BaseModel):
     email: str
     affiliation: str | None = None
     channel_number: int | None = None
+    facility: str | None = None
 
 
 async def to_user_signup_response(user: User) -> UserSignupResponse:
@@ -20,6 +21,7 @@ async def to_user_signup_response(user: User) -> UserSignupResponse:
         email=user.email,
         affiliation=user.affiliation,
         channel_number=user.channel_number,
+        facility=user.facility,
     )
 
 
@@ -35,9 +37,16 @@ class UserGetResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 async def to_user_get_response(user: User) -> UserGetResponse:
-    resp = UserGetResponse.from_orm(user)
-    resp.modified_at = user.modified_at.isoformat() if getattr(user, "modified_at", None) else None
-    return resp
+    modified_at = getattr(user, "modified_at", None)
+    return UserGetResponse(
+        id=user.id,
+        username=user.username,
+        full_name=user.full_name,
+        email=user.email,
+        affiliation=user.affiliation,
+        channel_number=user.channel_number,
+        modified_at=modified_at.isoformat() if modified_at else None,
+    )
 
 
 class StreamerListItem(BaseModel):
@@ -45,6 +54,7 @@ class StreamerListItem(BaseModel):
     full_name: str
     affiliation: str | None = None
     channel_number: int | None = None
+    facility: str | None = None
 
 
 class StreamerListResponse(BaseModel):
@@ -0,0 +1,16 @@
+from tortoise import fields, models
+
+
+class ChannelSlot(models.Model):  # type: ignore
+    """채널 슬롯 (워커 간 채널 할당용 행 잠금 대상)"""
+
+    channel_number = fields.IntField(pk=True, generated=False, description="채널 번호")
+    user_id = fields.IntField(null=True, description="점유 사용자 ID, 비어 있으면 NULL")
+    claimed_at = fields.DatetimeField(null=True, description="점유 시각")
+
+    class Meta:
+        table = "channel_slots"
+        table_description = "채널 슬롯 점유 정보"
+
+    def __str__(self) -> str:
+        return f"ChannelSlot(channel={self.channel_number}, user_id={self.user_id})"
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from tortoise import fields, models
+
+from app.models.live_model import LiveModel
+
+
+class LiveHistoryBase(models.Model):  # type: ignore
+    """이력/아카이브 공통 컬럼"""
+
+    username = fields.CharField(max_length=50, description="스트리머 사용자명")
+    full_name = fields.CharField(max_length=100, description="스트리머 실명")
+    channel_number = fields.IntField(description="채널 번호")
+    janus_room_id = fields.IntField(description="Janus room ID")
+
+    stream_category = fields.CharField(max_length=50)
+    stream_title = fields.CharField(max_length=200)
+    stream_description = fields.TextField(null=True)
+    tags = fields.JSONField(default=list)
+    is_public = fields.BooleanField()
+    quality_setting = fields.CharField(max_length=20)
+
+    started_at = fields.DatetimeField(description="스트림 시작 시간")
+    ended_at = fields.DatetimeField(description="스트림 종료 시간")
+    duration = fields.IntField(description="방송 시간 (초 단위)")
+    end_reason = fields.CharField(max_length=20, default="stopped", description="종료 사유 (stopped/restarted/expired)")
+
+    class Meta:
+        abstract = True
+
+
+class LiveHistoryModel(LiveHistoryBase):
+    """종료된 라이브 스트림 이력 (추가만 함, 보존 기간이 지나면 아카이브로 이동)"""
+
+    id = fields.BigIntField(pk=True)
+    user = fields.ForeignKeyField("models.User", related_name="live_histories", null=True, on_delete=fields.SET_NULL)
+    # FK 컬럼 (사용자 삭제 후에는 NULL)
+    user_id: Optional[int]
+
+    class Meta:
+        table = "live_histories"
+        table_description = "라이브 스트림 종료 이력"
+        indexes = [
+            ("user_id", "started_at"),
+            ("started_at",),
+        ]
+        ordering = ["-started_at"]
+
+    def __str__(self) -> str:
+        return f"LiveHistory(id={self.id}, user={self.username}, channel={self.channel_number})"
+
+    @classmethod
+    def from_live(cls, live: LiveModel, ended_at: datetime, end_reason: str = "stopped") -> "LiveHistoryModel":
+        """활성 스트림 -> 이력 행 (저장은 호출한 쪽 트랜잭션에서)"""
+        return cls(
+            user_id=live.user_id,
+            username=live.username,
+            full_name=live.full_name,
+            channel_number=live.channel_number,
+            janus_room_id=live.janus_room_id,
+            stream_category=live.stream_category,
+            stream_title=live.stream_title,
+            stream_description=live.stream_description,
+            tags=live.tags,
+            is_public=live.is_public,
+            quality_setting=live.quality_setting,
+            started_at=live.started_at,
+            ended_at=ended_at,
+            duration=max(0, int((ended_at - live.started_at).total_seconds())),
+            end_reason=end_reason,
+        )
+
+
+class LiveHistoryArchiveModel(LiveHistoryBase):
+    """보존 기간이 지난 이력 (월 단위 archive_month 로 구분, 월 단위 일괄 삭제)"""
+
+    # live_histories 의 id 그대로 사용 -> 이동이 중복 실행돼도 같은 행이 두 번 들어가지 않음
+    id = fields.BigIntField(pk=True, generated=False)
+    user_id = fields.IntField(null=True, description="스트리머 ID (사용자 삭제 후에도 유지)")
+    archive_month = fields.IntField(description="종료 월 (YYYYMM)")
+
+    class Meta:
+        table = "live_history_archives"
+        table_description = "라이브 스트림 종료 이력 아카이브"
+        indexes = [
+            ("user_id", "started_at"),
+            ("archive_month",),
+        ]
+        ordering = ["-started_at"]
+
+    @classmethod
+    def from_history(cls, history: LiveHistoryModel) -> "LiveHistoryArchiveModel":
+        """live_histories 행 -> 아카이브 행"""
+        values: dict[str, Any] = {name: getattr(history, name) for name in LiveHistoryBase._meta.fields_map}
+        ended_at = history.ended_at
+        return cls(**values, id=history.id, user_id=history.user_id, archive_month=ended_at.year * 100 + ended_at.month)
@@ -1,16 +1,22 @@
 from tortoise import fields, models
 from app.models.base_model import BaseModel
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from datetime import datetime, timezone
 
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+if TYPE_CHECKING:
+    from app.models.live_history_model import LiveHistoryModel
+
 
 class LiveModel(BaseModel, models.Model):  # type: ignore
     """라이브 스트림 모델"""
 
     username = fields.CharField(max_length=50, index=True, description="스트리머 사용자명")
     full_name = fields.CharField(max_length=100, description="스트리머 실명")
-    channel_number = fields.IntField(index=True, description="채널 번호 (1-16)")
-    janus_room_id = fields.IntField(description="Janus room ID")
+    channel_number = fields.IntField(index=True, description="채널 번호 (시설별 구간)")
+    # lives 에는 활성 스트림만 있으므로 활성 방끼리 중복 불가 -> 워커 간 같은 id 발급을 DB 가 거부
+    janus_room_id = fields.IntField(unique=True, description="Janus room ID")
 
     stream_category = fields.CharField(max_length=50, default="일반")
     stream_title = fields.CharField(max_length=200, default="라이브 스트림", description="스트림 제목")
@@ -22,51 +28,62 @@ class LiveModel(BaseModel, models.Model):  # type: ignore
     is_public = fields.BooleanField(default=True)
     quality_setting = fields.CharField(max_length=20, default="HD")
 
+    # lives 에는 활성 스트림만 저장 (종료 시 live_histories 로 이동 후 삭제), 응답 호환용으로 유지
     is_active = fields.BooleanField(default=True, description="스트림 활성 상태")
+    # 활성 스트림일 때만 channel_number 와 같은 값, 종료 시 NULL -> 채널 중복 점유를 DB 가 거부
+    active_channel = fields.IntField(null=True, unique=True, description="활성 채널 점유 마커")
     started_at = fields.DatetimeField(auto_now_add=True, description="스트림 시작 시간")
+    # 스트리머 heartbeat 마지막 수신 시각 (시작/재시작 시 갱신), 오래되면 reaper 가 종료 처리
+    last_heartbeat_at = fields.DatetimeField(null=True, description="마지막 heartbeat 시각")
     ended_at = fields.DatetimeField(null=True, description="스트림 종료 시간")
     user = fields.ForeignKeyField("models.User", related_name="live_streams", null=True)
+    # FK 컬럼 (활성 스트림은 항상 사용자가 있음, 사용자 삭제 전에 스트림을 종료)
+    user_id: int
 
     class Meta:
         table = "lives"
         table_description = "라이브 스트림 정보"
         indexes = [
             ("channel_number", "is_active"),
-            ("janus_room_id",),
+            ("is_active", "janus_room_id"),
+            ("is_active", "stream_category", "started_at"),
+            ("is_public", "is_active", "channel_number"),
             ("user_id", "is_active"),
-            ("started_at",)
+            ("started_at",),
+            ("last_heartbeat_at",),
         ]
         ordering = ["-started_at"]
-        unique_together = ("user", "is_active")
+        # 사용자당 활성 스트림 1개
+        unique_together = (("user",),)
 
     def __str__(self) -> str:
         return f"Live(id={self.id}, user={self.username}, channel={self.channel_number})"
 
     @classmethod
-    async def get_streams_by_category(cls, category: str) -> List["LiveModel"]:
+    async def get_streams_by_category(cls, category: str, limit: int = 50) -> List["LiveModel"]:
         """카테고리별 스트림 조회"""
         return await cls.filter(
             is_active=True,
             stream_category=category,
-        ).order_by("-started_at")
+        ).order_by("-started_at").limit(limit)
 
     @classmethod
-    async def get_public_streams(cls) -> List["LiveModel"]:
+    async def get_public_streams(cls, limit: int = 50) -> List["LiveModel"]:
         """공개 스트림만 조회"""
         return await cls.filter(
             is_public=True,
             is_active=True,
-        ).order_by("channel_number")
+        ).order_by("channel_number").limit(limit)
 
     @classmethod
-    async def get_recent_streams(cls) -> List["LiveModel"]:
+    async def get_recent_streams(cls, limit: int = 50) -> List["LiveModel"]:
         """최근 스트림 순으로 조회"""
-        return await cls.filter(is_active=True).order_by("-started_at")
+        return await cls.filter(is_active=True).order_by("-started_at").limit(limit)
 
     @classmethod
-    async def get_streams_by_duration(cls) -> List["LiveModel"]:
+    async def get_streams_by_duration(cls, limit: int = 50) -> List["LiveModel"]:
         """오래 진행된 스트림 순으로 조회"""
-        return await cls.filter(is_active=True).order_by("started_at")
+        return await cls.filter(is_active=True).order_by("started_at").limit(limit)
 
     @classmethod
     async def get_one_by_id(cls, live_id: int) -> "LiveModel":
@@ -78,11 +95,16 @@ class LiveModel(BaseModel, models.Model):  # type: ignore
         """Janus 방 ID로 라이브 스트림 조회"""
         return await cls.filter(janus_room_id=room_id, is_active=True).first()
 
-    async def stop_stream(self):
-        """스트림 종료"""
+    async def stop_stream(self, using_db: Optional[BaseDBAsyncClient] = None, end_reason: str = "stopped") -> "LiveHistoryModel":
+        """스트림 종료 -> 이력 추가 후 활성 행 삭제 (트랜잭션은 호출한 쪽에서)"""
+        from app.models.live_history_model import LiveHistoryModel
+
+        self.ended_at = datetime.now(timezone.utc)
         self.is_active = False
-        self.ended_at = datetime.now()
-        await self.save()
+        history = LiveHistoryModel.from_live(self, self.ended_at, end_reason)
+        await history.save(using_db=using_db)
+        await self.delete(using_db=using_db)
+        return history
 
     async def update_stream_info(self, stream_title: str = None):
         """스트림 정보 업데이트"""
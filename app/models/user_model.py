@@ -19,6 +19,7 @@ class User(BaseModel, models.Model):  # type: ignore
     # 관리자 생성용 추가 필드
     affiliation = fields.CharField(max_length=100, null=True, description="소속")
     channel_number = fields.IntField(null=True, description="정적 할당된 채널 번호")
+    facility = fields.CharField(max_length=50, null=True, description="채널 풀 시설, 없으면 기본 시설")
 
     @classmethod
     async def get_one_by_id(cls, user_id: int) -> "User":
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Optional
+import asyncio
+import json
+import logging
+from datetime import datetime
 
-from app.core.auth import get_current_user, require_admin, require_streamer, require_any_user
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, WebSocket, WebSocketDisconnect
+from typing import Any, Optional, Union
+
+from app.core.auth import get_current_user, get_user_from_token, require_admin, require_streamer, require_any_user
+from app.core.http_cache import conditional_model_response, conditional_response
+from app.core.responses import ModelJSONResponse
 from app.dtos.live.live_request import (
     LiveStreamCreateRequest,
     LiveStreamUpdateRequest,
@@ -9,108 +16,268 @@ from app.dtos.live.live_request import (
 from app.dtos.live.live_response import (
     LiveStreamResponse,
     AllChannelResponse,
+    AllChannelSummaryResponse,
     StreamStartResponse,
     StreamStopResponse,
     StreamUpdateResponse,
+    StreamHeartbeatResponse,
     LiveStreamListResponse,
+    LiveStreamSummaryListResponse,
+    LiveHistoryListResponse,
+    FacilityListResponse,
+    ResponseView,
 )
-from app.models.user_model import User
+from app.models.user_model import User, UserRole
+from app.services.channel_events import channel_events
+from app.services.live_history_service import service_get_stream_history
 from app.services.live_service import (
     service_start_stream,
     service_stop_stream,
-    service_get_all_channels,
     service_get_stream_by_channel,
+    service_get_channel_board,
+    service_get_facilities,
+    service_get_all_streams,
+    service_get_public_streams,
+    service_get_streams_by_category,
+    service_update_stream,
+    service_heartbeat_stream,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/v1/live", tags=["live"], redirect_slashes=False)
 
 
-@router.post("/streams", response_model=StreamStartResponse, dependencies=[Depends(require_streamer)])
+VIEW_QUERY = Query("full", description="응답 형태: full | summary(보드 타일용 요약, 설명/태그/썸네일/타임스탬프 제외)")
+
+
+async def channel_board_response(request: Request, facility: Optional[str], page: int, view: ResponseView) -> Response:
+    """캐시된 채널 보드 페이지 응답 (If-None-Match 일치 시 304)"""
+    body, etag = await service_get_channel_board(facility, page, view)
+    return conditional_response(request, body, etag)
+
+
+@router.post("/streams", response_model=StreamStartResponse)
 async def create_stream(
         data: LiveStreamCreateRequest,
         current_user: User = Depends(require_streamer),
-) -> StreamStartResponse:
+) -> dict[str, Any]:
     """스트림 생성"""
-    return await service_start_stream(current_user.id, data)
+    return await service_start_stream(current_user, data)
 
 @router.delete("/streams/current", response_model=StreamStopResponse)
 async def delete_current_stream(
         current_user: User = Depends(require_streamer),
-) -> StreamStopResponse:
+) -> Union[StreamStopResponse, dict[str, Any]]:
     """현재 사용자의 활성 스트림 삭제"""
     return await service_stop_stream(current_user.id)
 
 
-@router.get("/channels", response_model=AllChannelResponse, dependencies=[Depends(require_any_user)])
-async def list_channels(current_user = Depends(require_any_user)) -> AllChannelResponse:
-    """전체 채널 목록"""
-    return await service_get_all_channels()
+@router.get("/channels", response_model=Union[AllChannelResponse, AllChannelSummaryResponse])
+async def list_channels(
+    request: Request,
+    facility: Optional[str] = Query(None, description="시설, 없으면 기본 시설"),
+    page: int = Query(0, ge=0, description="채널 보드 페이지 (0부터)"),
+    view: ResponseView = VIEW_QUERY,
+    current_user = Depends(require_any_user),
+) -> Response:
+    """채널 목록 (시설별 페이지)"""
+    return await channel_board_response(request, facility, page, view)
+
+
+@router.get("/admin/channels", response_model=Union[AllChannelResponse, AllChannelSummaryResponse])
+async def get_all_channels_admin(
+    request: Request,
+    facility: Optional[str] = Query(None, description="시설, 없으면 기본 시설"),
+    page: int = Query(0, ge=0, description="채널 보드 페이지 (0부터)"),
+    view: ResponseView = VIEW_QUERY,
+    current_user = Depends(require_admin),
+) -> Response:
+    """관리자 전용: 채널 모니터링 (시설별 페이지)"""
+    return await channel_board_response(request, facility, page, view)
+
+
+@router.get("/facilities", response_model=FacilityListResponse)
+async def list_facilities(current_user = Depends(require_any_user)) -> Response:
+    """시설(채널 풀) 목록과 채널 구간"""
+    return ModelJSONResponse(await service_get_facilities())
+
+
+@router.websocket("/ws/channels")
+async def channel_events_ws(
+    websocket: WebSocket,
+    token: str = Query(..., description="액세스 토큰"),
+    facility: Optional[str] = Query(None, description="snapshot 시설, 없으면 기본 시설"),
+    page: int = Query(0, ge=0, description="snapshot 페이지"),
+) -> None:
+    """채널 보드 변경 구독: 최초 snapshot(시설/페이지) 1회 후 모든 워커의 started/stopped/updated 변경분 push
+
+    변경분의 seq 는 origin(발행 워커)별 연속 번호. snapshot 의 seqs 보다 작거나 같은 변경분은 보드에 이미
+    반영돼 있을 수 있고, origin 별로 번호를 건너뛰거나 resync 를 받으면 보드를 다시 조회해야 한다.
+    """
+    try:
+        user = await get_user_from_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    if user.role not in (UserRole.ADMIN, UserRole.STREAMER):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    try:
+        # 잘못된 시설/페이지는 연결 전에 거절
+        await service_get_channel_board(facility, page)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
 
+    await websocket.accept()
+    # snapshot 이전에 구독해야 그 사이 변경분을 놓치지 않음
+    subscription = channel_events.subscribe()
 
-@router.get("/admin/channels", dependencies=[Depends(require_admin)])
-async def get_all_channels_admin(current_user = Depends(require_admin)) -> AllChannelResponse:
-    """관리자 전용: 전체 채널 모니터링"""
-    return await service_get_all_channels()
+    async def pump() -> None:
+        # 보드 조회 전 seq: 조회 중 들어온 변경분이 보드에 없더라도 클라이언트가 버리지 않게
+        sequences = json.dumps(channel_events.sequences)
+        body, _ = await service_get_channel_board(facility, page)
+        await websocket.send_text('{"type":"snapshot","seqs":%s,"board":%s}' % (sequences, body.decode()))
+        while True:
+            await websocket.send_text(await subscription.get())
+
+    async def drain() -> None:
+        # 클라이언트 메시지는 무시, 연결 종료 감지용
+        while True:
+            await websocket.receive_text()
+
+    sender = asyncio.create_task(pump())
+    receiver = asyncio.create_task(drain())
+    try:
+        # 전송 실패(끊긴 소켓, 보드 조회 실패)나 연결 종료 중 먼저 끝나는 쪽에서 정리
+        done, _ = await asyncio.wait((sender, receiver), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        channel_events.unsubscribe(subscription)
+        sender.cancel()
+        receiver.cancel()
+
+    error = next(
+        (
+            task.exception() for task in done
+            if not task.cancelled() and not isinstance(task.exception(), WebSocketDisconnect)
+        ),
+        None,
+    )
+    if error is not None:
+        logger.warning("채널 이벤트 WebSocket 종료", extra={"error": str(error)})
+        try:
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        except (RuntimeError, WebSocketDisconnect):
+            # 이미 닫힌 소켓
+            pass
 
 
 @router.get("/channels/{channel_number}", response_model=LiveStreamResponse)
-async def get_channel(channel_number: int) -> LiveStreamResponse:
+async def get_channel(channel_number: int) -> Response:
     """특정 채널 조회"""
-    return await service_get_stream_by_channel(channel_number)
+    return ModelJSONResponse(await service_get_stream_by_channel(channel_number))
 
 # ==========스트림 조회==========
 
-@router.get("/streams", response_model=LiveStreamListResponse)
+@router.get("/streams", response_model=Union[LiveStreamListResponse, LiveStreamSummaryListResponse])
 async def list_streams(
+    request: Request,
     category: Optional[str] = Query(None, description="카테고리 필터"),
     public: Optional[bool] = Query(None, description="공개 여부 필터"),
     limit: int = Query(50, ge=1, le=100, description="결과 수 제한"),
-    offset: int = Query(0, ge=0, description="결과 오프셋")
-) -> LiveStreamListResponse:
-    """스트림 목록 조회 (쿼리 파라미터로 필터링)"""
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    view: ResponseView = VIEW_QUERY,
+) -> Response:
+    """스트림 목록 조회 (쿼리 파라미터로 필터링, If-None-Match 일치 시 304)"""
     if category:
-        return await service_get_streams_by_category(category)
+        streams = await service_get_streams_by_category(category, limit, cursor, view)
     elif public is True:
-        return await service_get_public_streams()
+        streams = await service_get_public_streams(limit, cursor, view)
     else:
-        # 전체 스트림 조회 (새 서비스 함수 필요)
-        return await service_get_all_streams(limit, offset)
+        streams = await service_get_all_streams(limit, cursor, view)
+    return conditional_model_response(request, streams)
 
-@router.post("/start")
+@router.post("/start", response_model=None)
 async def router_start_stream(
         data: LiveStreamCreateRequest,
         current_user: User = Depends(require_streamer),
-):
+) -> dict[str, Any]:
     """라이브 스트림 시작"""
-    return await service_start_stream(current_user.id, data)
+    return await service_start_stream(current_user, data)
 
-@router.post("/stop")
+@router.post("/stop", response_model=None)
 async def router_stop_stream(
         current_user: User = Depends(require_streamer),
-):
+) -> Union[StreamStopResponse, dict[str, Any]]:
     """라이브 스트림 종료"""
     return await service_stop_stream(current_user.id)
 
+@router.post("/heartbeat", response_model=StreamHeartbeatResponse)
+async def router_heartbeat_stream(
+        current_user: User = Depends(require_streamer),
+) -> Response:
+    """라이브 스트림 heartbeat (timeout_seconds 안에 반복 호출, 끊기면 스트림 자동 종료)"""
+    return ModelJSONResponse(await service_heartbeat_stream(current_user.id))
+
 @router.patch("/update", response_model=StreamUpdateResponse)
 async def router_update_stream(
         data: LiveStreamUpdateRequest,
         current_user: User = Depends(get_current_user),
-) -> StreamUpdateResponse:
+) -> Response:
     """라이브 스트림 정보 수정"""
-    return await service_update_stream(current_user.id, data)
+    return ModelJSONResponse(await service_update_stream(current_user.id, data))
 
 
-@router.get("/public", response_model=LiveStreamListResponse)
-async def router_get_public_streams() -> LiveStreamListResponse:
+@router.get("/public", response_model=Union[LiveStreamListResponse, LiveStreamSummaryListResponse])
+async def router_get_public_streams(
+    request: Request,
+    limit: int = Query(50, ge=1, le=100, description="결과 수 제한"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    view: ResponseView = VIEW_QUERY,
+) -> Response:
     """공개 스트림 목록 조회"""
-    return await service_get_public_streams()
+    return conditional_model_response(request, await service_get_public_streams(limit, cursor, view))
 
-@router.get("/category/{category}", response_model=LiveStreamListResponse)
-async def router_get_streams_by_category(category: str) -> LiveStreamListResponse:
+@router.get("/category/{category}", response_model=Union[LiveStreamListResponse, LiveStreamSummaryListResponse])
+async def router_get_streams_by_category(
+    request: Request,
+    category: str,
+    limit: int = Query(50, ge=1, le=100, description="결과 수 제한"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    view: ResponseView = VIEW_QUERY,
+) -> Response:
     """카테고리별 스트림 조회"""
-    return await service_get_streams_by_category(category)
+    return conditional_model_response(request, await service_get_streams_by_category(category, limit, cursor, view))
 
 @router.get("/channel/{channel_number}", response_model=LiveStreamResponse)
-async def router_get_stream_by_channel(channel_number: int) -> LiveStreamResponse:
+async def router_get_stream_by_channel(channel_number: int) -> Response:
     """채널명 스트림 조회 - 관리자가 특정 채널 클릭 시 개별 조회"""
-    return await service_get_stream_by_channel(channel_number)
+    return ModelJSONResponse(await service_get_stream_by_channel(channel_number))
+
+
+# ==========스트림 이력==========
+
+@router.get("/history", response_model=LiveHistoryListResponse)
+async def router_get_my_stream_history(
+    started_from: Optional[datetime] = Query(None, description="시작 시각 하한 (포함)"),
+    started_to: Optional[datetime] = Query(None, description="시작 시각 상한 (미포함)"),
+    limit: int = Query(50, ge=1, le=100, description="결과 수 제한"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    current_user: User = Depends(require_streamer),
+) -> Response:
+    """내 종료된 스트림 이력 (아카이브 포함)"""
+    return ModelJSONResponse(await service_get_stream_history(current_user.id, started_from, started_to, limit, cursor))
+
+@router.get("/admin/history", response_model=LiveHistoryListResponse)
+async def router_get_stream_history_admin(
+    user_id: Optional[int] = Query(None, description="스트리머 ID, 없으면 전체"),
+    started_from: Optional[datetime] = Query(None, description="시작 시각 하한 (포함)"),
+    started_to: Optional[datetime] = Query(None, description="시작 시각 상한 (미포함)"),
+    limit: int = Query(50, ge=1, le=100, description="결과 수 제한"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    current_user: User = Depends(require_admin),
+) -> Response:
+    """스트리머/기간별 종료된 스트림 이력 (아카이브 포함)"""
+    return ModelJSONResponse(await service_get_stream_history(user_id, started_from, started_to, limit, cursor))
@@ -1,10 +1,21 @@
 from string import ascii_lowercase
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 
-from app.core.auth import create_access_token, get_current_user, oauth2_scheme, ALGORITHM, SECRET_KEY, require_admin
+from app.core.auth import (
+    create_access_token,
+    get_current_user,
+    oauth2_scheme,
+    ALGORITHM,
+    SECRET_KEY,
+    require_admin,
+    token_claims_for,
+    invalidate_user_cache,
+)
+from app.core.http_cache import conditional_response
+from app.core.responses import ModelJSONResponse
 from app.dtos.user.user_login_request import UserLoginRequest
 from app.dtos.user.user_login_response import UserLoginResponse
 from app.dtos.user.user_password_reset_request import (
@@ -16,7 +27,7 @@ from app.dtos.user.user_password_reset_response import (
     UserPasswordResetResponse,
 )
 from app.dtos.user.user_profile_update_request import UserProfileUpdateRequest
-from app.dtos.user.user_signup_response import UserGetResponse, UserSignupResponse
+from app.dtos.user.user_signup_response import UserGetResponse, UserSignupResponse, to_user_get_response
 from app.models.user_model import User
 from app.services.user_service import (
     authenticate_user,
@@ -29,11 +40,16 @@ from app.services.user_service import (
     service_admin_add_user,
     service_admin_delete_user,
     service_admin_update_user,
-    service_admin_list_streamers,
+    service_admin_streamer_list_body,
+    service_admin_import_users,
+    service_admin_export_streamers,
+    parse_user_import_file,
+    invalidate_streamer_list,
 )
 from app.dtos.user.admin_user_add_request import AdminUserAddRequest
 from app.dtos.user.admin_user_update_channel_request import AdminUserUpdateRequest
 from app.dtos.user.user_signup_response import StreamerListResponse
+from app.dtos.user.admin_user_import import AdminUserImportResponse
 
 router = APIRouter(tags=["User"], redirect_slashes=False)
 
@@ -45,21 +61,39 @@ async def admin_add_user(data: AdminUserAddRequest) -> UserSignupResponse:
     return await service_admin_add_user(data)
 
 
+# Admin 전용 사용자 일괄 생성 API (CSV 헤더: username,password,full_name,affiliation,channel_number[,email,facility] 또는 JSON 배열)
+@router.post("/bulk_import", response_model=AdminUserImportResponse, tags=["Admin"], dependencies=[Depends(require_admin)])
+async def admin_import_users(file: UploadFile = File(...)) -> AdminUserImportResponse:
+    rows = parse_user_import_file(file.filename or "", await file.read())
+    return await service_admin_import_users(rows)
+
+
+# Admin: 스트리머 목록 CSV 내보내기
+@router.get("/streamers/export", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def admin_export_streamers() -> StreamingResponse:
+    return StreamingResponse(
+        service_admin_export_streamers(),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": 'attachment; filename="streamers.csv"'},
+    )
+
+
 @router.get("/me", response_model=UserGetResponse)
-async def get_current_user_me(current_user: User = Depends(get_current_user)) -> UserGetResponse:
+async def get_current_user_me(current_user: User = Depends(get_current_user)) -> Response:
     """
     현재 인증된 사용자 정보를 반환합니다.
     이미 get_current_user 함수가 있으므로 이를 활용하는 것이 좋습니다.
     """
 
-    return UserGetResponse.model_validate(current_user)
+    return ModelJSONResponse(await to_user_get_response(current_user))
 
 
-@router.get("/{user_id}", response_model=UserGetResponse)
+# :int -> /streamers 등 고정 경로를 가리지 않음
+@router.get("/{user_id:int}", response_model=UserGetResponse)
 async def router_get_user(
     user_id: int,
-) -> UserGetResponse:
-    return await service_get_user(user_id)
+) -> Response:
+    return ModelJSONResponse(await service_get_user(user_id))
 
 
 @router.post("/login", response_model=UserLoginResponse)
@@ -80,7 +114,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 혹은 비밀번호가 다릅니다.",
         )
-    access_token = create_access_token(data={"sub": user.username})
+    access_token = create_access_token(data=token_claims_for(user))
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -101,11 +135,6 @@ async def router_change_password(
 async def update_profile(
     data: UserProfileUpdateRequest, current_user: User = Depends(get_current_user)
 ) -> dict[str, str]:
-    if data.full_name is not None:
-        current_user.full_name = data.full_name
-    if data.email is not None:
-        current_user.email = data.email
-    await current_user.save()
     return await service_update_profile(current_user.id, data)
 
 
@@ -124,6 +153,8 @@ async def set_user_as_admin(
     # 사용자의 role 필드를 'admin'으로 변경
     db_user.role = "admin"
     await db_user.save()
+    await invalidate_user_cache(db_user.id)
+    await invalidate_streamer_list()
 
     return {"message": f"User {username} is now an admin. New role: {db_user.role}"}
 
@@ -142,5 +173,5 @@ async def admin_update_user(username: str, data: AdminUserUpdateRequest) -> dict
 
 # Admin: 스트리머 목록 조회 (채널/소속/이름 포함)
 @router.get("/streamers", response_model=StreamerListResponse, tags=["Admin"], dependencies=[Depends(require_admin)])
-async def admin_list_streamers() -> StreamerListResponse:
-    return await service_admin_list_streamers()
+async def admin_list_streamers(request: Request) -> Response:
+    return conditional_response(request, await service_admin_streamer_list_body())
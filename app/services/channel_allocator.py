@@ -0,0 +1,238 @@
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.configs import settings
+from app.models.live_model import LiveModel
+
+
+def nearest_bit(mask: int, offset: int) -> Optional[int]:
+    """mask 에서 offset 과 가장 가까운 1 비트 위치 (같으면 낮은 쪽), 없으면 None"""
+    if not mask:
+        return None
+    upper = mask >> offset << offset
+    above = (upper & -upper).bit_length() - 1 if upper else None
+    below = (mask ^ upper).bit_length() - 1 if mask ^ upper else None
+    if above is None:
+        return below
+    if below is None or above - offset < offset - below:
+        return above
+    return below
+
+
+class ChannelAllocator:
+    """채널 비트맵 할당기 (프로세스 로컬)
+
+    비트 i 가 1 이면 채널 (first_channel + i) 가 비어 있음을 뜻한다.
+    가장 낮은 빈 채널은 `mask & -mask` 로 O(1) 에 구한다.
+    DB 는 lives.active_channel 유니크 제약으로 최종 점유만 확인한다.
+    """
+
+    def __init__(self, capacity: int = 16, first_channel: int = 1):
+        self.capacity = capacity
+        self.first_channel = first_channel
+        self._all_mask = (1 << capacity) - 1
+        self._free_mask = self._all_mask
+        self._owners: dict[int, Optional[int]] = {}
+        # 메모리에서 점유했지만 아직 DB 커밋 전인 채널
+        self._pending: set[int] = set()
+        self.loaded = False
+
+    # ---------- 상태 조회 ----------
+
+    @property
+    def last_channel(self) -> int:
+        return self.first_channel + self.capacity - 1
+
+    def contains(self, channel_number: int) -> bool:
+        return self.first_channel <= channel_number <= self.last_channel
+
+    def is_free(self, channel_number: int) -> bool:
+        if not self.contains(channel_number):
+            return False
+        return bool(self._free_mask >> (channel_number - self.first_channel) & 1)
+
+    @property
+    def free_count(self) -> int:
+        return self._free_mask.bit_count()
+
+    @property
+    def free_mask(self) -> int:
+        return self._free_mask
+
+    @property
+    def used_channels(self) -> set[int]:
+        return set(self._owners)
+
+    def owner_of(self, channel_number: int) -> Optional[int]:
+        return self._owners.get(channel_number)
+
+    # ---------- 점유 / 해제 ----------
+
+    def claim(self, user_id: Optional[int] = None) -> Optional[int]:
+        """가장 낮은 빈 채널 점유, 없으면 None"""
+        if not self._free_mask:
+            return None
+        lowest = self._free_mask & -self._free_mask
+        self._free_mask ^= lowest
+        channel_number = lowest.bit_length() - 1 + self.first_channel
+        self._owners[channel_number] = user_id
+        self._pending.add(channel_number)
+        return channel_number
+
+    def claim_specific(self, channel_number: int, user_id: Optional[int] = None) -> bool:
+        """지정 채널 점유 시도"""
+        if not self.is_free(channel_number):
+            return False
+        self.mark_used(channel_number, user_id)
+        self._pending.add(channel_number)
+        return True
+
+    def mark_used(self, channel_number: int, user_id: Optional[int] = None) -> None:
+        """다른 경로(다른 워커, 기존 DB 행)로 점유된 채널 반영"""
+        if not self.contains(channel_number):
+            return
+        self._free_mask &= ~(1 << (channel_number - self.first_channel))
+        self._owners[channel_number] = user_id
+
+    def confirm(self, channel_number: int) -> None:
+        """DB 커밋 완료 -> 확정"""
+        self._pending.discard(channel_number)
+
+    def release(self, channel_number: int) -> None:
+        if not self.contains(channel_number):
+            return
+        self._free_mask |= 1 << (channel_number - self.first_channel)
+        self._owners.pop(channel_number, None)
+        self._pending.discard(channel_number)
+
+    # ---------- DB 동기화 ----------
+
+    def load(self, active: Iterable[tuple[int, Optional[int]]]) -> None:
+        """(channel_number, user_id) 목록으로 비트맵 재구성 (커밋 전 점유는 유지)"""
+        pending = {channel_number: self._owners.get(channel_number) for channel_number in self._pending}
+        self._free_mask = self._all_mask
+        self._owners.clear()
+        for channel_number, user_id in active:
+            self.mark_used(channel_number, user_id)
+        for channel_number, user_id in pending.items():
+            self.mark_used(channel_number, user_id)
+        self.loaded = True
+
+    async def reconcile(self, connection: Optional[BaseDBAsyncClient] = None) -> None:
+        """lives 테이블의 활성 스트림 기준으로 비트맵 재구성 (시작 시 1회, 채널 고갈 시)"""
+        rows = await LiveModel.filter(is_active=True).using_db(connection).values_list("channel_number", "user_id")
+        self.load(rows)
+
+
+class ChannelPools:
+    """시설(facility)별 채널 풀
+
+    시설마다 연속된 채널 번호 구간을 선언 순서대로 부여하고 구간마다 ChannelAllocator 를 둔다.
+    채널 번호는 전체에서 유일하므로 lives.active_channel / channel_slots 는 그대로 쓰고,
+    채널 번호 -> 시설은 구간 시작 번호 이분 탐색으로 찾는다 (용량과 무관하게 O(log 시설 수)).
+    ChannelAllocator 와 같은 조회/해제 인터페이스를 제공하므로 백엔드는 점유 시에만 시설을 알면 된다.
+    """
+
+    def __init__(self, facilities: dict[str, int], first_channel: int = 1):
+        if not facilities:
+            raise ValueError("채널 시설이 하나 이상 필요합니다.")
+        self.pools: dict[str, ChannelAllocator] = {}
+        next_channel = first_channel
+        for name, capacity in facilities.items():
+            if capacity < 1:
+                raise ValueError(f"시설 {name} 의 채널 수가 올바르지 않습니다: {capacity}")
+            self.pools[name] = ChannelAllocator(capacity=capacity, first_channel=next_channel)
+            next_channel += capacity
+        self.first_channel = first_channel
+        self.capacity = next_channel - first_channel
+        self.default_facility = next(iter(self.pools))
+        self._names = list(self.pools)
+        self._starts = [pool.first_channel for pool in self.pools.values()]
+
+    # ---------- 시설 ----------
+
+    def pool(self, facility: Optional[str] = None) -> ChannelAllocator:
+        """시설 풀 (None 이면 기본 시설), 없는 시설이면 KeyError"""
+        return self.pools[facility or self.default_facility]
+
+    def facility_of(self, channel_number: int) -> Optional[str]:
+        index = bisect_right(self._starts, channel_number) - 1
+        if index < 0 or not self.pools[self._names[index]].contains(channel_number):
+            return None
+        return self._names[index]
+
+    def _pool_of(self, channel_number: int) -> Optional[ChannelAllocator]:
+        facility = self.facility_of(channel_number)
+        return self.pools[facility] if facility is not None else None
+
+    # ---------- 상태 조회 ----------
+
+    @property
+    def loaded(self) -> bool:
+        return all(pool.loaded for pool in self.pools.values())
+
+    def contains(self, channel_number: int) -> bool:
+        return self._pool_of(channel_number) is not None
+
+    def is_free(self, channel_number: int) -> bool:
+        pool = self._pool_of(channel_number)
+        return pool is not None and pool.is_free(channel_number)
+
+    @property
+    def free_count(self) -> int:
+        return sum(pool.free_count for pool in self.pools.values())
+
+    @property
+    def used_channels(self) -> set[int]:
+        return set().union(*(pool.used_channels for pool in self.pools.values()))
+
+    def owner_of(self, channel_number: int) -> Optional[int]:
+        pool = self._pool_of(channel_number)
+        return pool.owner_of(channel_number) if pool is not None else None
+
+    # ---------- 점유 / 해제 ----------
+
+    def claim(self, user_id: Optional[int] = None, facility: Optional[str] = None) -> Optional[int]:
+        """시설에서 가장 낮은 빈 채널 점유, 없으면 None"""
+        return self.pool(facility).claim(user_id)
+
+    def claim_specific(self, channel_number: int, user_id: Optional[int] = None) -> bool:
+        pool = self._pool_of(channel_number)
+        return pool is not None and pool.claim_specific(channel_number, user_id)
+
+    def mark_used(self, channel_number: int, user_id: Optional[int] = None) -> None:
+        pool = self._pool_of(channel_number)
+        if pool is not None:
+            pool.mark_used(channel_number, user_id)
+
+    def confirm(self, channel_number: int) -> None:
+        pool = self._pool_of(channel_number)
+        if pool is not None:
+            pool.confirm(channel_number)
+
+    def release(self, channel_number: int) -> None:
+        pool = self._pool_of(channel_number)
+        if pool is not None:
+            pool.release(channel_number)
+
+    # ---------- DB 동기화 ----------
+
+    def load(self, active: Iterable[tuple[int, Optional[int]]]) -> None:
+        """(channel_number, user_id) 목록을 시설별로 나눠 각 비트맵 재구성 (설정에서 빠진 채널은 무시)"""
+        by_facility: dict[str, list[tuple[int, Optional[int]]]] = {name: [] for name in self.pools}
+        for channel_number, user_id in active:
+            facility = self.facility_of(channel_number)
+            if facility is not None:
+                by_facility[facility].append((channel_number, user_id))
+        for name, rows in by_facility.items():
+            self.pools[name].load(rows)
+
+    async def reconcile(self, connection: Optional[BaseDBAsyncClient] = None) -> None:
+        """lives 테이블의 활성 스트림 기준으로 모든 시설 비트맵 재구성 (조회 1회)"""
+        rows = await LiveModel.filter(is_active=True).using_db(connection).values_list("channel_number", "user_id")
+        self.load(rows)
+
+
+channel_pools = ChannelPools(settings.CHANNEL_FACILITIES)
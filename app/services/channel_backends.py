@@ -0,0 +1,210 @@
+import abc
+from typing import Iterable, Optional
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.configs import settings
+from app.models.channel_slot_model import ChannelSlot
+from app.services.channel_allocator import ChannelAllocator, ChannelPools, channel_pools
+from app.services.channel_policy import ChannelPolicy, channel_policy
+
+
+class ChannelBackend(abc.ABC):
+    """채널 할당 백엔드 공통 인터페이스
+
+    acquire/release 는 스트림 시작/종료 트랜잭션 안에서 호출되고,
+    commit/rollback/conflict 는 트랜잭션이 끝난 뒤 로컬 비트맵을 맞춘다.
+    채널은 사용자의 시설(facility) 풀에서만, 배정 정책(ChannelPolicy)이 고른 채널부터 점유한다.
+    """
+
+    name = "base"
+
+    def __init__(self, pools: ChannelPools, policy: ChannelPolicy):
+        self.pools = pools
+        self.policy = policy
+
+    async def setup(self) -> None:
+        """앱 시작 시 1회"""
+        await self.pools.reconcile()
+        await self.policy.assignments.reload()
+
+    @abc.abstractmethod
+    async def acquire(
+        self, user_id: int, connection: BaseDBAsyncClient, facility: Optional[str] = None
+    ) -> Optional[int]:
+        """트랜잭션 안에서 채널 점유, 빈 채널이 없으면 None"""
+
+    async def release(self, channel_number: int, connection: BaseDBAsyncClient) -> None:
+        """트랜잭션 안에서 채널 반환 (DB 측)"""
+
+    async def release_many(self, channel_numbers: list[int], connection: BaseDBAsyncClient) -> None:
+        """여러 채널 반환 (reaper 배치 종료용)"""
+        for channel_number in channel_numbers:
+            await self.release(channel_number, connection)
+
+    def commit(self, claimed: Optional[int], released: Iterable[int] = ()) -> None:
+        """트랜잭션 커밋 후 로컬 비트맵 반영"""
+        for channel_number in released:
+            if channel_number != claimed:
+                self.pools.release(channel_number)
+        if claimed is not None:
+            self.pools.confirm(claimed)
+
+    def rollback(self, claimed: Optional[int]) -> None:
+        """트랜잭션 실패 -> 로컬 점유 취소"""
+        if claimed is not None:
+            self.pools.release(claimed)
+
+    def conflict(self, channel_number: int) -> None:
+        """다른 워커가 이미 점유한 채널 -> 사용 중으로 유지"""
+        self.pools.confirm(channel_number)
+
+
+class LocalChannelBackend(ChannelBackend):
+    """프로세스 로컬 비트맵 + lives.active_channel 유니크 제약 (단일 워커/개발용 기본값)"""
+
+    name = "local"
+
+    async def acquire(
+        self, user_id: int, connection: BaseDBAsyncClient, facility: Optional[str] = None
+    ) -> Optional[int]:
+        pool = self.pools.pool(facility)
+        choice = self.policy.choose(pool, user_id)
+        if choice is None:
+            # 다른 워커에서 종료된 채널이 있을 수 있으므로 재동기화 후 1회 더
+            await self.pools.reconcile(connection)
+            choice = self.policy.choose(pool, user_id)
+        if choice is None:
+            return None
+        channel_number, strategy = choice
+        pool.claim_specific(channel_number, user_id)
+        self.policy.record(strategy)
+        return channel_number
+
+
+class MySQLSlotChannelBackend(ChannelBackend):
+    """channel_slots 행 잠금(SELECT ... FOR UPDATE SKIP LOCKED) 기반 워커 간 할당
+
+    동시에 시작하는 워커들은 서로 다른 빈 슬롯을 잠그므로 재시도/대기 없이 진행된다.
+    로컬 비트맵은 힌트로만 쓴다: 정책이 고른 슬롯 1행을 먼저 잠그고, 이미 점유됐으면
+    시설 구간에서 배정 채널과 가까운 순으로 잠근다.
+    """
+
+    name = "mysql_slots"
+
+    async def setup(self) -> None:
+        connection = connections.get("default")
+        first = self.pools.first_channel
+        await ChannelSlot.bulk_create(
+            [ChannelSlot(channel_number=first + i) for i in range(self.pools.capacity)],
+            ignore_conflicts=True,
+        )
+        # lives 기준으로 슬롯 정리 (비정상 종료로 남은 점유 해제, 누락된 점유 반영)
+        await connection.execute_query(
+            "UPDATE channel_slots s LEFT JOIN lives l ON l.active_channel = s.channel_number "
+            "SET s.user_id = NULL, s.claimed_at = NULL "
+            "WHERE l.id IS NULL AND s.user_id IS NOT NULL"
+        )
+        await connection.execute_query(
+            "UPDATE channel_slots s JOIN lives l ON l.active_channel = s.channel_number "
+            "SET s.user_id = l.user_id, s.claimed_at = l.started_at "
+            "WHERE s.user_id IS NULL"
+        )
+        await self.pools.reconcile()
+        await self.policy.assignments.reload()
+
+    async def acquire(
+        self, user_id: int, connection: BaseDBAsyncClient, facility: Optional[str] = None
+    ) -> Optional[int]:
+        pool = self.pools.pool(facility)
+        choice = self.policy.choose(pool, user_id)
+        if choice is not None:
+            _, rows = await connection.execute_query(
+                "SELECT channel_number FROM channel_slots "
+                "WHERE channel_number = %s AND user_id IS NULL FOR UPDATE SKIP LOCKED",
+                [choice[0]],
+            )
+            if not rows:
+                # 힌트가 오래됨 (다른 워커가 점유)
+                pool.mark_used(choice[0])
+                choice = None
+        if choice is None:
+            choice = await self._acquire_nearest(user_id, connection, pool)
+            if choice is None:
+                return None
+        channel_number, strategy = choice
+        self.policy.record(strategy)
+        await connection.execute_query(
+            "UPDATE channel_slots SET user_id = %s, claimed_at = NOW() WHERE channel_number = %s",
+            [user_id, channel_number],
+        )
+        self.pools.mark_used(channel_number, user_id)
+        return channel_number
+
+    async def _acquire_nearest(
+        self, user_id: int, connection: BaseDBAsyncClient, pool: ChannelAllocator
+    ) -> Optional[tuple[int, str]]:
+        """시설 구간의 빈 슬롯을 배정 채널과 가까운 순으로 잠금 (우선 배정 여유는 DB 기준으로 확인)
+
+        ChannelPolicy.choose 와 같이 다른 사용자에게 배정된 슬롯은 뒤로 정렬해
+        다른 빈 슬롯이 없을 때만 잠근다 (reserved_fallback).
+        """
+        if self.policy.priority_reserve and not self.policy.is_priority(user_id):
+            _, rows = await connection.execute_query(
+                "SELECT COUNT(*) AS free FROM channel_slots "
+                "WHERE user_id IS NULL AND channel_number BETWEEN %s AND %s",
+                [pool.first_channel, pool.last_channel],
+            )
+            if int(rows[0]["free"]) <= self.policy.priority_reserve:
+                return None
+        preferred = self.policy.assignments.preferred(user_id)
+        target = preferred if preferred is not None and pool.contains(preferred) else pool.first_channel
+        reserved = self.policy.assignments.reserved_channels(pool, exclude_user=user_id)
+        reserved_last = f"channel_number IN ({', '.join(['%s'] * len(reserved))}), " if reserved else ""
+        _, rows = await connection.execute_query(
+            "SELECT channel_number FROM channel_slots "
+            "WHERE user_id IS NULL AND channel_number BETWEEN %s AND %s "
+            f"ORDER BY {reserved_last}ABS(channel_number - %s), channel_number LIMIT 1 FOR UPDATE SKIP LOCKED",
+            [pool.first_channel, pool.last_channel, *reserved, target],
+        )
+        if not rows:
+            return None
+        channel_number = int(rows[0]["channel_number"])
+        if channel_number == preferred:
+            return channel_number, "assigned"
+        return channel_number, "reserved_fallback" if channel_number in reserved else "nearest"
+
+    async def release(self, channel_number: int, connection: BaseDBAsyncClient) -> None:
+        await connection.execute_query(
+            "UPDATE channel_slots SET user_id = NULL, claimed_at = NULL WHERE channel_number = %s",
+            [channel_number],
+        )
+
+    async def release_many(self, channel_numbers: list[int], connection: BaseDBAsyncClient) -> None:
+        if not channel_numbers:
+            return
+        placeholders = ", ".join(["%s"] * len(channel_numbers))
+        await connection.execute_query(
+            f"UPDATE channel_slots SET user_id = NULL, claimed_at = NULL WHERE channel_number IN ({placeholders})",
+            list(channel_numbers),
+        )
+
+
+CHANNEL_BACKENDS: dict[str, type[ChannelBackend]] = {
+    LocalChannelBackend.name: LocalChannelBackend,
+    MySQLSlotChannelBackend.name: MySQLSlotChannelBackend,
+}
+
+
+def get_channel_backend(
+    name: str, pools: ChannelPools = channel_pools, policy: ChannelPolicy = channel_policy
+) -> ChannelBackend:
+    try:
+        backend_class = CHANNEL_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 채널 할당 백엔드: {name}")
+    return backend_class(pools, policy)
+
+
+channel_backend = get_channel_backend(settings.CHANNEL_ALLOCATION_BACKEND)
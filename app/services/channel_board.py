@@ -0,0 +1,173 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Final, Optional
+
+from pydantic import BaseModel
+
+from app.core.cache import CacheBackend
+from app.core.http_cache import etag_for
+from app.services.channel_allocator import ChannelPools
+
+# 보드 모델 -> 응답 형태별 모델 (full 은 그대로)
+BoardView = Callable[[BaseModel], BaseModel]
+FULL_VIEW: Final = "full"
+
+
+class ChannelBoardSnapshot:
+    """채널 보드 스냅샷 (응답 형태별 직렬화된 JSON bytes + ETag 캐시)
+
+    시작/종료/수정 시 invalidate() 로 버전을 올리고, 조회 시 버전이 바뀌었거나
+    max_age 가 지난 경우에만 다시 만든다. max_age 는 다른 워커에서 일어난 변경을
+    반영하기 위한 상한이다. 같은 버전 안에서는 보드를 한 번만 조회하고
+    요약 등 다른 형태는 그 결과에서 만든다.
+
+    shared 캐시가 있으면 다시 만들기 전에 다른 워커가 만든 본문을 먼저 사용한다
+    (무효화는 캐시 pub/sub 으로 모든 워커에 전달).
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[], Awaitable[BaseModel]],
+        max_age: float = 1.0,
+        shared: Optional[CacheBackend] = None,
+        shared_key: str = "channel_board:",
+        views: Optional[dict[str, BoardView]] = None,
+    ):
+        self._builder = builder
+        self.max_age = max_age
+        self.shared = shared
+        self.shared_key = shared_key
+        self.views = views or {}
+        self.version = 0
+        self._built_version = -1
+        self._built_at = 0.0
+        self._board: Optional[BaseModel] = None
+        self._payloads: dict[str, tuple[bytes, str]] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    def _is_current(self) -> bool:
+        return self._built_version == self.version and time.monotonic() - self._built_at < self.max_age
+
+    async def get(self, view: str = FULL_VIEW) -> tuple[bytes, str]:
+        """(JSON bytes, ETag)"""
+        if not (view in self._payloads and self._is_current()):
+            # 동시에 들어온 폴링은 한 번만 재생성
+            async with self._lock:
+                if not (view in self._payloads and self._is_current()):
+                    await self._render(view)
+        return self._payloads[view]
+
+    async def _render(self, view: str) -> None:
+        current = self._is_current()
+        version = self.version
+        if not current:
+            self._board = None
+            self._payloads = {}
+        if FULL_VIEW not in self._payloads:
+            body = await self.shared.get(self.shared_key) if self.shared is not None else None
+            if body is None:
+                self._board = await self._builder()
+                body = self._board.model_dump_json().encode()
+                if self.shared is not None:
+                    await self.shared.set(self.shared_key, body, self.max_age)
+            self._payloads[FULL_VIEW] = (body, etag_for(body))
+        if view != FULL_VIEW:
+            # 다른 형태는 full 본문 해시로 공유 (무효화 대상 키가 아니어도 이전 보드 것을 쓰지 않음)
+            full_etag = self._payloads[FULL_VIEW][1].strip('"')
+            key = f"{self.shared_key}:{view}:{full_etag}"
+            body = await self.shared.get(key) if self.shared is not None else None
+            if body is None:
+                if self._board is None:
+                    self._board = await self._builder()
+                body = self.views[view](self._board).model_dump_json().encode()
+                if self.shared is not None:
+                    await self.shared.set(key, body, self.max_age)
+            self._payloads[view] = (body, etag_for(body))
+        if not current:
+            self._built_version = version
+            self._built_at = time.monotonic()
+
+
+# 페이지 빌더: (시설, 페이지, 첫 채널, 마지막 채널) -> 보드
+WindowBuilder = Callable[[str, int, int, int], Awaitable[BaseModel]]
+
+
+class ChannelBoard:
+    """시설/페이지(윈도우) 단위 채널 보드
+
+    윈도우마다 ChannelBoardSnapshot 을 따로 두고, 채널이 바뀌면 그 채널이 속한 윈도우만
+    무효화한다. 256채널 보드도 폴링마다 전체를 다시 만들지 않고 바뀐 페이지만 다시 만든다.
+    윈도우 키는 "시설:페이지" 이며 공유 캐시 키/무효화 키로도 그대로 쓴다.
+    """
+
+    def __init__(
+        self,
+        builder: WindowBuilder,
+        pools: ChannelPools,
+        page_size: int = 64,
+        max_age: float = 1.0,
+        shared: Optional[CacheBackend] = None,
+        namespace: str = "channel_board",
+        views: Optional[dict[str, BoardView]] = None,
+    ):
+        self._builder = builder
+        self.pools = pools
+        self.page_size = page_size
+        self.max_age = max_age
+        self.shared = shared
+        self.namespace = namespace
+        self.views = views or {}
+        self._snapshots: dict[str, ChannelBoardSnapshot] = {}
+
+    def page_count(self, facility: str) -> int:
+        return -(-self.pools.pool(facility).capacity // self.page_size)
+
+    def window(self, facility: str, page: int) -> tuple[int, int]:
+        """페이지의 (첫 채널, 마지막 채널)"""
+        pool = self.pools.pool(facility)
+        first = pool.first_channel + page * self.page_size
+        return first, min(first + self.page_size - 1, pool.last_channel)
+
+    def window_key(self, channel_number: int) -> Optional[str]:
+        """채널이 속한 윈도우 키, 설정에 없는 채널이면 None"""
+        facility = self.pools.facility_of(channel_number)
+        if facility is None:
+            return None
+        page = (channel_number - self.pools.pool(facility).first_channel) // self.page_size
+        return f"{facility}:{page}"
+
+    def _snapshot(self, facility: str, page: int) -> ChannelBoardSnapshot:
+        key = f"{facility}:{page}"
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            first, last = self.window(facility, page)
+
+            async def build() -> BaseModel:
+                return await self._builder(facility, page, first, last)
+
+            snapshot = ChannelBoardSnapshot(
+                build,
+                max_age=self.max_age,
+                shared=self.shared,
+                shared_key=f"{self.namespace}:{key}",
+                views=self.views,
+            )
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    async def get(self, facility: str, page: int, view: str = FULL_VIEW) -> tuple[bytes, str]:
+        """(JSON bytes, ETag), 시설/페이지 범위/형태 확인은 호출한 쪽에서"""
+        return await self._snapshot(facility, page).get(view)
+
+    def invalidate(self, key: str = "") -> None:
+        """윈도우 1개 무효화, 키가 비어 있으면 전체"""
+        if not key:
+            for snapshot in self._snapshots.values():
+                snapshot.invalidate()
+            return
+        window = self._snapshots.get(key)
+        if window is not None:
+            window.invalidate()
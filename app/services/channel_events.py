@@ -0,0 +1,108 @@
+import asyncio
+import json
+import uuid
+from typing import Any, Optional
+
+from app.core.cache import CacheBackend, cache
+
+RESYNC_MESSAGE = json.dumps({"type": "resync"})
+
+
+class ChannelSubscription:
+    """구독자 1명의 전송 대기열 (크기 제한)"""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 느린 클라이언트: 밀린 변경분을 버리고 전체 보드 재조회(resync) 요청만 남김
+            self.resync()
+
+    def resync(self) -> None:
+        """놓친 변경분이 있을 수 있음 -> 밀린 변경분 대신 resync 만 전달"""
+        self.dropped += self.queue.qsize()
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(RESYNC_MESSAGE)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+class ChannelEventBroker:
+    """채널 보드 변경(started/stopped/updated) 팬아웃 (모든 워커)
+
+    publish 는 이 워커의 구독자 큐에 넣고, 캐시의 워커 간 메시지 채널(redis 백엔드)로 다른 워커에도
+    전달한다. 구독자 큐에 넣기만 하므로 스트림 시작/종료 경로를 막지 않는다.
+
+    seq 는 발행한 워커(origin)마다 1씩 증가한다. 클라이언트는 origin 별 마지막 seq 를 기억하고
+    (snapshot 의 seqs 가 시작값) 번호를 건너뛰면 보드를 다시 조회한다. 워커 간 구독이 끊겼다
+    다시 붙으면 그 사이 변경분을 놓쳤을 수 있으므로 모든 구독자에게 resync 를 보낸다.
+    """
+
+    TOPIC = "channel_events"
+
+    def __init__(self, queue_size: int = 64, transport: Optional[CacheBackend] = None):
+        self.queue_size = queue_size
+        self.transport = transport
+        self.origin = uuid.uuid4().hex[:12]
+        self.sequence = 0
+        # origin -> 마지막으로 전달한 seq
+        self.sequences: dict[str, int] = {}
+        self._subscribers: set[ChannelSubscription] = set()
+        if transport is not None:
+            transport.on_message(self.TOPIC, self._receive)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> ChannelSubscription:
+        subscription = ChannelSubscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChannelSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def publish(self, event_type: str, channel_number: int, stream: Optional[dict[str, Any]] = None) -> None:
+        self.sequence += 1
+        self.sequences[self.origin] = self.sequence
+        shared = self.transport is not None and self.transport.shared
+        if not self._subscribers and not shared:
+            return
+        # 직렬화는 한 번만 (다른 워커에는 같은 본문을 그대로 전달)
+        message = json.dumps(
+            {
+                "type": event_type,
+                "origin": self.origin,
+                "seq": self.sequence,
+                "channel_number": channel_number,
+                "stream": stream,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        self._fan_out(message)
+        if shared:
+            await self.transport.publish(self.TOPIC, message)  # type: ignore[union-attr]
+
+    def _receive(self, payload: str) -> None:
+        if not payload:
+            for subscription in self._subscribers:
+                subscription.resync()
+            return
+        event = json.loads(payload)
+        self.sequences[event["origin"]] = event["seq"]
+        self._fan_out(payload)
+
+    def _fan_out(self, message: str) -> None:
+        for subscription in self._subscribers:
+            subscription.offer(message)
+
+
+channel_events = ChannelEventBroker(transport=cache)
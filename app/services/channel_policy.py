@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from typing import Iterable, Optional, cast
+
+from app.configs import settings
+from app.core.cache import cache
+from app.core.metrics import Counter, registry
+from app.models.user_model import User
+from app.services.channel_allocator import (
+    ChannelAllocator,
+    ChannelPools,
+    channel_pools,
+    nearest_bit,
+)
+
+logger = logging.getLogger(__name__)
+
+channel_allocations_total = registry.register(
+    Counter("ics_channel_allocations_total", "정책별 채널 배정 수", ("strategy",))
+)
+
+# 정적 배정 변경 알림 (키: user_id, "" 이면 전체 재로딩)
+CHANNEL_ASSIGNMENT_NAMESPACE = "channel_assignment"
+
+
+class ChannelAssignments:
+    """사용자 -> 정적 배정 채널(User.channel_number) 인덱스 (프로세스 메모리)
+
+    시작 시 조회 1회로 채우고, 관리자 쓰기 경로에서 invalidate_channel_assignments() 로
+    모든 워커가 해당 사용자만 다시 읽는다. 배정된 채널은 예약 비트마스크로도 유지해
+    다른 사용자의 배정에서 O(1) 로 제외한다.
+    """
+
+    def __init__(self, pools: ChannelPools):
+        self.pools = pools
+        self._by_user: dict[int, int] = {}
+        self._by_channel: dict[int, int] = {}
+        # 비트 i -> 채널 (pools.first_channel + i) 이 누군가에게 배정됨
+        self._reserved_mask = 0
+        self.loaded = False
+
+    def preferred(self, user_id: int) -> Optional[int]:
+        return self._by_user.get(user_id)
+
+    def reserved_mask(self, pool: ChannelAllocator, exclude_user: Optional[int] = None) -> int:
+        """pool 기준 비트 위치로 바꾼 예약 마스크 (exclude_user 자신의 채널은 제외)"""
+        mask = self._reserved_mask >> (pool.first_channel - self.pools.first_channel) & ((1 << pool.capacity) - 1)
+        own = self._by_user.get(exclude_user) if exclude_user is not None else None
+        if own is not None and pool.contains(own):
+            mask &= ~(1 << (own - pool.first_channel))
+        return mask
+
+    def reserved_channels(self, pool: ChannelAllocator, exclude_user: Optional[int] = None) -> list[int]:
+        """reserved_mask 와 같은 채널을 번호 목록으로 (SQL 조건용)"""
+        own = self._by_user.get(exclude_user) if exclude_user is not None else None
+        return sorted(
+            channel_number
+            for channel_number in self._by_channel
+            if channel_number != own and pool.contains(channel_number)
+        )
+
+    def assign(self, user_id: int, channel_number: Optional[int]) -> None:
+        self.remove(user_id)
+        if channel_number is None or not self.pools.contains(channel_number):
+            return
+        self._by_user[user_id] = channel_number
+        # 같은 채널이 여러 사용자에게 배정된 이전 데이터는 마지막 사용자 기준
+        self._by_channel[channel_number] = user_id
+        self._reserved_mask |= 1 << (channel_number - self.pools.first_channel)
+
+    def remove(self, user_id: int) -> None:
+        channel_number = self._by_user.pop(user_id, None)
+        if channel_number is None or self._by_channel.get(channel_number) != user_id:
+            return
+        del self._by_channel[channel_number]
+        self._reserved_mask &= ~(1 << (channel_number - self.pools.first_channel))
+
+    def load(self, rows: Iterable[tuple[int, Optional[int]]]) -> None:
+        self._by_user.clear()
+        self._by_channel.clear()
+        self._reserved_mask = 0
+        for user_id, channel_number in rows:
+            self.assign(user_id, channel_number)
+        self.loaded = True
+
+    async def reload(self, user_id: Optional[int] = None) -> None:
+        """DB 에서 다시 읽기 (user_id 가 있으면 그 사용자만)"""
+        if user_id is None:
+            self.load(await User.filter(channel_number__isnull=False).values_list("id", "channel_number"))
+            return
+        # flat=True 라 값 목록 (tortoise 타입 힌트는 튜플 목록)
+        channel_numbers = cast(
+            list[Optional[int]], await User.filter(id=user_id).values_list("channel_number", flat=True)
+        )
+        self.assign(user_id, channel_numbers[0] if channel_numbers else None)
+
+
+class ChannelPolicy:
+    """채널 배정 정책 (비트마스크 연산만 사용, 채널 수와 무관)
+
+    1. assigned: 정적 배정 채널이 비어 있으면 그 채널
+    2. nearest: 배정 채널에서 가장 가까운 빈 채널 (배정이 없으면 가장 낮은 채널),
+       다른 사용자에게 배정된 채널은 다른 빈 채널이 없을 때만 (reserved_fallback)
+    3. 우선 배정: 시설의 빈 채널이 priority_reserve 개 이하로 남으면 정적 배정 사용자만 배정
+    """
+
+    def __init__(self, assignments: ChannelAssignments, priority_reserve: int = 0):
+        self.assignments = assignments
+        self.priority_reserve = priority_reserve
+
+    def is_priority(self, user_id: int) -> bool:
+        return self.assignments.preferred(user_id) is not None
+
+    def choose(self, pool: ChannelAllocator, user_id: int) -> Optional[tuple[int, str]]:
+        """(채널 번호, 적용된 정책), 배정할 수 없으면 None (pool 상태는 바꾸지 않음)"""
+        free = pool.free_mask
+        if not free:
+            return None
+        if free.bit_count() <= self.priority_reserve and not self.is_priority(user_id):
+            return None
+
+        preferred = self.assignments.preferred(user_id)
+        if preferred is not None and pool.contains(preferred):
+            offset = preferred - pool.first_channel
+            if free >> offset & 1:
+                return preferred, "assigned"
+        else:
+            offset = 0
+
+        position = nearest_bit(free & ~self.assignments.reserved_mask(pool, exclude_user=user_id), offset)
+        if position is not None:
+            return pool.first_channel + position, "nearest"
+        position = nearest_bit(free, offset)
+        return pool.first_channel + position, "reserved_fallback"  # type: ignore[operator]
+
+    def record(self, strategy: str) -> None:
+        channel_allocations_total.inc(1, strategy)
+
+
+channel_assignments = ChannelAssignments(channel_pools)
+channel_policy = ChannelPolicy(channel_assignments, priority_reserve=settings.CHANNEL_PRIORITY_RESERVE)
+
+
+def _on_assignment_invalidated(key: str) -> None:
+    # 핸들러는 동기 호출이므로 다시 읽기는 태스크로
+    task = asyncio.get_running_loop().create_task(channel_assignments.reload(int(key) if key else None))
+    task.add_done_callback(_log_reload_failure)
+
+
+def _log_reload_failure(task: "asyncio.Task[None]") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("채널 배정 인덱스 갱신 실패", exc_info=task.exception())
+
+
+cache.on_invalidate(CHANNEL_ASSIGNMENT_NAMESPACE, _on_assignment_invalidated)
+
+
+async def invalidate_channel_assignments(user_id: Optional[int] = None) -> None:
+    """정적 배정 변경 후 호출 -> 모든 워커의 인덱스 갱신 (user_id 가 없으면 전체)"""
+    await cache.invalidate(CHANNEL_ASSIGNMENT_NAMESPACE, str(user_id) if user_id is not None else "")
@@ -1,6 +1,216 @@
-async def create_videoroom(self, room_id: int, description: str) -> dict[int, str]:
-    """Videoroom 생성 (Admin API 사용)"""
+import asyncio
+import itertools
+import json
+import uuid
+from typing import Any, Optional
 
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.typing import Subprotocol
 
-async def destroy_videoroom(self, room_id: int, description: str) -> dict[int, str]:
-    """VideoRoom 삭제 (Admin API 사용) """
\ No newline at end of file
+from app.configs import settings
+
+VIDEOROOM_PLUGIN = "janus.plugin.videoroom"
+# VideoRoom 에러 코드
+JANUS_VIDEOROOM_ERROR_NO_SUCH_ROOM = 426
+JANUS_VIDEOROOM_ERROR_ROOM_EXISTS = 427
+# 세션/핸들 만료 -> 재연결 후 재시도
+JANUS_RECONNECT_ERRORS = {458, 459}
+# 전송 오류 (시간 초과, 핸드셰이크 실패(InvalidStatus 등)/연결 종료, 소켓 오류) -> 재연결 후 재시도
+JANUS_TRANSPORT_ERRORS = (asyncio.TimeoutError, WebSocketException, OSError)
+
+
+class JanusError(Exception):
+    """Janus 요청 실패"""
+
+    def __init__(self, message: str, code: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class JanusClient:
+    """Janus VideoRoom 비동기 클라이언트 (WebSocket 1개를 모든 요청이 공유)
+
+    - 세션/VideoRoom 핸들은 연결당 한 번만 만들고 재사용
+    - keepalive 로 세션 타임아웃(기본 60초) 방지
+    - 요청마다 transaction id 로 응답을 매칭하므로 동시 요청 가능
+    - 연결이 끊기거나 시간 초과 시 재연결 후 재시도
+    """
+
+    def __init__(
+        self,
+        url: str,
+        admin_key: Optional[str] = None,
+        request_timeout: float = 5.0,
+        keepalive_interval: float = 25.0,
+        retries: int = 2,
+    ):
+        self.url = url
+        self.admin_key = admin_key
+        self.request_timeout = request_timeout
+        self.keepalive_interval = keepalive_interval
+        self.retries = retries
+        self._connection: Optional[ClientConnection] = None
+        self._session_id: Optional[int] = None
+        self._handle_id: Optional[int] = None
+        # transaction id -> (응답 future, 기대 응답 종류)
+        self._pending: dict[str, tuple[asyncio.Future[dict[str, Any]], str]] = {}
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._keepalive_task: Optional[asyncio.Task[None]] = None
+        self._connect_lock = asyncio.Lock()
+        self._transaction_ids = itertools.count()
+        self._transaction_prefix = uuid.uuid4().hex[:8]
+
+    # ---------- 연결 관리 ----------
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None and self._handle_id is not None
+
+    async def _ensure_ready(self) -> None:
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if self.connected:
+                return
+            await self._reset()
+            self._connection = await connect(
+                self.url,
+                subprotocols=[Subprotocol("janus-protocol")],
+                open_timeout=self.request_timeout,
+            )
+            self._reader_task = asyncio.create_task(self._read_loop(self._connection))
+            session = await self._send({"janus": "create"})
+            self._session_id = session["data"]["id"]
+            handle = await self._send({"janus": "attach", "plugin": VIDEOROOM_PLUGIN, "session_id": self._session_id})
+            self._handle_id = handle["data"]["id"]
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _reset(self) -> None:
+        for task in (self._keepalive_task, self._reader_task):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+        self._keepalive_task = None
+        self._reader_task = None
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection = None
+        self._session_id = None
+        self._handle_id = None
+        self._fail_pending(JanusError("Janus 연결이 종료되었습니다."))
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _read_loop(self, connection: ClientConnection) -> None:
+        try:
+            async for raw in connection:
+                message = json.loads(raw)
+                pending = self._pending.get(message.get("transaction", ""))
+                if pending is None:
+                    continue
+                future, expect = pending
+                # ack 는 비동기 요청 접수 응답이므로 실제 결과를 계속 기다림
+                if message.get("janus") == "ack" and expect != "ack":
+                    continue
+                if not future.done():
+                    future.set_result(message)
+        except (ConnectionClosed, WebSocketException):
+            pass
+        finally:
+            if self._connection is connection:
+                self._connection = None
+                self._handle_id = None
+            self._fail_pending(JanusError("Janus 연결이 종료되었습니다."))
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self._send({"janus": "keepalive", "session_id": self._session_id}, expect="ack")
+            except (JanusError, *JANUS_TRANSPORT_ERRORS):
+                # 다음 요청에서 재연결
+                self._handle_id = None
+                return
+
+    async def close(self) -> None:
+        async with self._connect_lock:
+            await self._reset()
+
+    # ---------- 요청 ----------
+
+    async def _send(self, payload: dict[str, Any], expect: str = "success") -> dict[str, Any]:
+        if self._connection is None:
+            raise JanusError("Janus 에 연결되어 있지 않습니다.")
+        transaction = f"{self._transaction_prefix}-{next(self._transaction_ids)}"
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[transaction] = (future, expect)
+        try:
+            await self._connection.send(json.dumps({**payload, "transaction": transaction}))
+            response = await asyncio.wait_for(future, timeout=self.request_timeout)
+        finally:
+            self._pending.pop(transaction, None)
+        if response.get("janus") != expect:
+            error = response.get("error", {})
+            raise JanusError(error.get("reason", f"Janus 응답 오류: {response}"), error.get("code"))
+        return response
+
+    async def _videoroom_request(self, body: dict[str, Any]) -> dict[str, Any]:
+        """VideoRoom 요청, 실패는 모두 JanusError (전송 오류는 재시도 후)"""
+        if self.admin_key:
+            body = {**body, "admin_key": self.admin_key}
+        last_error: Exception = JanusError("Janus 요청 실패")
+        for attempt in range(self.retries + 1):
+            try:
+                await self._ensure_ready()
+                response = await self._send(
+                    {"janus": "message", "session_id": self._session_id, "handle_id": self._handle_id, "body": body}
+                )
+                data: dict[str, Any] = response["plugindata"]["data"]
+                if "error_code" in data:
+                    raise JanusError(data.get("error", "VideoRoom 요청 실패"), data["error_code"])
+                return data
+            except JANUS_TRANSPORT_ERRORS as e:
+                last_error = e
+            except JanusError as e:
+                if e.code is not None and e.code not in JANUS_RECONNECT_ERRORS:
+                    # 플러그인 에러는 재시도해도 같은 결과
+                    raise
+                last_error = e
+            except (KeyError, TypeError, ValueError) as e:
+                # 형식이 맞지 않는 응답
+                raise JanusError(f"Janus 응답 형식 오류: {e!r}") from e
+            self._handle_id = None
+            await asyncio.sleep(0.05 * (attempt + 1))
+        raise JanusError(f"Janus 요청 실패: {last_error}")
+
+    async def create_videoroom(self, room_id: int, description: str) -> dict[str, Any]:
+        """VideoRoom 생성"""
+        return await self._videoroom_request(
+            {"request": "create", "room": room_id, "description": description, "permanent": False, "publishers": 1}
+        )
+
+    async def destroy_videoroom(self, room_id: int) -> dict[str, Any]:
+        """VideoRoom 삭제 (없는 방이면 무시)"""
+        try:
+            return await self._videoroom_request({"request": "destroy", "room": room_id, "permanent": False})
+        except JanusError as e:
+            if e.code == JANUS_VIDEOROOM_ERROR_NO_SUCH_ROOM:
+                return {"videoroom": "destroyed", "room": room_id}
+            raise
+
+    async def list_participants(self, room_id: int) -> list[dict[str, Any]]:
+        """VideoRoom 참여자 목록 (없는 방이면 JanusError code 426)"""
+        data = await self._videoroom_request({"request": "listparticipants", "room": room_id})
+        participants: list[dict[str, Any]] = data.get("participants", [])
+        return participants
+
+
+janus_client = JanusClient(
+    url=settings.JANUS_WS_URL,
+    admin_key=settings.JANUS_ADMIN_KEY,
+    request_timeout=settings.JANUS_REQUEST_TIMEOUT_SECONDS,
+)
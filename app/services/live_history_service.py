@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
+
+from app.configs import settings
+from app.core.db_routing import read_routing
+from app.dtos.live.live_response import LiveHistoryListResponse, LiveHistoryResponse
+from app.models.live_history_model import LiveHistoryArchiveModel, LiveHistoryModel
+from app.services.pagination import decode_cursor, encode_cursor, invalid_cursor
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FIELDS = (
+    "id",
+    "user_id",
+    "username",
+    "full_name",
+    "channel_number",
+    "janus_room_id",
+    "stream_category",
+    "stream_title",
+    "stream_description",
+    "tags",
+    "is_public",
+    "quality_setting",
+    "started_at",
+    "ended_at",
+    "duration",
+    "end_reason",
+)
+
+
+class HistoryArchiver:
+    """보존 기간이 지난 live_histories 행을 live_history_archives 로 배치 이동하는 백그라운드 작업
+
+    - 배치마다 짧은 트랜잭션 1개 (조회 FOR UPDATE SKIP LOCKED -> 아카이브 INSERT -> 원본 DELETE)
+    - 아카이브 id 는 원본 id 그대로라 여러 워커가 동시에 돌아도 중복 행이 생기지 않음
+    - archive_retention_months 가 있으면 그보다 오래된 월은 아카이브에서도 삭제
+    """
+
+    def __init__(
+        self,
+        retention_days: int,
+        archive_retention_months: Optional[int] = None,
+        batch_size: int = 1000,
+        interval: float = 3600.0,
+    ):
+        self.retention_days = retention_days
+        self.archive_retention_months = archive_retention_months
+        self.batch_size = batch_size
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def archive_batch(self, cutoff: datetime) -> int:
+        """cutoff 이전에 종료된 이력 최대 batch_size 행 이동, 이동한 행 수"""
+        async with in_transaction("default") as connection:
+            rows = await (
+                LiveHistoryModel.filter(ended_at__lt=cutoff)
+                .using_db(connection)
+                .select_for_update(skip_locked=True)
+                .order_by("id")
+                .limit(self.batch_size)
+            )
+            if not rows:
+                return 0
+            await LiveHistoryArchiveModel.bulk_create(
+                [LiveHistoryArchiveModel.from_history(row) for row in rows],
+                ignore_conflicts=True,
+                using_db=connection,
+            )
+            await LiveHistoryModel.filter(id__in=[row.id for row in rows]).using_db(connection).delete()
+        return len(rows)
+
+    async def purge_archive(self, now: datetime) -> int:
+        """아카이브 보존 개월 수를 넘긴 월 삭제 (archive_month 인덱스)"""
+        if not self.archive_retention_months:
+            return 0
+        months = now.year * 12 + now.month - 1 - self.archive_retention_months
+        oldest_kept = (months // 12) * 100 + months % 12 + 1
+        return await LiveHistoryArchiveModel.filter(archive_month__lt=oldest_kept).delete()
+
+    async def run_once(self) -> int:
+        """보존 기간이 지난 이력을 모두 이동 (배치 사이에 이벤트 루프 양보)"""
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=self.retention_days)
+        moved = 0
+        while True:
+            count = await self.archive_batch(cutoff)
+            moved += count
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(0)
+        purged = await self.purge_archive(now)
+        if moved or purged:
+            logger.info("스트림 이력 아카이브", extra={"moved": moved, "purged": purged})
+        return moved
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("스트림 이력 아카이브 실패")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+history_archiver = HistoryArchiver(
+    retention_days=settings.LIVE_HISTORY_RETENTION_DAYS,
+    archive_retention_months=settings.LIVE_HISTORY_ARCHIVE_RETENTION_MONTHS,
+    batch_size=settings.LIVE_HISTORY_ARCHIVE_BATCH_SIZE,
+    interval=settings.LIVE_HISTORY_ARCHIVE_INTERVAL_SECONDS,
+)
+
+
+def _history_page(queryset: QuerySet[Any], limit: int, after: Optional[tuple[datetime, int]]) -> QuerySet[Any]:
+    if after is not None:
+        started_at, last_id = after
+        queryset = queryset.filter(Q(started_at__lt=started_at) | Q(started_at=started_at, id__lt=last_id))
+    return queryset.order_by("-started_at", "-id").limit(limit + 1)
+
+
+async def service_get_stream_history(
+    user_id: Optional[int] = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> LiveHistoryListResponse:
+    """종료된 스트림 이력 (최근 이력 + 아카이브를 합쳐 started_at DESC 키셋 페이지)
+
+    두 테이블 모두 (user_id, started_at) 인덱스로 limit+1 행씩만 읽어 병합한다.
+    """
+    filters: dict[str, Any] = {}
+    if user_id is not None:
+        filters["user_id"] = user_id
+    if started_from is not None:
+        filters["started_at__gte"] = started_from
+    if started_to is not None:
+        filters["started_at__lt"] = started_to
+
+    after = None
+    if cursor:
+        started_at, last_id = decode_cursor(cursor, 2)
+        try:
+            after = (datetime.fromisoformat(started_at), int(last_id))
+        except (TypeError, ValueError):
+            raise invalid_cursor()
+
+    # 복제본 허용 (스트림 종료 직후에는 primary, 종료 시 채널 보드가 무효화됨)
+    with read_routing.reads("channel_board"):
+        recent, archived = await asyncio.gather(
+            _history_page(LiveHistoryModel.filter(**filters), limit, after).values(*HISTORY_FIELDS),
+            _history_page(LiveHistoryArchiveModel.filter(**filters), limit, after).values(*HISTORY_FIELDS),
+        )
+    rows = sorted([*recent, *archived], key=lambda row: (row["started_at"], row["id"]), reverse=True)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["started_at"], rows[-1]["id"])
+    return LiveHistoryListResponse(
+        histories=[LiveHistoryResponse.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
+    )
@@ -1,189 +1,493 @@
+import asyncio
+import logging
+import time
+from typing import Any, Optional, Union
+
 from tortoise.exceptions import IntegrityError
+from pydantic import BaseModel
+from tortoise.expressions import Q
 
 from app.models.live_model import LiveModel
+from app.models.live_history_model import LiveHistoryModel
 from app.models.user_model import User
 from app.dtos.live.live_request import LiveStreamCreateRequest, LiveStreamUpdateRequest
 from app.dtos.live.live_response import (
     LiveStreamResponse,
     AllChannelResponse,
+    AllChannelSummaryResponse,
     LiveStreamListResponse,
+    LiveStreamSummary,
+    LiveStreamSummaryListResponse,
+    ResponseView,
     StreamStartResponse,
     StreamStopResponse,
     StreamUpdateResponse,
+    StreamHeartbeatResponse,
     ChannelInfo,
+    FacilityInfo,
+    FacilityListResponse,
 )
+from app.configs import settings
+from app.core.cache import cache
+from app.core.db_routing import read_routing
+from app.core.metrics import Counter, channel_acquire_seconds, registry
+from app.services.channel_allocator import channel_pools
+from app.services.channel_backends import channel_backend
+from app.services.channel_board import FULL_VIEW, ChannelBoard
+from app.services.channel_events import channel_events
+from app.services.pagination import decode_cursor, encode_cursor, invalid_cursor
+from app.services.room_id_pool import RoomIdTaken, room_id_pool
 from fastapi import HTTPException, status
-import requests
-from datetime import datetime, timezone
-from asyncio import Lock
+from datetime import datetime, timedelta, timezone
 from tortoise.transactions import in_transaction
-import asyncio
-import random
 
+logger = logging.getLogger(__name__)
+
+streams_reaped_total = registry.register(
+    Counter("ics_live_streams_reaped_total", "heartbeat 만료로 종료된 스트림 수")
+)
 
-# 어플리케이션 레벨 Lock
-channel_allocation_lock = Lock()
 
+async def service_start_stream(user: User, data: LiveStreamCreateRequest) -> dict[str, Any]:
+    """라이브 스트림 시작 (채널 할당 백엔드 + DB 유니크 제약으로 점유 확인)
 
-async def service_start_stream(user_id: int, data: LiveStreamCreateRequest):
-    """라이브 스트림 시작 (이중 Lock 적용 추가)"""
+    user 는 인증 단계에서 이미 조회한 객체를 그대로 사용 (재조회 없음).
+    - 신규: 기존 스트림 조회 1회 + 트랜잭션(채널 점유, INSERT)
+    - 재시작: 기존 스트림 조회 1회 + 트랜잭션(이력 INSERT, 같은 행 UPDATE), 채널은 그대로 유지
+    """
+    user_id = user.id
     try:
-        # 애플리케이션 레벨 동시성 제어
-        async with channel_allocation_lock:
-            print(f"[{user_id}] 채널 할당 Lock 획득")
+        # 사용자당 활성 스트림은 최대 1개 (lives.user_id 유니크)
+        old_stream = await LiveModel.filter(user_id=user_id).first()
+        janus_room_id = await get_available_room_id()
 
-            # 재시도 로직 추가
-            max_retries = 3
-            for attempt in range(max_retries):
+        try:
+            old_room_id = old_stream.janus_room_id if old_stream is not None else None
+            for _ in range(MAX_ROOM_ID_ATTEMPTS):
                 try:
-                    # 데이터 베이스 트랜잭션 보호
-                    async with in_transaction() as connection:
-                        print(f"[{user_id}] 데이터베이스 트랜잭션 시작 (시도 {attempt + 1})")
-
-                        user = await User.get_one_by_id(user_id)
-
-                        # 기존 스트림 종료
-                        existing_streams = await LiveModel.filter(user_id=user_id, is_active=True)
-                        if existing_streams:
-                            print(f"기존 스트림 종료: {existing_streams}")
-                            print(f"[{user_id}] 기존 스트림 삭제: {len(existing_streams)}개")
-                            await LiveModel.filter(user_id=user_id, is_active=True).delete()
-
-                        # 최소한의 트랜잭션(DB 작업만)
-                        async with in_transaction():
-                            print(f"[{user_id}] 최소 트랜잭션 시작")
-
-                            # 사용 중인 채널 확인
-                            used_channels = await LiveModel.filter(is_active=True).values_list("channel_number", flat=True)
-                            used_set = set(used_channels)
-                            print(f"[{user_id}] 사용 중인 채널: {used_set}")
-
-
-                            # 사용 가능한 채널
-                            channel_number = None
-                            for i in range(1, 17):
-                                if i not in used_set:
-                                    channel_number = i
-                                    break
-
-                            if not channel_number:
-                                raise HTTPException(
-                                    status_code=status.HTTP_400_BAD_REQUEST,
-                                    detail="모든 채널이 사용 중 입니다."
-                                )
-
-                            janus_room_id = 1002
-                            print(f"할당된 채널: {channel_number}, room_id: {janus_room_id}")
-
-                            # 유니크 제약 조건 회피
-                            existing_channel = await LiveModel.filter(channel_number=channel_number, is_active=True).first()
-
-                            if existing_channel:
-                                print(f"[{user_id}] 채널 {channel_number} 이미 사용 중, 재시도")
-
-                                continue
-
-                            live_stream = await LiveModel.create(
-                                user=user,
-                                username=user.username,
-                                full_name=user.full_name,
-                                channel_number=channel_number,
-                                janus_room_id=janus_room_id,
-                                stream_title=data.stream_title,
-                                stream_description=data.stream_description,
-                                stream_category=data.stream_category,
-                                tags=data.tags,
-                                is_public=data.is_public,
-                                quality_setting=data.quality_setting,
-                            )
-
-                            print(f"[{user_id}] 스트림 생성 완료 - 채널 {channel_number}")
-
-                        return {
-                            "success": True,
-                            "message": f"채널 {channel_number}에서 스트림이 시작되었습니다.",
-                            "stream": {
-                                "channel_number": live_stream.channel_number,
-                                "janus_room_id": live_stream.janus_room_id,
-                                "stream_title": live_stream.stream_title,
-                                "stream_description": live_stream.stream_description,
-                                "stream_category": live_stream.stream_category,
-                                "tags": live_stream.tags,
-                                "is_public": live_stream.is_public,
-                            }
-                        }
-
-                except IntegrityError as e:
-                    if "Duplicate entry" in str(e) and attempt < max_retries - 1:
-                        print(f"[{user_id}] 유니크 제약 조건 위반, 재시도 {attempt + 1}")
-                        await asyncio.sleep(0.1 * (attempt + 1))
-                        continue
+                    if old_stream is not None:
+                        live_stream = await _restart_stream(old_stream, janus_room_id, data)
                     else:
-                        raise e
+                        live_stream = await _create_stream(user, janus_room_id, data)
+                    break
+                except RoomIdTaken:
+                    # 다른 워커가 같은 id 로 먼저 시작 -> DB 의 최대 id 다음부터 다시 발급
+                    await room_id_pool.skip(janus_room_id)
+                    janus_room_id = await get_available_room_id()
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="사용 가능한 방 번호가 없습니다."
+                )
+            room_id_pool.confirm(janus_room_id)
+            await _invalidate_board(live_stream.channel_number)
+        except BaseException:
+            room_id_pool.release(janus_room_id)
+            raise
+
+        channel_number = live_stream.channel_number
+        if old_room_id is not None:
+            await _close_room(user_id, old_room_id)
+
+        if settings.JANUS_ENABLED:
+            # DB 커밋 후 방 생성 (트랜잭션을 네트워크 대기 동안 잡고 있지 않음)
+            await _open_room(live_stream)
+
+        logger.info(
+            "스트림 시작", extra={"user_id": user_id, "channel": channel_number, "room_id": live_stream.janus_room_id}
+        )
 
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="채널 할당 중 충돌이 발생했습니다. 잠시 후 기다려주세요."
-            )
+        await channel_events.publish("started", channel_number, stream=_stream_info(live_stream, owner=True))
+
+        return {
+            "success": True,
+            "message": f"채널 {channel_number}에서 스트림이 시작되었습니다.",
+            "stream": _stream_info(live_stream),
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"예상치 못한 에러: {e}")
-        print(f"에러 타입: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("스트림 시작 실패", extra={"user_id": user_id})
         raise HTTPException (
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"스트림 시작 실패: {str(e)}"
         )
 
-async def service_stop_stream(user_id: int):
-    """라이브 스트림 종료 - 트랜잭션 적용"""
+
+async def _create_stream(user: User, janus_room_id: int, data: LiveStreamCreateRequest) -> LiveModel:
+    """사용자 시설 풀에서 배정 정책(정적 채널 우선)으로 채널 점유 + 활성 스트림 INSERT 를 하나의 트랜잭션으로"""
+    if (user.facility or channel_pools.default_facility) not in channel_pools.pools:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="등록되지 않은 시설입니다."
+        )
+    while True:
+        acquired = None
+        try:
+            async with in_transaction("default") as connection:
+                acquire_started = time.perf_counter()
+                acquired = await channel_backend.acquire(user.id, connection, user.facility)
+                channel_acquire_seconds.observe(time.perf_counter() - acquire_started, channel_backend.name)
+                if acquired is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="모든 채널이 사용 중 입니다."
+                    )
+                logger.debug("채널 할당", extra={"user_id": user.id, "channel": acquired})
+
+                live_stream = await LiveModel.create(
+                    user_id=user.id,
+                    username=user.username,
+                    full_name=user.full_name,
+                    channel_number=acquired,
+                    active_channel=acquired,
+                    janus_room_id=janus_room_id,
+                    stream_title=data.stream_title,
+                    stream_description=data.stream_description,
+                    stream_category=data.stream_category,
+                    tags=data.tags,
+                    is_public=data.is_public,
+                    quality_setting=data.quality_setting,
+                    last_heartbeat_at=datetime.now(timezone.utc),
+                    using_db=connection,
+                )
+        except IntegrityError:
+            if await LiveModel.filter(user_id=user.id).exists():
+                # 같은 사용자의 동시 시작 요청 -> 먼저 커밋된 쪽만 유효
+                channel_backend.rollback(acquired)
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="이미 스트림 시작을 처리 중입니다."
+                )
+            if acquired is not None and await LiveModel.filter(active_channel=acquired).exists():
+                # 로컬 백엔드를 여러 워커에서 쓸 때만 발생: 다른 워커가 먼저 점유한 채널 -> 사용 중으로 두고 다음 채널로
+                logger.debug("채널 이미 사용 중, 다음 채널 시도", extra={"user_id": user.id, "channel": acquired})
+                channel_backend.conflict(acquired)
+                continue
+            channel_backend.rollback(acquired)
+            if await LiveModel.filter(janus_room_id=janus_room_id).exists():
+                raise RoomIdTaken(janus_room_id)
+            # 채널/사용자/room id 충돌이 아닌 제약 위반 (다른 워커에서 삭제된 캐시 사용자의 FK 등) -> 재시도하지 않음
+            raise
+        except BaseException:
+            channel_backend.rollback(acquired)
+            raise
+
+        channel_backend.commit(acquired)
+        return live_stream
+
+
+def _stream_info(live_stream: LiveModel, owner: bool = False) -> dict[str, Any]:
+    """시작 응답/채널 이벤트용 스트림 정보 (owner 면 송출자 이름 포함)"""
+    stream = {
+        "channel_number": live_stream.channel_number,
+        "janus_room_id": live_stream.janus_room_id,
+        "stream_title": live_stream.stream_title,
+        "stream_description": live_stream.stream_description,
+        "stream_category": live_stream.stream_category,
+        "tags": live_stream.tags,
+        "is_public": live_stream.is_public,
+    }
+    if owner:
+        stream["username"] = live_stream.username
+        stream["full_name"] = live_stream.full_name
+    return stream
+
+
+async def _restart_stream(live_stream: LiveModel, janus_room_id: int, data: LiveStreamCreateRequest) -> LiveModel:
+    """재시작: 이전 방송을 이력으로 남기고 같은 행(같은 채널)을 새 방송 정보로 갱신"""
+    now = datetime.now(timezone.utc)
+    history = LiveHistoryModel.from_live(live_stream, now, end_reason="restarted")
+    fields = {
+        "janus_room_id": janus_room_id,
+        "stream_title": data.stream_title,
+        "stream_description": data.stream_description,
+        "stream_category": data.stream_category,
+        "tags": data.tags,
+        "is_public": data.is_public,
+        "quality_setting": data.quality_setting,
+        "started_at": now,
+        "last_heartbeat_at": now,
+        "modified_at": now,
+    }
     try:
-        async with in_transaction():
-            live_stream = await LiveModel.filter(user_id=user_id, is_active=True).first()
+        async with in_transaction("default") as connection:
+            await history.save(using_db=connection)
+            await LiveModel.filter(id=live_stream.id).using_db(connection).update(**fields)
+    except IntegrityError:
+        if await LiveModel.filter(janus_room_id=janus_room_id).exists():
+            raise RoomIdTaken(janus_room_id)
+        raise
+    for key, value in fields.items():
+        setattr(live_stream, key, value)
+    return live_stream
+
+
+# 다른 워커와 room id 가 겹칠 때 재발급 횟수 (Janus 방 생성 / lives 유니크 제약)
+MAX_ROOM_CREATE_ATTEMPTS = 3
+MAX_ROOM_ID_ATTEMPTS = 3
+
+
+async def _open_room(live_stream: LiveModel) -> None:
+    """Janus 방 생성, 다른 워커가 이미 쓰는 id 면 새 id 로 교체 후 재시도"""
+    # Janus(websockets) 는 JANUS_ENABLED 일 때만 import
+    from app.services.janus_service import (
+        JANUS_VIDEOROOM_ERROR_ROOM_EXISTS,
+        JanusError,
+        janus_client,
+    )
+
+    for _ in range(MAX_ROOM_CREATE_ATTEMPTS):
+        try:
+            await janus_client.create_videoroom(
+                live_stream.janus_room_id, description=f"채널 {live_stream.channel_number}"
+            )
+            return
+        except JanusError as e:
+            if e.code == JANUS_VIDEOROOM_ERROR_ROOM_EXISTS:
+                room_id_pool.mark_used(live_stream.janus_room_id)
+                room_id = await get_available_room_id()
+                try:
+                    await LiveModel.filter(id=live_stream.id).update(janus_room_id=room_id)
+                except IntegrityError:
+                    # 새 id 도 다른 워커가 lives 에서 사용 중
+                    await room_id_pool.skip(room_id)
+                    continue
+                except BaseException:
+                    room_id_pool.release(room_id)
+                    raise
+                room_id_pool.confirm(room_id)
+                live_stream.janus_room_id = room_id
+                continue
+            logger.warning(
+                "Janus 방 생성 실패",
+                extra={"user_id": live_stream.user_id, "room_id": live_stream.janus_room_id, "error": str(e), "code": e.code},
+            )
+            break
+
+    await service_stop_stream(live_stream.user_id)
+    raise HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail="미디어 서버 방 생성에 실패했습니다."
+    )
+
+
+async def _close_room(user_id: int, room_id: int) -> None:
+    """Janus 방 삭제 후 room id 반환 (예외를 올리지 않음, 실패해도 스트림 종료 결과는 그대로)
+
+    방이 남아 있어도 id 는 반환한다: 같은 id 를 다시 받으면 _open_room 이 ROOM_EXISTS 로 새 id 를 받는다.
+    """
+    try:
+        if settings.JANUS_ENABLED:
+            from app.services.janus_service import janus_client
+
+            await janus_client.destroy_videoroom(room_id)
+    except Exception as e:
+        logger.warning(
+            "Janus 방 삭제 실패",
+            extra={"user_id": user_id, "room_id": room_id, "error": str(e), "code": getattr(e, "code", None)},
+        )
+    finally:
+        room_id_pool.release(room_id)
+
+
+async def service_stop_stream(user_id: int) -> Union[StreamStopResponse, dict[str, Any]]:
+    """라이브 스트림 종료 -> 이력 추가 + 활성 행 삭제를 하나의 트랜잭션으로"""
+    try:
+        async with in_transaction("default") as connection:
+            live_stream = await LiveModel.filter(user_id=user_id).using_db(connection).first()
 
             if not live_stream:
                 return {"success": False, "message": "활성 스트림이 없습니다."}
 
-            # 스트림 종료
-            live_stream.is_active = False
-            live_stream.ended_at = datetime.now(timezone.utc)
-            await live_stream.save()
+            history = await live_stream.stop_stream(using_db=connection)
+            await channel_backend.release(live_stream.channel_number, connection)
 
-            print(f"[{user_id}] 채널 {live_stream.channel_number} 스트림 종료 완료")
+        channel_backend.commit(None, released=[live_stream.channel_number])
+        await _invalidate_board(live_stream.channel_number)
+        await channel_events.publish("stopped", live_stream.channel_number)
+        logger.info("스트림 종료", extra={"user_id": user_id, "channel": live_stream.channel_number})
 
-            return StreamStopResponse(
-                success=True,
-                message="스트림이 종료되었습니다.",
-                duration=live_stream.duration or 0,
-            )
+        await _close_room(user_id, live_stream.janus_room_id)
+
+        return StreamStopResponse(
+            success=True,
+            message="스트림이 종료되었습니다.",
+            duration=history.duration,
+        )
 
     except Exception as e:
-        print(f"Stop 에러: {e}")
+        logger.exception("스트림 종료 실패", extra={"user_id": user_id})
         return {"success": False, "message": f"종료 실패: {str(e)}"}
 
 
-async def get_available_room_id() -> int:
-    """사용 가능한 room_id 찾기"""
-    used_room_ids = await LiveModel.all().values_list("janus_room_id", flat=True)
-    used_set = set(used_room_ids)
+async def service_heartbeat_stream(user_id: int) -> StreamHeartbeatResponse:
+    """스트리머 heartbeat -> 활성 스트림의 last_heartbeat_at 갱신 (UPDATE 1회)"""
+    updated = await LiveModel.filter(user_id=user_id).update(last_heartbeat_at=datetime.now(timezone.utc))
+    if not updated:
+        # 이미 종료됐거나 reaper 가 만료 처리한 스트림 -> 클라이언트는 다시 시작해야 함
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="활성 스트림이 없습니다."
+        )
+    return StreamHeartbeatResponse(success=True, timeout_seconds=settings.LIVE_HEARTBEAT_TIMEOUT_SECONDS)
+
+
+class StreamReaper:
+    """heartbeat 가 끊긴 스트림(브라우저 종료 등)을 주기적으로 종료해 채널을 반환하는 백그라운드 작업
+
+    - 조회 1회로 만료 후보를 찾고, Janus 사용 시 방에 송출자가 남아 있는 스트림은 heartbeat 만 갱신
+      (heartbeat 를 보내지 않는 이전 클라이언트도 송출 중이면 유지)
+    - 만료 처리는 배치마다 트랜잭션 1개: 이력 일괄 INSERT -> lives 일괄 DELETE -> 채널 일괄 반환
+    - 트랜잭션 안에서 heartbeat 를 다시 확인하므로 그 사이 도착한 heartbeat 는 반영됨
+    """
+
+    def __init__(self, timeout: float, interval: float = 30.0, batch_size: int = 100):
+        self.timeout = timeout
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @staticmethod
+    def _expired(cutoff: datetime) -> Q:
+        # heartbeat 컬럼 추가 이전 행은 시작 시각 기준
+        return Q(last_heartbeat_at__lt=cutoff) | Q(last_heartbeat_at__isnull=True, started_at__lt=cutoff)
+
+    async def _publishing_rooms(self, room_ids: list[int]) -> set[int]:
+        """송출자가 있는 Janus 방 (조회 실패한 방은 heartbeat 만으로 판단)"""
+        from app.services.janus_service import (
+            JANUS_VIDEOROOM_ERROR_NO_SUCH_ROOM,
+            JanusError,
+            janus_client,
+        )
 
-    for room_id in range(1001, 10000):
-        if room_id not in used_set:
-            return room_id
+        async def has_publisher(room_id: int) -> bool:
+            try:
+                participants = await janus_client.list_participants(room_id)
+            except JanusError as e:
+                if e.code != JANUS_VIDEOROOM_ERROR_NO_SUCH_ROOM:
+                    logger.warning("Janus 참여자 조회 실패", extra={"room_id": room_id, "error": str(e), "code": e.code})
+                return False
+            return any(participant.get("publisher") for participant in participants)
+
+        results = await asyncio.gather(*(has_publisher(room_id) for room_id in room_ids))
+        return {room_id for room_id, alive in zip(room_ids, results) if alive}
+
+    async def reap_batch(self, now: datetime) -> int:
+        """만료 후보 최대 batch_size 개 처리, 처리한 수 (종료 + 송출 중이라 유지)"""
+        cutoff = now - timedelta(seconds=self.timeout)
+        candidates = await (
+            LiveModel.filter(self._expired(cutoff)).order_by("id").limit(self.batch_size).values_list("id", "janus_room_id")
+        )
+        if not candidates:
+            return 0
+
+        expired_ids = [live_id for live_id, _ in candidates]
+        refreshed = 0
+        if settings.JANUS_ENABLED:
+            publishing = await self._publishing_rooms([room_id for _, room_id in candidates])
+            alive_ids = {live_id for live_id, room_id in candidates if room_id in publishing}
+            if alive_ids:
+                refreshed = await LiveModel.filter(id__in=list(alive_ids)).update(last_heartbeat_at=now)
+                expired_ids = [live_id for live_id in expired_ids if live_id not in alive_ids]
+            if not expired_ids:
+                return refreshed
+
+        async with in_transaction("default") as connection:
+            streams = await (
+                LiveModel.filter(self._expired(cutoff), id__in=expired_ids)
+                .using_db(connection)
+                .select_for_update(skip_locked=True)
+            )
+            if streams:
+                ended_at = datetime.now(timezone.utc)
+                await LiveHistoryModel.bulk_create(
+                    [LiveHistoryModel.from_live(stream, ended_at, end_reason="expired") for stream in streams],
+                    using_db=connection,
+                )
+                await LiveModel.filter(id__in=[stream.id for stream in streams]).using_db(connection).delete()
+                await channel_backend.release_many([stream.channel_number for stream in streams], connection)
+        if not streams:
+            # 다른 워커가 처리 중이거나 그 사이 heartbeat 가 도착
+            return refreshed
+
+        channel_backend.commit(None, released=[stream.channel_number for stream in streams])
+        await _invalidate_board(*(stream.channel_number for stream in streams))
+        streams_reaped_total.inc(len(streams))
+        for stream in streams:
+            await channel_events.publish("stopped", stream.channel_number)
+            logger.info(
+                "스트림 만료 종료", extra={"user_id": stream.user_id, "channel": stream.channel_number, "room_id": stream.janus_room_id}
+            )
+        await asyncio.gather(*(_close_room(stream.user_id, stream.janus_room_id) for stream in streams))
+        return refreshed + len(streams)
+
+    async def run_once(self) -> None:
+        """만료 후보가 batch_size 보다 많으면 배치를 반복 (배치 사이에 이벤트 루프 양보)"""
+        now = datetime.now(timezone.utc)
+        while await self.reap_batch(now) >= self.batch_size:
+            await asyncio.sleep(0)
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("스트림 만료 처리 실패")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+stream_reaper = StreamReaper(
+    timeout=settings.LIVE_HEARTBEAT_TIMEOUT_SECONDS,
+    interval=settings.LIVE_REAPER_INTERVAL_SECONDS,
+    batch_size=settings.LIVE_REAPER_BATCH_SIZE,
+)
 
 
-async def service_get_all_channels() -> AllChannelResponse:
-    """전체 채널 정보 조회 -> 관리자용 16채널 모니터링"""
+async def get_available_room_id() -> int:
+    """사용 가능한 room_id (활성 방만 추적하는 풀에서 발급)"""
+    room_id = room_id_pool.acquire()
+    if room_id is None:
+        # 다른 워커에서 반환된 방이 있을 수 있으므로 재동기화 후 1회 더
+        await room_id_pool.reconcile()
+        room_id = room_id_pool.acquire()
+    if room_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="사용 가능한 방 번호가 없습니다."
+        )
+    return room_id
+
+
+async def service_get_all_channels(facility: str, page: int, first_channel: int, last_channel: int) -> AllChannelResponse:
+    """채널 보드 한 페이지 (시설의 first_channel-last_channel 구간만 조회)"""
     try:
-        active_streams = await LiveModel.filter(is_active=True).all()
+        # 복제본 허용 (이 페이지의 채널이 최근에 바뀌었으면 primary)
+        with read_routing.reads(CHANNEL_BOARD_NAMESPACE, f"{facility}:{page}"):
+            active_streams = await LiveModel.filter(
+                channel_number__gte=first_channel,
+                channel_number__lte=last_channel,
+                is_active=True,
+            ).all()
 
         channel_map = {stream.channel_number: stream for stream in active_streams}
 
         channels = []
-        for i in range(1, 17):
+        for i in range(first_channel, last_channel + 1):
             stream = channel_map.get(i)
 
             try:
@@ -203,7 +507,7 @@ async def service_get_all_channels() -> AllChannelResponse:
                     )
 
             except Exception as e:
-                print(f"채널 {i} 처리 중 오류: {e}")
+                logger.warning("채널 정보 변환 실패", extra={"channel": i, "error": str(e)})
                 channel_info = ChannelInfo(
                     channel_number=i,
                     is_active=False,
@@ -214,32 +518,252 @@ async def service_get_all_channels() -> AllChannelResponse:
 
         return AllChannelResponse(
             channels=channels,
-            total_channels=16,
+            total_channels=channel_pools.pool(facility).capacity,
             active_channels=len(active_streams),
+            facility=facility,
+            page=page,
+            page_count=channel_board.page_count(facility),
         )
 
     except Exception as e:
-        print(f"service_get_all_channels 전체 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("채널 보드 조회 실패", extra={"facility": facility, "page": page})
         raise
 
 
-# 공개 스트림 조회 => 추후
-# 카테고리별 스트림 조회 => 추후
+def _summarize_board(board: BaseModel) -> AllChannelSummaryResponse:
+    """채널 보드 -> 요약 보드 (타일 표시에 필요한 필드만)"""
+    return AllChannelSummaryResponse.model_validate(board, from_attributes=True)
+
+
+# 폴링용 채널 보드 (시설/페이지별 스냅샷, 바뀐 채널의 페이지만 무효화, 공유 캐시면 워커 간 본문 공유)
+CHANNEL_BOARD_NAMESPACE = "channel_board"
+channel_board = ChannelBoard(
+    service_get_all_channels,
+    channel_pools,
+    page_size=settings.CHANNEL_BOARD_PAGE_SIZE,
+    max_age=settings.CHANNEL_BOARD_MAX_AGE_SECONDS,
+    shared=cache if cache.shared else None,
+    namespace=CHANNEL_BOARD_NAMESPACE,
+    views={"summary": _summarize_board},
+)
+cache.on_invalidate(CHANNEL_BOARD_NAMESPACE, channel_board.invalidate)
+
+
+async def _invalidate_board(*channel_numbers: int) -> None:
+    """채널이 속한 보드 페이지만 모든 워커에서 무효화"""
+    for key in {channel_board.window_key(channel_number) for channel_number in channel_numbers}:
+        if key is not None:
+            await cache.invalidate(CHANNEL_BOARD_NAMESPACE, key)
+
+
+async def service_get_channel_board(
+    facility: Optional[str] = None, page: int = 0, view: ResponseView = FULL_VIEW
+) -> tuple[bytes, str]:
+    """채널 보드 페이지 직렬화 결과 (JSON bytes, ETag), 시설이 없으면 기본 시설"""
+    facility = facility or channel_pools.default_facility
+    if facility not in channel_pools.pools:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="등록되지 않은 시설입니다."
+        )
+    if page >= channel_board.page_count(facility):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 페이지입니다."
+        )
+    return await channel_board.get(facility, page, view)
+
+
+async def service_get_facilities() -> FacilityListResponse:
+    """설정된 시설(채널 풀) 목록"""
+    return FacilityListResponse(
+        facilities=[
+            FacilityInfo(
+                name=name,
+                first_channel=pool.first_channel,
+                last_channel=pool.last_channel,
+                total_channels=pool.capacity,
+                page_count=channel_board.page_count(name),
+            )
+            for name, pool in channel_pools.pools.items()
+        ]
+    )
+
+
+# ==========스트림 목록 (키셋 페이지네이션)==========
+
+# 목록 응답에 필요한 컬럼만 조회 (모델 인스턴스 생성 없이 dict 로)
+STREAM_LIST_FIELDS = (
+    "id",
+    "user_id",
+    "username",
+    "full_name",
+    "channel_number",
+    "janus_room_id",
+    "stream_category",
+    "stream_title",
+    "stream_description",
+    "tags",
+    "thumbnail_url",
+    "is_public",
+    "quality_setting",
+    "is_active",
+    "started_at",
+    "ended_at",
+    "created_at",
+    "modified_at",
+)
+
+
+# view=summary 목록은 요약 필드만 조회
+STREAM_SUMMARY_FIELDS = tuple(LiveStreamSummary.model_fields)
+
+StreamListResponse = Union[LiveStreamListResponse, LiveStreamSummaryListResponse]
+
+
+def _stream_list_response(
+    rows: list[dict[str, Any]], total_count: int, next_cursor: Optional[str], view: ResponseView
+) -> StreamListResponse:
+    if view == "summary":
+        return LiveStreamSummaryListResponse(
+            streams=[LiveStreamSummary.model_validate(row) for row in rows],
+            total_count=total_count,
+            next_cursor=next_cursor,
+        )
+    return LiveStreamListResponse(
+        streams=[_stream_row_to_response(row) for row in rows],
+        total_count=total_count,
+        next_cursor=next_cursor,
+    )
+
+
+def _stream_row_to_response(row: dict[str, Any]) -> LiveStreamResponse:
+    """values() 결과 -> 응답 (duration 은 모델 프로퍼티와 같은 방식으로 계산)"""
+    if row["ended_at"]:
+        row["duration"] = int((row["ended_at"] - row["started_at"]).total_seconds())
+    elif row["is_active"]:
+        row["duration"] = int((datetime.now(timezone.utc) - row["started_at"]).total_seconds())
+    return LiveStreamResponse.model_validate(row)
+
+
+def _is_cursor_int(value: Any) -> bool:
+    # JSON 의 true/false 는 bool(int 의 하위 타입)로 들어오므로 제외
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+async def _list_streams_by_started_at(
+    limit: int, cursor: Optional[str], view: ResponseView = FULL_VIEW, **filters: Any
+) -> StreamListResponse:
+    """최신 시작 순 (started_at DESC, id DESC) 키셋 페이지"""
+    queryset = LiveModel.filter(is_active=True, **filters)
+    # 복제본 허용 (스트림 시작/종료 직후에는 primary)
+    with read_routing.reads(CHANNEL_BOARD_NAMESPACE):
+        total_count = await queryset.count()
+        if cursor:
+            started_at, last_id = decode_cursor(cursor, 2)
+            try:
+                started_at = datetime.fromisoformat(started_at)
+            except (TypeError, ValueError):
+                raise invalid_cursor()
+            if not _is_cursor_int(last_id):
+                raise invalid_cursor()
+            queryset = queryset.filter(Q(started_at__lt=started_at) | Q(started_at=started_at, id__lt=last_id))
+        fields = STREAM_SUMMARY_FIELDS if view == "summary" else STREAM_LIST_FIELDS
+        rows = await queryset.order_by("-started_at", "-id").limit(limit + 1).values(*fields)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["started_at"], rows[-1]["id"])
+    return _stream_list_response(rows, total_count, next_cursor, view)
+
+
+async def service_get_all_streams(
+    limit: int = 50, cursor: Optional[str] = None, view: ResponseView = FULL_VIEW
+) -> StreamListResponse:
+    """활성 스트림 전체 (최신 시작 순)"""
+    return await _list_streams_by_started_at(limit, cursor, view)
+
+
+async def service_get_streams_by_category(
+    category: str, limit: int = 50, cursor: Optional[str] = None, view: ResponseView = FULL_VIEW
+) -> StreamListResponse:
+    """카테고리별 활성 스트림 ((is_active, stream_category, started_at) 인덱스)"""
+    return await _list_streams_by_started_at(limit, cursor, view, stream_category=category)
+
+
+async def service_get_public_streams(
+    limit: int = 50, cursor: Optional[str] = None, view: ResponseView = FULL_VIEW
+) -> StreamListResponse:
+    """공개 활성 스트림, 채널 번호 순 ((is_public, is_active, channel_number) 인덱스)"""
+    queryset = LiveModel.filter(is_public=True, is_active=True)
+    with read_routing.reads(CHANNEL_BOARD_NAMESPACE):
+        total_count = await queryset.count()
+        if cursor:
+            (last_channel,) = decode_cursor(cursor, 1)
+            if not _is_cursor_int(last_channel):
+                raise invalid_cursor()
+            queryset = queryset.filter(channel_number__gt=last_channel)
+        fields = STREAM_SUMMARY_FIELDS if view == "summary" else STREAM_LIST_FIELDS
+        rows = await queryset.order_by("channel_number").limit(limit + 1).values(*fields)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["channel_number"])
+    return _stream_list_response(rows, total_count, next_cursor, view)
+
+
+async def service_update_stream(user_id: int, data: LiveStreamUpdateRequest) -> StreamUpdateResponse:
+    """활성 스트림 정보 수정 (lives 에는 활성 스트림만 있음, lives.user_id 유니크)"""
+    live_stream = await LiveModel.filter(user_id=user_id).first()
+    if not live_stream:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="활성 스트림이 없습니다."
+        )
+
+    live_stream.stream_title = data.stream_title
+    live_stream.stream_description = data.stream_description
+    live_stream.stream_category = data.stream_category
+    live_stream.tags = data.tags
+    live_stream.is_public = data.is_public
+    live_stream.quality_setting = data.quality_setting
+    await live_stream.save(
+        update_fields=[
+            "stream_title",
+            "stream_description",
+            "stream_category",
+            "tags",
+            "is_public",
+            "quality_setting",
+            "modified_at",
+        ]
+    )
+
+    stream = LiveStreamResponse.model_validate(live_stream)
+    await _invalidate_board(live_stream.channel_number)
+    await channel_events.publish("updated", live_stream.channel_number, stream=_stream_info(live_stream, owner=True))
+    return StreamUpdateResponse(
+        success=True,
+        message="스트림 정보가 수정되었습니다.",
+        stream=stream,
+    )
+
 
 async def service_get_stream_by_channel(channel_number: int) -> LiveStreamResponse:
     """채널 번호로 스트림 조회 -> 관리자가 특정 채널 클릭 시 조회"""
-    if channel_number < 1 or channel_number > 16:
+    if not channel_pools.contains(channel_number):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="잘못된 채널 번호입니다."
         )
 
-    live_stream = await LiveModel.filter(
-        channel_number=channel_number,
-        is_active=True
-    ).first()
+    with read_routing.reads(CHANNEL_BOARD_NAMESPACE, channel_board.window_key(channel_number)):
+        live_stream = await LiveModel.filter(
+            channel_number=channel_number,
+            is_active=True
+        ).first()
 
     if not live_stream:
         raise HTTPException(
@@ -0,0 +1,120 @@
+import random
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.configs import settings
+from app.models.live_model import LiveModel
+
+
+class RoomIdTaken(Exception):
+    """다른 워커가 같은 room id 로 먼저 커밋함 (lives.janus_room_id 유니크 위반)"""
+
+    def __init__(self, room_id: int):
+        super().__init__(f"room id {room_id} 는 이미 사용 중입니다.")
+        self.room_id = room_id
+
+
+class RoomIdPool:
+    """Janus room id 풀 (활성 방만 추적)
+
+    - 새 id 는 DB 의 활성 room id 최댓값 다음부터 순서대로 발급 (끝에 닿으면 처음으로 돌아가 사용 중인 id 는 건너뜀)
+    - 워커 간 중복은 lives.janus_room_id 유니크 제약이 거부한다: 호출한 쪽이 RoomIdTaken 을 받으면
+      skip() 으로 DB 최댓값 다음으로 넘어가 새 id 를 받는다 (JANUS_ENABLED 와 무관)
+      넘어갈 위치는 skip_spread 안에서 무작위라, 같이 충돌한 워커들이 다시 같은 id 를 고르지 않는다
+    - 반환된 id 는 cooldown 이 지난 뒤 FIFO 로 재사용 (Janus 의 방 정리 시간 확보)
+    - 발급 후 커밋 전(confirm 전) id 는 재동기화(load/reconcile)해도 유지
+    """
+
+    def __init__(
+        self, first_room_id: int = 1001, last_room_id: int = 9999, cooldown: float = 0.0, skip_spread: int = 64
+    ):
+        self.first_room_id = first_room_id
+        self.last_room_id = last_room_id
+        self.cooldown = cooldown
+        self.skip_spread = skip_spread
+        self._active: set[int] = set()
+        self._in_flight: set[int] = set()
+        self._released: deque[tuple[float, int]] = deque()
+        self._released_ids: set[int] = set()
+        self._next_fresh = first_room_id
+        self.loaded = False
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @property
+    def capacity(self) -> int:
+        return self.last_room_id - self.first_room_id + 1
+
+    def _after(self, room_id: int) -> int:
+        return room_id + 1 if self.first_room_id <= room_id < self.last_room_id else self.first_room_id
+
+    def acquire(self) -> Optional[int]:
+        """사용 가능한 room id, 없으면 None (confirm/release 전까지 커밋 전 id 로 유지)"""
+        if self._released and self._released[0][0] <= time.monotonic():
+            _, room_id = self._released.popleft()
+            self._released_ids.discard(room_id)
+            return self._claim(room_id)
+        for _ in range(self.capacity):
+            room_id = self._next_fresh
+            self._next_fresh = self._after(room_id)
+            if room_id not in self._active and room_id not in self._released_ids:
+                return self._claim(room_id)
+        return None
+
+    def _claim(self, room_id: int) -> int:
+        self._active.add(room_id)
+        self._in_flight.add(room_id)
+        return room_id
+
+    def confirm(self, room_id: int) -> None:
+        """room id 를 담은 행이 커밋됨 -> 이후 재동기화는 DB 기준"""
+        self._in_flight.discard(room_id)
+
+    def mark_used(self, room_id: int) -> None:
+        """다른 워커/기존 행이 사용 중인 id 반영"""
+        self._in_flight.discard(room_id)
+        self._active.add(room_id)
+
+    def release(self, room_id: int) -> None:
+        self._in_flight.discard(room_id)
+        if room_id not in self._active:
+            return
+        self._active.discard(room_id)
+        self._released.append((time.monotonic() + self.cooldown, room_id))
+        self._released_ids.add(room_id)
+
+    def load(self, active_room_ids: Iterable[int]) -> None:
+        self._active = set(active_room_ids) | self._in_flight
+        self._released.clear()
+        self._released_ids.clear()
+        self._next_fresh = self._after(max(self._active, default=self.last_room_id))
+        self.loaded = True
+
+    async def reconcile(self, connection: Optional[BaseDBAsyncClient] = None) -> None:
+        """활성 스트림의 room id 로 재초기화 ((is_active, janus_room_id) 인덱스 사용)"""
+        room_ids: list[int] = await (
+            LiveModel.filter(is_active=True).using_db(connection).values_list("janus_room_id", flat=True)
+        )  # type: ignore[assignment]
+        self.load(room_ids)
+
+    async def skip(self, room_id: int, connection: Optional[BaseDBAsyncClient] = None) -> None:
+        """RoomIdTaken 처리: 그 id 를 사용 중으로 두고 DB 의 최대 room id 다음(skip_spread 안의 무작위 위치)부터 발급"""
+        self.mark_used(room_id)
+        top: list[int] = await (
+            LiveModel.all()
+            .using_db(connection)
+            .order_by("-janus_room_id")
+            .limit(1)
+            .values_list("janus_room_id", flat=True)
+        )  # type: ignore[assignment]
+        if top and top[0] >= self._next_fresh:
+            start = top[0] + 1 + random.randrange(self.skip_spread)
+            self._next_fresh = self.first_room_id + (start - self.first_room_id) % self.capacity
+
+
+room_id_pool = RoomIdPool(cooldown=settings.JANUS_ROOM_ID_COOLDOWN_SECONDS)
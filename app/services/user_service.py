@@ -1,11 +1,23 @@
+import csv
+import io
+import json
 import random
 import string
+from typing import Any, AsyncIterator
 
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
+from pydantic import ValidationError
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
 from typing_extensions import Optional
 
+from app.configs import settings
+
+from app.core.auth import invalidate_user_cache
+from app.core.cache import cache
+from app.core.db_routing import pin_primary_reads, read_routing
 from app.core.email import send_temp_password_to_email
+from app.core.password import password_hasher
 from app.dtos.user.user_login_request import UserLoginRequest
 from app.dtos.user.user_login_response import UserLoginResponse
 from app.dtos.user.user_password_reset_request import (
@@ -19,12 +31,22 @@ from app.dtos.user.user_password_reset_response import (
 from app.dtos.user.user_profile_update_request import UserProfileUpdateRequest
 from app.dtos.user.user_profile_update_response import UserProfileUpdateResponse
 from app.dtos.user.user_signup_request import UserSignupRequest
-from app.dtos.user.user_signup_response import UserGetResponse, UserSignupResponse, StreamerListItem, StreamerListResponse
+from app.dtos.user.user_signup_response import (
+    UserGetResponse,
+    UserSignupResponse,
+    StreamerListItem,
+    StreamerListResponse,
+    to_user_get_response,
+)
+from app.dtos.live.live_response import StreamStopResponse
+from app.models.live_model import LiveModel
 from app.models.user_model import User
 from app.dtos.user.admin_user_add_request import AdminUserAddRequest
 from app.dtos.user.admin_user_update_channel_request import AdminUserUpdateRequest
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.dtos.user.admin_user_import import AdminUserImportError, AdminUserImportResponse, AdminUserImportRow
+from app.services.channel_allocator import channel_pools
+from app.services.channel_policy import invalidate_channel_assignments
+from app.services.live_service import service_stop_stream
 
 
 # 회원가입
@@ -40,7 +62,7 @@ async def service_signup_user(data: UserSignupRequest) -> UserSignupResponse:
     if await User.filter(email=data.email).exists():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 사용 중인 이메일입니다.")
 
-    hashed_password = pwd_context.hash(data.password)
+    hashed_password = await password_hasher.hash(data.password)
     user = await User.create(
         username=data.username,
         password=hashed_password,
@@ -49,6 +71,11 @@ async def service_signup_user(data: UserSignupRequest) -> UserSignupResponse:
         affiliation=data.affiliation,
         channel_number=data.channel_number,
     )
+    await invalidate_streamer_list()
+    # 가입 직후 인증/조회가 복제 지연으로 사용자를 못 찾지 않도록
+    await pin_primary_reads("user", str(user.id))
+    if user.channel_number is not None:
+        await invalidate_channel_assignments(user.id)
     return UserSignupResponse(
         user_id=user.id,
         username=user.username,
@@ -59,15 +86,11 @@ async def service_signup_user(data: UserSignupRequest) -> UserSignupResponse:
 
 # 사용자 정보 조회
 async def service_get_user(user_id: int) -> UserGetResponse:
-    user = await User.get(id=user_id)
+    with read_routing.reads("user", str(user_id)):
+        user = await User.get_or_none(id=user_id)
     if not user:
         raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "사용자를 찾을 수 없습니다.")
-    return UserGetResponse(
-        user_id=user.id,
-        username=user.username,
-        full_name=user.full_name,
-        email=user.email,
-    )
+    return await to_user_get_response(user)
 
 
 # 로그인
@@ -75,7 +98,7 @@ async def service_login_user(data: UserLoginRequest) -> UserLoginResponse:
     user = await User.filter(username=data.username).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="존재하지 않는 아이디입니다.")
-    if not pwd_context.verify(data.password, user.password):
+    if not await password_hasher.verify(data.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="비밀번호가 일치하지 않습니다.")
     return UserLoginResponse(
         user_id=user.id,
@@ -90,7 +113,7 @@ async def authenticate_user(username: str, password: str) -> Optional[User]:
     user = await User.filter(username=username).first()
     if not user:
         return None
-    if not pwd_context.verify(password, user.password):
+    if not await password_hasher.verify(password, user.password):
         return None
     return user
 
@@ -101,18 +124,29 @@ def generate_temp_password(length: int = 10) -> str:
     return "".join(random.choices(chars, k=length))
 
 
+# 정적 채널 번호/시설 검증 (채널은 시설 구간 안이어야 함), 문제 없으면 None
+def channel_assignment_error(channel_number: Optional[int], facility: Optional[str]) -> Optional[str]:
+    if (facility or channel_pools.default_facility) not in channel_pools.pools:
+        return "등록되지 않은 시설입니다."
+    pool = channel_pools.pool(facility)
+    if channel_number is not None and not pool.contains(channel_number):
+        return f"채널번호는 {pool.first_channel}-{pool.last_channel} 범위여야 합니다."
+    return None
+
+
 # 관리자: 사용자 추가 (정적 채널 할당)
 async def service_admin_add_user(data: AdminUserAddRequest) -> UserSignupResponse:
     # username/email 중복 체크
     if await User.filter(username=data.username).exists():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 사용 중인 아이디입니다.")
     # 채널 번호 중복(정적 할당) 체크: 사용자 테이블 기준
-    if data.channel_number < 1 or data.channel_number > 15:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="채널번호는 1-15 범위여야 합니다.")
+    error = channel_assignment_error(data.channel_number, data.facility)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
     if await User.filter(channel_number=data.channel_number).exists():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 사용 중인 채널번호입니다.")
 
-    hashed_password = pwd_context.hash(data.password)
+    hashed_password = await password_hasher.hash(data.password)
     user = await User.create(
         username=data.username,
         password=hashed_password,
@@ -120,7 +154,10 @@ async def service_admin_add_user(data: AdminUserAddRequest) -> UserSignupRespons
         email=f"{data.username}@example.local",  # 이메일 제공되지 않으므로 임시 지정
         affiliation=data.affiliation,
         channel_number=data.channel_number,
+        facility=data.facility,
     )
+    await invalidate_streamer_list()
+    await invalidate_channel_assignments(user.id)
     return UserSignupResponse(
         user_id=user.id,
         username=user.username,
@@ -128,6 +165,7 @@ async def service_admin_add_user(data: AdminUserAddRequest) -> UserSignupRespons
         email=user.email,
         affiliation=user.affiliation,
         channel_number=user.channel_number,
+        facility=user.facility,
     )
 
 
@@ -136,19 +174,39 @@ async def service_admin_delete_user(username: str) -> dict[str, str]:
     user = await User.get_or_none(username=username)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
+    # 방송 중이면 먼저 종료 (이력 기록, 채널/슬롯/Janus 방/room id 반환)
+    # 삭제 cascade 가 lives 행만 지우면 채널과 room id 가 반환되지 않음
+    stopped = await service_stop_stream(user.id)
+    if not isinstance(stopped, StreamStopResponse) and await LiveModel.filter(user_id=user.id).exists():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="방송 종료에 실패해 사용자를 삭제하지 않았습니다.",
+        )
     await user.delete()
+    await invalidate_user_cache(user.id)
+    await invalidate_streamer_list()
+    if user.channel_number is not None:
+        await invalidate_channel_assignments(user.id)
     return {"message": f"{username} 사용자를 삭제했습니다."}
 
 
-# 관리자: 사용자 정보 변경 (이름, 소속, 채널, 비밀번호)
+# 관리자: 사용자 정보 변경 (이름, 소속, 채널, 시설, 비밀번호)
 async def service_admin_update_user(username: str, data: AdminUserUpdateRequest) -> dict[str, str]:
     user = await User.get_or_none(username=username)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
+    # 채널/시설 변경이 요청된 경우 바뀐 조합으로 범위 확인
+    if data.channel_number is not None or data.facility is not None:
+        error = channel_assignment_error(
+            data.channel_number if data.channel_number is not None else user.channel_number,
+            data.facility if data.facility is not None else user.facility,
+        )
+        if error is not None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    if data.facility is not None:
+        user.facility = data.facility
     # 채널 변경이 요청된 경우 중복 체크
     if data.channel_number is not None:
-        if data.channel_number < 1 or data.channel_number > 15:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="채널번호는 1-15 범위여야 합니다.")
         if await User.filter(channel_number=data.channel_number).exclude(id=user.id).exists():
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 사용 중인 채널번호입니다.")
         user.channel_number = data.channel_number
@@ -157,23 +215,179 @@ async def service_admin_update_user(username: str, data: AdminUserUpdateRequest)
     if data.affiliation is not None:
         user.affiliation = data.affiliation
     if data.password is not None:
-        user.password = pwd_context.hash(data.password)
+        user.password = await password_hasher.hash(data.password)
     await user.save()
+    await invalidate_user_cache(user.id)
+    await invalidate_streamer_list()
+    if data.channel_number is not None:
+        await invalidate_channel_assignments(user.id)
     return {"message": f"{username}의 정보가 업데이트되었습니다.", "modified_at": user.modified_at.isoformat()}
 
 
-# 관리자: 스트리머 목록 조회
-async def service_admin_list_streamers() -> StreamerListResponse:
-    users = await User.filter(role="streamer").order_by("username").all()
+# 관리자: 스트리머 목록 조회 (캐시, 사용자 추가/수정/삭제 시 무효화)
+STREAMER_LIST_CACHE_KEY = "streamers:"
+
+
+async def service_admin_streamer_list_body() -> bytes:
+    """스트리머 목록 직렬화 결과 (캐시된 JSON bytes 를 다시 검증/직렬화하지 않고 그대로)"""
+    cached = await cache.get(STREAMER_LIST_CACHE_KEY)
+    if cached is not None:
+        return cached
+    # 복제본 허용 (관리자 쓰기 직후에는 primary)
+    with read_routing.reads("streamers"):
+        users = await User.filter(role="streamer").order_by("username").all()
     items = [
         StreamerListItem(
             username=u.username,
             full_name=u.full_name,
             affiliation=u.affiliation,
             channel_number=u.channel_number,
+            facility=u.facility,
         ) for u in users
     ]
-    return StreamerListResponse(items=items)
+    body = StreamerListResponse(items=items).model_dump_json().encode()
+    await cache.set(STREAMER_LIST_CACHE_KEY, body, settings.STREAMER_LIST_CACHE_TTL_SECONDS)
+    return body
+
+
+async def invalidate_streamer_list() -> None:
+    await cache.invalidate("streamers")
+
+
+# 관리자: 사용자 일괄 등록 파일 파싱 (CSV 헤더 또는 JSON 배열)
+def parse_user_import_file(filename: str, content: bytes) -> list[dict[str, Any]]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="UTF-8 파일만 지원합니다.")
+    if filename.lower().endswith(".json") or text.lstrip().startswith("["):
+        try:
+            rows = json.loads(text)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="JSON 형식이 올바르지 않습니다.")
+        if not isinstance(rows, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="JSON 은 배열이어야 합니다.")
+    else:
+        # 빈 칸은 값 없음으로 처리
+        rows = [
+            {key: value for key, value in row.items() if key and value not in (None, "")}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.USER_IMPORT_MAX_ROWS}명까지 등록할 수 있습니다.",
+        )
+    return rows
+
+
+# 관리자: 사용자 일괄 추가
+async def service_admin_import_users(rows: list[dict[str, Any]]) -> AdminUserImportResponse:
+    """
+    전체 행을 메모리에서 검증 -> 고유 컬럼별 중복 조회 1회씩 -> 병렬 해시 -> 한 트랜잭션에서 bulk_create
+    오류가 있는 행만 제외하고 나머지는 등록
+    """
+    errors: list[AdminUserImportError] = []
+    valid: list[tuple[int, AdminUserImportRow]] = []
+    for index, raw in enumerate(rows, start=1):
+        try:
+            row = AdminUserImportRow.model_validate(raw)
+        except ValidationError as e:
+            username = raw.get("username") if isinstance(raw, dict) else None
+            message = "; ".join(
+                f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"] for err in e.errors()
+            )
+            errors.append(AdminUserImportError(row=index, username=username, message=message))
+            continue
+        if row.email is None:
+            row.email = f"{row.username}@example.local"  # 이메일 제공되지 않으므로 임시 지정
+        error = channel_assignment_error(row.channel_number, row.facility)
+        if error is not None:
+            errors.append(AdminUserImportError(row=index, username=row.username, message=error))
+            continue
+        valid.append((index, row))
+
+    # 고유 컬럼별 기존 값 (컬럼당 쿼리 1회)
+    taken: dict[str, set[Any]] = {}
+    for column in ("username", "email", "channel_number"):
+        values = {getattr(row, column) for _, row in valid}
+        taken[column] = set(await User.filter(**{f"{column}__in": values}).values_list(column, flat=True)) if values else set()
+    messages = {
+        "username": "이미 사용 중인 아이디입니다.",
+        "email": "이미 사용 중인 이메일입니다.",
+        "channel_number": "이미 사용 중인 채널번호입니다.",
+    }
+
+    accepted: list[tuple[int, AdminUserImportRow]] = []
+    for index, row in valid:
+        conflict = next((column for column in messages if getattr(row, column) in taken[column]), None)
+        if conflict is not None:
+            errors.append(AdminUserImportError(row=index, username=row.username, message=messages[conflict]))
+            continue
+        # 파일 안에서의 중복도 같은 방식으로 거절 (먼저 나온 행 우선)
+        for column in messages:
+            taken[column].add(getattr(row, column))
+        accepted.append((index, row))
+
+    if accepted:
+        hashed_passwords = await password_hasher.hash_many([row.password for _, row in accepted])
+        users = [
+            User(
+                username=row.username,
+                password=hashed_password,
+                full_name=row.full_name,
+                email=row.email,
+                affiliation=row.affiliation,
+                channel_number=row.channel_number,
+                facility=row.facility,
+            )
+            for (_, row), hashed_password in zip(accepted, hashed_passwords)
+        ]
+        try:
+            async with in_transaction("default") as connection:
+                await User.bulk_create(users, using_db=connection)
+        except IntegrityError:
+            # 검증 이후 다른 요청이 같은 값을 먼저 등록한 경우 -> 전체 취소
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="등록 중 중복된 사용자가 생겼습니다. 다시 시도해주세요.",
+            )
+
+    if accepted:
+        await invalidate_streamer_list()
+        # 여러 사용자 -> 인덱스 전체 재로딩 (조회 1회)
+        await invalidate_channel_assignments()
+    errors.sort(key=lambda error: error.row)
+    return AdminUserImportResponse(created=len(accepted), errors=errors)
+
+
+# 관리자: 스트리머 목록 CSV 내보내기 (username 키셋으로 나눠 읽으며 스트리밍)
+STREAMER_EXPORT_COLUMNS = ("username", "full_name", "affiliation", "channel_number", "facility")
+
+
+async def service_admin_export_streamers(batch_size: int = 500) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 BOM
+    writer.writerow(STREAMER_EXPORT_COLUMNS)
+    yield "\ufeff" + buffer.getvalue()
+
+    last_username: Optional[str] = None
+    while True:
+        queryset = User.filter(role="streamer")
+        if last_username is not None:
+            queryset = queryset.filter(username__gt=last_username)
+        with read_routing.reads("streamers"):
+            rows = await queryset.order_by("username").limit(batch_size).values_list(*STREAMER_EXPORT_COLUMNS)
+        if not rows:
+            return
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        if len(rows) < batch_size:
+            return
+        last_username = rows[-1][0]
 
 
 # 비밀번호 리셋
@@ -184,9 +398,10 @@ async def service_reset_password(data: UserPasswordResetRequest) -> UserPassword
     await user.save()
 
     temp_password = generate_temp_password()
-    hashed_password = pwd_context.hash(temp_password)
+    hashed_password = await password_hasher.hash(temp_password)
     user.password = hashed_password
     await user.save()
+    await invalidate_user_cache(user.id)
 
     # 이메일 발송
     await send_temp_password_to_email(user.email, temp_password)
@@ -197,10 +412,11 @@ async def service_reset_password(data: UserPasswordResetRequest) -> UserPassword
 # 비밀번호 변경
 async def service_change_password(user_id: int, data: UserPasswordChangeRequest) -> UserPasswordChangeResponse:
     user = await User.get(id=user_id)
-    if not pwd_context.verify(data.old_password, user.password):
+    if not await password_hasher.verify(data.old_password, user.password):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="기존 비밀번호가 일치하지 않습니다.")
-    user.password = pwd_context.hash(data.new_password)
+    user.password = await password_hasher.hash(data.new_password)
     await user.save()
+    await invalidate_user_cache(user.id)
     return UserPasswordChangeResponse(message="비밀번호가 성공적으로 변경되었습니다.")
 
 
@@ -212,4 +428,6 @@ async def service_update_profile(user_id: int, data: UserProfileUpdateRequest) -
     if data.email:
         user.email = data.email
     await user.save()
+    await invalidate_user_cache(user.id)
+    await invalidate_streamer_list()
     return {"message": "프로필 정보가 성공적으로 변경되었습니다."}
@@ -0,0 +1,25 @@
+"""벤치마크용 기본 환경 변수 (Settings 필수값), 이미 설정된 값은 그대로 둔다."""
+
+import os
+
+DEFAULTS = {
+    "DB_HOST": "127.0.0.1",
+    "DB_PORT": "3306",
+    "DB_USER": "root",
+    "DB_PASSWORD": "",
+    "DB_DB": "ics_bench",
+    "SECRET_KEY": "bench-secret",
+    "MAIL_USERNAME": "bench",
+    "MAIL_PASSWORD": "bench",
+    "MAIL_FROM": "bench@example.local",
+    "MAIL_PORT": "587",
+    "MAIL_SERVER": "localhost",
+    "MAIL_FROM_NAME": "bench",
+    # 임시 sqlite DB 는 앱 시작 시 스키마 생성
+    "DB_GENERATE_SCHEMAS": "true",
+}
+
+
+def apply_defaults() -> None:
+    for key, value in DEFAULTS.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,72 @@
+"""로그인 폭주 시 이벤트 루프 지연 비교 (bcrypt 동기 호출 vs 스레드 풀)
+
+python -m benchmarks.bcrypt_event_loop_lag --logins 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+from benchmarks._env import apply_defaults
+
+apply_defaults()
+
+from app.core.password import PasswordHasher  # noqa: E402
+
+TICK_SECONDS = 0.005
+
+
+async def _measure(logins: int, verify: Callable[[str, str], Awaitable[bool]], hashed: str) -> dict[str, Any]:
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        # 주기적으로 깨어나 예정 시각 대비 지연을 기록
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    tick_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(verify("password", hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick_task
+
+    lags.sort()
+    return {
+        "elapsed_s": round(elapsed, 4),
+        "logins_per_s": round(logins / elapsed, 2),
+        "loop_lag_p50_ms": round(lags[len(lags) // 2], 2) if lags else None,
+        "loop_lag_p99_ms": round(lags[int(len(lags) * 0.99)], 2) if lags else None,
+        "loop_lag_max_ms": round(lags[-1], 2) if lags else None,
+    }
+
+
+async def main_async(logins: int, workers: int) -> dict[str, Any]:
+    hasher = PasswordHasher(max_workers=workers, max_pending=logins)
+    hashed = hasher.context.hash("password")
+
+    async def blocking_verify(password: str, hashed_password: str) -> bool:
+        # 기존 방식: 코루틴 안에서 동기 호출
+        return hasher.context.verify(password, hashed_password)
+
+    before = await _measure(logins, blocking_verify, hashed)
+    after = await _measure(logins, hasher.verify, hashed)
+    hasher.shutdown()
+    return {"logins": logins, "workers": workers, "before": before, "after": after, "pool": hasher.stats()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main_async(args.logins, args.workers)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
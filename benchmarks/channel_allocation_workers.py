@@ -0,0 +1,168 @@
+"""채널 할당 멀티 워커 하네스
+
+N 개의 워커 프로세스가 같은 DB 를 대상으로 동시에 스트림을 시작하고,
+활성 채널/room id 중복 여부/성공 수/처리량을 확인한다.
+
+    CHANNEL_ALLOCATION_BACKEND=mysql_slots python -m benchmarks.channel_allocation_workers --workers 4 --users 32
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import Counter
+from typing import Any
+
+from benchmarks._env import apply_defaults
+
+USERNAME_PREFIX = "alloc_bench_"
+
+
+async def _prepare(users: int) -> list[int]:
+    from tortoise import Tortoise
+
+    from app.configs.database_settings import TORTOISE_ORM
+    from app.models.channel_slot_model import ChannelSlot
+    from app.models.live_model import LiveModel
+    from app.models.user_model import User, UserRole
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    await Tortoise.generate_schemas(safe=True)
+    try:
+        await LiveModel.filter(username__startswith=USERNAME_PREFIX).delete()
+        await User.filter(username__startswith=USERNAME_PREFIX).delete()
+        await ChannelSlot.all().update(user_id=None, claimed_at=None)
+        await User.bulk_create(
+            [
+                User(
+                    username=f"{USERNAME_PREFIX}{i}",
+                    password="!",
+                    full_name=f"bench {i}",
+                    email=f"{USERNAME_PREFIX}{i}@example.local",
+                    role=UserRole.STREAMER,
+                )
+                for i in range(users)
+            ]
+        )
+        return [user.id for user in await User.filter(username__startswith=USERNAME_PREFIX).only("id")]
+    finally:
+        await Tortoise.close_connections()
+
+
+async def _run_worker(user_ids: list[int], start_event: Any) -> list[dict[str, Any]]:
+    from fastapi import HTTPException
+    from tortoise import Tortoise
+
+    from app.configs.database_settings import TORTOISE_ORM
+    from app.dtos.live.live_request import LiveStreamCreateRequest
+    from app.models.user_model import User
+    from app.services.channel_backends import channel_backend
+    from app.services.live_service import service_start_stream
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    await channel_backend.setup()
+    data = LiveStreamCreateRequest(
+        stream_title="bench",
+        stream_description="",
+        stream_category="일반",
+        tags=[],
+        is_public=True,
+        quality_setting="HD",
+    )
+
+    # 인증 단계에서 조회된 사용자에 해당 (측정에서 제외)
+    users = await User.filter(id__in=user_ids)
+
+    async def start(user: User) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = await service_start_stream(user, data)
+            outcome = {"status": 200, "channel": result["stream"]["channel_number"]}
+        except HTTPException as e:
+            outcome = {"status": e.status_code, "channel": None}
+        outcome["latency_ms"] = (time.perf_counter() - started) * 1000
+        return outcome
+
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, start_event.wait)
+        return await asyncio.gather(*(start(user) for user in users))
+    finally:
+        await Tortoise.close_connections()
+
+
+def _worker_main(user_ids: list[int], start_event: Any, results: Any) -> None:
+    results.put(asyncio.run(_run_worker(user_ids, start_event)))
+
+
+async def _verify() -> dict[str, Any]:
+    from tortoise import Tortoise
+
+    from app.configs.database_settings import TORTOISE_ORM
+    from app.models.live_model import LiveModel
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        streams = await LiveModel.filter(username__startswith=USERNAME_PREFIX, is_active=True)
+        channels = Counter(stream.channel_number for stream in streams)
+        room_ids = Counter(stream.janus_room_id for stream in streams)
+        return {
+            "active_streams": len(streams),
+            "duplicate_channels": [channel for channel, count in channels.items() if count > 1],
+            "duplicate_room_ids": [room_id for room_id, count in room_ids.items() if count > 1],
+        }
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--users", type=int, default=16)
+    args = parser.parse_args()
+    # spawn 워커는 이 환경 변수를 물려받음
+    apply_defaults()
+
+    user_ids = asyncio.run(_prepare(args.users))
+
+    ctx = multiprocessing.get_context("spawn")
+    start_event = ctx.Event()
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_worker_main, args=(user_ids[i :: args.workers], start_event, results))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    # 모든 워커가 초기화될 시간을 준 뒤 동시에 시작
+    time.sleep(2)
+    started = time.perf_counter()
+    start_event.set()
+    outcomes = [outcome for _ in processes for outcome in results.get()]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    verification = asyncio.run(_verify())
+    latencies = sorted(outcome["latency_ms"] for outcome in outcomes)
+    succeeded = sum(1 for outcome in outcomes if outcome["status"] == 200)
+    report = {
+        "workers": args.workers,
+        "users": args.users,
+        "status_counts": dict(Counter(outcome["status"] for outcome in outcomes)),
+        "elapsed_s": round(elapsed, 4),
+        "starts_per_s": round(succeeded / elapsed, 2) if elapsed else None,
+        "p50_ms": round(latencies[len(latencies) // 2], 2) if latencies else None,
+        "max_ms": round(latencies[-1], 2) if latencies else None,
+        **verification,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if verification["duplicate_channels"]:
+        raise SystemExit("중복 채널 할당 발생")
+    if verification["duplicate_room_ids"]:
+        raise SystemExit("중복 room id 발급 발생")
+
+
+if __name__ == "__main__":
+    main()
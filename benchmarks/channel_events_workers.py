@@ -0,0 +1,80 @@
+"""채널 이벤트 워커 간 전달 확인 (가짜 Redis 위의 워커 2개, 실패 시 종료 코드 1)
+
+워커마다 RedisCache + ChannelEventBroker 를 따로 두고, 한 워커의 publish 가 다른 워커의
+구독자에게 origin/seq 와 함께 도착하는지, 워커 간 구독이 다시 붙으면 resync 를 받는지 확인한다.
+
+    python -m benchmarks.channel_events_workers
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any
+
+from benchmarks._env import apply_defaults
+
+
+async def run() -> dict[str, bool]:
+    from app.core.cache import LocalCache
+    from app.core.redis_cache import RedisCache
+    from app.services.channel_events import (
+        RESYNC_MESSAGE,
+        ChannelEventBroker,
+        ChannelSubscription,
+    )
+    from benchmarks.fake_redis import FakeRedis
+
+    server = await FakeRedis().serve("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    caches = [RedisCache(f"redis://127.0.0.1:{port}/0") for _ in range(2)]
+    worker_a, worker_b = (ChannelEventBroker(transport=cache) for cache in caches)
+    try:
+        for cache in caches:
+            await cache.start()
+        await asyncio.sleep(0.1)
+        on_a, on_b = worker_a.subscribe(), worker_b.subscribe()
+
+        async def next_event(subscription: ChannelSubscription) -> dict[str, Any]:
+            event: dict[str, Any] = json.loads(await asyncio.wait_for(subscription.get(), 1.0))
+            return event
+
+        checks: dict[str, bool] = {}
+        await worker_a.publish("started", 3, {"channel_number": 3})
+        await worker_a.publish("stopped", 3)
+        local = [await next_event(on_a), await next_event(on_a)]
+        remote = [await next_event(on_b), await next_event(on_b)]
+        checks["local subscriber receives own events"] = [event["seq"] for event in local] == [1, 2]
+        checks["other worker receives events"] = remote == local
+        checks["seq is per origin"] = {event["origin"] for event in remote} == {worker_a.origin}
+        checks["other worker tracks origin seq"] = worker_b.sequences.get(worker_a.origin) == 2
+
+        await worker_b.publish("started", 5)
+        event = await next_event(on_a)
+        checks["both directions"] = event["origin"] == worker_b.origin and event["seq"] == 1
+
+        # 구독 연결이 다시 붙으면 (놓친 메시지 가능) 모든 구독자에 resync
+        caches[1]._dispatch_all()
+        checks["resubscribe sends resync"] = await asyncio.wait_for(on_b.get(), 1.0) == RESYNC_MESSAGE
+
+        # 로컬 캐시 (단일 워커): 전달 없이 자기 구독자만
+        single = ChannelEventBroker(transport=LocalCache())
+        own = single.subscribe()
+        await single.publish("updated", 7)
+        checks["local backend delivers locally"] = (await next_event(own))["channel_number"] == 7
+        return checks
+    finally:
+        for cache in caches:
+            await cache.close()
+        server.close()
+
+
+def main() -> None:
+    apply_defaults()
+    checks = asyncio.run(run())
+    for name, ok in checks.items():
+        print(f"{name}: {'OK' if ok else 'FAIL'}")
+    sys.exit(0 if all(checks.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
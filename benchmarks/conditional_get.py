@@ -0,0 +1,124 @@
+"""목록/채널 보드 조건부 GET + 압축 + summary 확인 (실패 시 종료 코드 1)
+
+16채널 방송 중인 상태에서 엔드포인트별 응답 크기(전송 바이트)를 형태/인코딩별로 출력하고,
+If-None-Match 재검증이 304 로 끝나는지, 스트림 정보가 바뀌면 ETag 도 바뀌는지 확인한다.
+
+    python -m benchmarks.conditional_get
+    DB_URL=mysql://user:pw@127.0.0.1:3306/ics_bench python -m benchmarks.conditional_get
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Any
+
+from benchmarks._env import apply_defaults
+from benchmarks.run import PASSWORD, STREAMERS, seed
+
+ENDPOINTS = (
+    "/api/v1/live/admin/channels",
+    "/api/v1/live/streams",
+    "/api/v1/live/public",
+    "/api/v1/users/streamers",
+)
+ENCODINGS = ("identity", "gzip", "br")
+
+
+async def run() -> tuple[list[dict[str, Any]], dict[str, bool]]:
+    import httpx
+
+    from app.core.compression import brotli_module
+    from main import app
+
+    rows: list[dict[str, Any]] = []
+    checks: dict[str, bool] = {}
+    async with app.router.lifespan_context(app):
+        await seed()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def token_for(username: str) -> str:
+                response = await client.post("/api/v1/users/token", data={"username": username, "password": PASSWORD})
+                response.raise_for_status()
+                return str(response.json()["access_token"])
+
+            admin = {"Authorization": f"Bearer {await token_for('bench_admin')}"}
+            streamer_tokens = await asyncio.gather(*(token_for(f"bench_streamer_{i}") for i in range(STREAMERS)))
+            payload = {
+                "stream_title": "교육장 실시간 송출",
+                "stream_description": "시설 모니터링용 장시간 방송입니다. " * 8,
+                "stream_category": "일반",
+                "tags": ["모니터링", "교육", "실시간", "시설"],
+                "is_public": True,
+                "quality_setting": "HD",
+            }
+            for token in streamer_tokens:
+                response = await client.post(
+                    "/api/v1/live/start", json=payload, headers={"Authorization": f"Bearer {token}"}
+                )
+                response.raise_for_status()
+
+            async def get(path: str, encoding: str, view: str, etag: str | None = None) -> httpx.Response:
+                headers = {**admin, "Accept-Encoding": encoding}
+                if etag:
+                    headers["If-None-Match"] = etag
+                params = {"view": view} if view != "full" else None
+                return await client.get(path, headers=headers, params=params)
+
+            encodings = [encoding for encoding in ENCODINGS if encoding != "br" or brotli_module() is not None]
+            for path in ENDPOINTS:
+                views = ("full",) if path.endswith("/streamers") else ("full", "summary")
+                row: dict[str, Any] = {"path": path}
+                for view in views:
+                    for encoding in encodings:
+                        response = await get(path, encoding, view)
+                        etag = response.headers.get("etag")
+                        revalidated = await get(path, encoding, view, etag)
+                        row[f"{view}/{encoding}"] = response.num_bytes_downloaded
+                        name = f"{path} {view}/{encoding}"
+                        checks[f"{name} etag"] = response.status_code == 200 and etag is not None
+                        checks[f"{name} 304"] = revalidated.status_code == 304 and not revalidated.content
+                        if encoding != "identity":
+                            checks[f"{name} encoded"] = response.headers.get("content-encoding") == encoding
+                row["304"] = revalidated.num_bytes_downloaded
+                rows.append(row)
+                if "summary/identity" in row:
+                    checks[f"{path} summary smaller"] = row["summary/identity"] < row["full/identity"]
+
+            # 스트림 정보가 바뀌면 같은 ETag 로 재검증해도 새 본문
+            board = await get("/api/v1/live/admin/channels", "gzip", "summary")
+            response = await client.patch(
+                "/api/v1/live/update",
+                json={**payload, "stream_title": "제목 변경"},
+                headers={"Authorization": f"Bearer {streamer_tokens[0]}"},
+            )
+            response.raise_for_status()
+            changed = await get("/api/v1/live/admin/channels", "gzip", "summary", board.headers["etag"])
+            checks["board etag changes after update"] = changed.status_code == 200 and "제목 변경" in changed.text
+    return rows, checks
+
+
+def main() -> None:
+    apply_defaults()
+    tmpdir = None
+    if not os.environ.get("DB_URL"):
+        tmpdir = tempfile.TemporaryDirectory()
+        os.environ["DB_URL"] = f"sqlite://{tmpdir.name}/bench.sqlite3"
+
+    rows, checks = asyncio.run(run())
+    columns = [key for key in rows[0] if key != "path"]
+    print(f"{'path':<32}" + "".join(f"{column:>18}" for column in columns))
+    for row in rows:
+        print(f"{row['path']:<32}" + "".join(f"{row.get(column, '-'):>18}" for column in columns))
+    failed = [name for name, ok in checks.items() if not ok]
+    for name in failed:
+        print(f"FAIL: {name}")
+    print(f"{len(checks) - len(failed)}/{len(checks)} checks OK")
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
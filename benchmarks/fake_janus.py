@@ -0,0 +1,111 @@
+"""로컬 테스트용 가짜 Janus (WebSocket, VideoRoom create/destroy/exists/listparticipants 만 지원)
+
+python -m benchmarks.fake_janus --port 8188
+JANUS_ENABLED=true JANUS_WS_URL=ws://127.0.0.1:8188 uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+from typing import Any
+
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+from websockets.typing import Subprotocol
+
+
+class FakeJanus:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.rooms: set[int] = set()
+        # room -> publisher 참여자 id (테스트에서 직접 넣음)
+        self.publishers: dict[int, list[int]] = {}
+        self.sessions: set[int] = set()
+        self.handles: set[int] = set()
+        self._ids = itertools.count(1000)
+        self.requests = 0
+
+    def _videoroom(self, body: dict[str, Any]) -> dict[str, Any]:
+        room = body.get("room")
+        request = body.get("request")
+        if request == "create":
+            if room in self.rooms:
+                return {"videoroom": "event", "error_code": 427, "error": f"Room {room} already exists"}
+            self.rooms.add(room)  # type: ignore[arg-type]
+            return {"videoroom": "created", "room": room, "permanent": False}
+        if request == "destroy":
+            if room not in self.rooms:
+                return {"videoroom": "event", "error_code": 426, "error": f"No such room ({room})"}
+            self.rooms.discard(room)
+            self.publishers.pop(room, None)
+            return {"videoroom": "destroyed", "room": room, "permanent": False}
+        if request == "exists":
+            return {"videoroom": "success", "room": room, "exists": room in self.rooms}
+        if request == "listparticipants":
+            if room not in self.rooms:
+                return {"videoroom": "event", "error_code": 426, "error": f"No such room ({room})"}
+            participants = [{"id": pid, "publisher": True} for pid in self.publishers.get(room, [])]
+            return {"videoroom": "participants", "room": room, "participants": participants}
+        return {"videoroom": "event", "error_code": 422, "error": f"Unsupported request {request}"}
+
+    async def _handle(self, message: dict[str, Any]) -> dict[str, Any]:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        janus = message.get("janus")
+        base = {"transaction": message.get("transaction")}
+        if janus == "create":
+            session_id = next(self._ids)
+            self.sessions.add(session_id)
+            return {**base, "janus": "success", "data": {"id": session_id}}
+        if message.get("session_id") not in self.sessions:
+            return {**base, "janus": "error", "error": {"code": 458, "reason": "No such session"}}
+        if janus == "keepalive":
+            return {**base, "janus": "ack", "session_id": message["session_id"]}
+        if janus == "attach":
+            handle_id = next(self._ids)
+            self.handles.add(handle_id)
+            return {**base, "janus": "success", "session_id": message["session_id"], "data": {"id": handle_id}}
+        if janus == "message":
+            if message.get("handle_id") not in self.handles:
+                return {**base, "janus": "error", "error": {"code": 459, "reason": "No such handle"}}
+            return {
+                **base,
+                "janus": "success",
+                "session_id": message["session_id"],
+                "sender": message["handle_id"],
+                "plugindata": {"plugin": "janus.plugin.videoroom", "data": self._videoroom(message.get("body", {}))},
+            }
+        return {**base, "janus": "error", "error": {"code": 453, "reason": f"Unknown request '{janus}'"}}
+
+    async def handler(self, connection: ServerConnection) -> None:
+        async def respond(message: dict[str, Any]) -> None:
+            await connection.send(json.dumps(await self._handle(message)))
+
+        try:
+            async for raw in connection:
+                # 요청을 동시에 처리 (실제 Janus 처럼 순서를 보장하지 않음)
+                asyncio.create_task(respond(json.loads(raw)))
+        except ConnectionClosed:
+            pass
+
+
+async def run(host: str, port: int, latency: float) -> None:
+    fake = FakeJanus(latency=latency)
+    async with serve(fake.handler, host, port, subprotocols=[Subprotocol("janus-protocol")]):
+        print(f"fake janus listening on ws://{host}:{port}")
+        await asyncio.Future()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8188)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 인위적 지연(초)")
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port, args.latency))
+
+
+if __name__ == "__main__":
+    main()
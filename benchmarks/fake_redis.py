@@ -0,0 +1,128 @@
+"""로컬 테스트용 가짜 Redis (RESP2, GET/SET PX/DEL/PUBLISH/SUBSCRIBE/PING/AUTH/SELECT 만 지원)
+
+python -m benchmarks.fake_redis --port 6390
+CACHE_BACKEND=redis CACHE_REDIS_URL=redis://127.0.0.1:6390/0 uvicorn main:app --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _array(items: list[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(items)
+
+
+class FakeRedis:
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.data: dict[bytes, tuple[Optional[float], bytes]] = {}
+        self.subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self.commands = 0
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[list[bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # 인라인 명령 (redis-cli/telnet)
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _execute(self, args: list[bytes], writer: asyncio.StreamWriter, authed: list[bool]) -> bytes:
+        name = args[0].upper()
+        if name == b"AUTH":
+            if self.password is None or args[-1].decode() == self.password:
+                authed[0] = True
+                return b"+OK\r\n"
+            return b"-WRONGPASS invalid password\r\n"
+        if not authed[0]:
+            return b"-NOAUTH Authentication required.\r\n"
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name == b"SELECT":
+            return b"+OK\r\n"
+        if name == b"GET":
+            return _bulk(self._get(args[1]))
+        if name == b"SET":
+            expires_at = None
+            options = [arg.upper() for arg in args[3:]]
+            if b"PX" in options:
+                expires_at = time.monotonic() + int(args[3 + options.index(b"PX") + 1]) / 1000
+            elif b"EX" in options:
+                expires_at = time.monotonic() + int(args[3 + options.index(b"EX") + 1])
+            self.data[args[1]] = (expires_at, args[2])
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(1 for key in args[1:] if self.data.pop(key, None) is not None)
+            return b":%d\r\n" % removed
+        if name == b"PUBLISH":
+            receivers = self.subscribers.get(args[1], set())
+            message = _array([_bulk(b"message"), _bulk(args[1]), _bulk(args[2])])
+            for subscriber in receivers:
+                subscriber.write(message)
+            return b":%d\r\n" % len(receivers)
+        if name == b"SUBSCRIBE":
+            replies = []
+            for index, channel in enumerate(args[1:], start=1):
+                self.subscribers.setdefault(channel, set()).add(writer)
+                replies.append(_array([_bulk(b"subscribe"), _bulk(channel), b":%d\r\n" % index]))
+            return b"".join(replies)
+        return b"-ERR unknown command '%s'\r\n" % name.lower()
+
+    async def handler(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        authed = [self.password is None]
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if not args:
+                    break
+                self.commands += 1
+                writer.write(self._execute(args, writer, authed))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            for subscribers in self.subscribers.values():
+                subscribers.discard(writer)
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(self.handler, host, port)
+
+
+async def main(args: argparse.Namespace) -> None:
+    fake = FakeRedis(password=args.password)
+    server = await fake.serve(args.host, args.port)
+    print(f"fake redis listening on redis://{args.host}:{args.port}/0")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    parser.add_argument("--password")
+    asyncio.run(main(parser.parse_args()))
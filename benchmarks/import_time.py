@@ -0,0 +1,97 @@
+"""워커 기동 시 import 시간 확인 (`python -X importtime`, 예산 초과 시 종료 코드 1)
+
+`import main` 을 새 인터프리터에서 여러 번 실행해 중앙값을 예산과 비교하고,
+첫 사용 시 import 하도록 미룬 모듈이 기동 시점에 로드되지 않았는지 확인한다.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 800 --repeat 7 --top 30
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks._env import apply_defaults
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 기동 시 import 하면 안 되는 모듈 (첫 사용 시 로드)
+DEFERRED_MODULES = (
+    "fastapi_mail",  # 비밀번호 재설정 메일
+    "passlib",  # 첫 해시/검증
+    "jose",  # 첫 토큰 발급/검증
+    "aiortc",  # 서버는 사용하지 않음 (Janus 가 미디어 처리)
+    # 선택 백엔드 (기본 설정에서는 꺼져 있음)
+    "app.services.janus_service",  # JANUS_ENABLED
+    "websockets",  # Janus 클라이언트
+    "app.core.redis_cache",  # CACHE_BACKEND=redis
+    "brotli",  # 첫 br 압축 응답
+)
+
+
+def measure(module: str) -> tuple[int, dict[str, int], set[str]]:
+    """(module 누적 import 시간 us, 최상위 패키지별 self 시간 합 us, import 된 모듈 이름)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} 실패:\n{result.stderr[-2000:]}")
+
+    total = 0
+    by_package: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        name = name.strip()
+        if name == module:
+            total = int(cumulative_us)
+        modules.add(name)
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + int(self_us)
+    return total, by_package, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="측정할 모듈 (기본: main)")
+    parser.add_argument("--budget-ms", type=float, default=1200.0, help="누적 import 시간 중앙값 상한")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    args = parser.parse_args()
+
+    apply_defaults()
+    os.environ.setdefault("DB_URL", "sqlite://:memory:")
+
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    median_ms = statistics.median(total for total, _, _ in runs) / 1000
+    by_package = runs[-1][1]
+
+    print(f"{'package':<32}{'self ms':>10}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{package:<32}{self_us / 1000:>10.1f}")
+
+    failed = False
+    loaded = [name for name in DEFERRED_MODULES if name in runs[-1][2]]
+    if loaded:
+        failed = True
+        print(f"deferred modules imported at startup: {', '.join(loaded)}")
+    ok = median_ms <= args.budget_ms
+    failed |= not ok
+    print(
+        f"import {args.module}: {median_ms:.1f} ms median of {args.repeat} (budget {args.budget_ms:.0f} ms) "
+        f"{'OK' if ok else 'OVER'}"
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""16채널 채널 보드 응답 1건당 직렬화 CPU 비교 (DB/네트워크 없이, 실패 시 종료 코드 1)
+
+- fastapi_default: response_model 재검증 + 직렬화(serialize_response) 후 JSONResponse (기존 기본 경로)
+- fastapi_orjson: 같은 재검증 후 ModelJSONResponse 의 orjson 직렬화 (앱 기본 응답 클래스)
+- model_json: ModelJSONResponse(모델) -> model_dump_json 한 번 (라우트가 서비스 모델을 직접 돌려줄 때)
+- cached_bytes: 채널 보드 스냅샷처럼 직렬화된 본문을 재사용할 때 (참고)
+
+    python -m benchmarks.json_response
+    python -m benchmarks.json_response --channels 64 --iterations 2000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from benchmarks._env import apply_defaults
+
+
+def build_board(channels: int) -> Any:
+    from app.dtos.live.live_response import (
+        AllChannelResponse,
+        ChannelInfo,
+        LiveStreamResponse,
+    )
+
+    now = datetime.now(timezone.utc)
+    infos = []
+    for number in range(1, channels + 1):
+        started_at = now - timedelta(minutes=number)
+        stream = LiveStreamResponse(
+            id=number,
+            user_id=number,
+            username=f"streamer_{number}",
+            full_name=f"스트리머 {number}",
+            channel_number=number,
+            janus_room_id=1000 + number,
+            stream_category="일반",
+            stream_title=f"교육장 {number} 실시간 송출",
+            stream_description="시설 모니터링용 장시간 방송입니다. " * 8,
+            tags=["모니터링", "교육", "실시간", "시설"],
+            thumbnail_url=None,
+            is_public=True,
+            quality_setting="HD",
+            is_active=True,
+            started_at=started_at,
+            duration=number * 60,
+            created_at=started_at,
+            modified_at=started_at,
+        )
+        infos.append(ChannelInfo(channel_number=number, is_active=True, stream_info=stream))
+    return AllChannelResponse(channels=infos, total_channels=channels, active_channels=channels)
+
+
+async def per_response_us(render: Callable[[], Awaitable[bytes]], iterations: int, repeat: int) -> float:
+    """가장 빠른 반복의 응답 1건당 CPU 시간(µs)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for _ in range(iterations):
+            await render()
+        best = min(best, time.process_time() - started)
+    return best / iterations * 1e6
+
+
+async def run(args: argparse.Namespace) -> tuple[dict[str, float], dict[str, bool]]:
+    from fastapi import Response
+    from fastapi.routing import APIRoute, serialize_response
+    from starlette.responses import JSONResponse
+
+    from app.core.responses import ModelJSONResponse, orjson_module
+    from app.dtos.live.live_response import AllChannelResponse
+
+    board = build_board(args.channels)
+    field = APIRoute("/board", lambda: None, response_model=AllChannelResponse).response_field
+    cached = board.model_dump_json().encode()
+
+    async def fastapi_default() -> bytes:
+        return bytes(JSONResponse(await serialize_response(field=field, response_content=board)).body)
+
+    async def fastapi_orjson() -> bytes:
+        return bytes(ModelJSONResponse(await serialize_response(field=field, response_content=board)).body)
+
+    async def model_json() -> bytes:
+        return bytes(ModelJSONResponse(board).body)
+
+    async def cached_bytes() -> bytes:
+        return bytes(Response(cached, media_type="application/json").body)
+
+    paths = {
+        "fastapi_default": fastapi_default,
+        "fastapi_orjson": fastapi_orjson,
+        "model_json": model_json,
+        "cached_bytes": cached_bytes,
+    }
+    expected = json.loads(await fastapi_default())
+    checks = {f"{name} same json": json.loads(await render()) == expected for name, render in paths.items()}
+
+    results = {name: await per_response_us(render, args.iterations, args.repeat) for name, render in paths.items()}
+    checks["model_json faster than fastapi_default"] = results["model_json"] < results["fastapi_default"]
+    if orjson_module() is not None:
+        checks["fastapi_orjson faster than fastapi_default"] = results["fastapi_orjson"] < results["fastapi_default"]
+    return results, checks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, default=16, help="보드 채널 수 (전부 방송 중)")
+    parser.add_argument("--iterations", type=int, default=1000, help="반복당 응답 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    apply_defaults()
+    results, checks = asyncio.run(run(args))
+    baseline = results["fastapi_default"]
+    print(f"{'path':<18}{'µs/response':>14}{'vs default':>12}")
+    for name, us in results.items():
+        print(f"{name:<18}{us:>14.1f}{baseline / us:>11.1f}x")
+    failed = [name for name, ok in checks.items() if not ok]
+    for name in failed:
+        print(f"FAIL: {name}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
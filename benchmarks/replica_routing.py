@@ -0,0 +1,167 @@
+"""읽기 복제본 라우팅 확인 (두 로컬 DB, 실패 시 종료 코드 1)
+
+두 DB 는 복제 관계가 아니어야 한다: primary 에만 있는 행을 읽을 수 있는지로 어느 연결을 썼는지 판단한다.
+복제본 라우팅은 공유 캐시가 있어야 켜지므로 CACHE_REDIS_URL 이 없으면 가짜 Redis 를 띄운다.
+
+    python -m benchmarks.replica_routing
+    DB_URL=mysql://user:pw@127.0.0.1:3306/ics_primary DB_READ_URL=mysql://user:pw@127.0.0.1:3306/ics_replica \\
+        python -m benchmarks.replica_routing
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Awaitable, Callable
+
+from benchmarks._env import apply_defaults
+
+
+async def run() -> dict[str, bool]:
+    from benchmarks.fake_redis import FakeRedis
+
+    server = None
+    if not os.environ.get("CACHE_REDIS_URL"):
+        server = await FakeRedis().serve("127.0.0.1", 0)
+        os.environ["CACHE_REDIS_URL"] = f"redis://127.0.0.1:{server.sockets[0].getsockname()[1]}/0"
+    os.environ["CACHE_BACKEND"] = "redis"
+    try:
+        return await check_routing()
+    finally:
+        if server is not None:
+            server.close()
+
+
+async def check_routing() -> dict[str, bool]:
+    from fastapi import HTTPException
+    from tortoise import Tortoise, connections
+    from tortoise.transactions import in_transaction
+    from tortoise.utils import get_schema_sql
+
+    from app.configs.database_settings import READ_CONNECTION, TORTOISE_ORM
+    from app.core.cache import LocalCache, cache
+    from app.core.db_routing import (
+        ReadRouting,
+        pin_primary_reads,
+        read_routing,
+        replica_lag_monitor,
+        replica_routing_blocker,
+    )
+    from app.models.live_model import LiveModel
+    from app.models.user_model import User
+    from app.services.live_service import (
+        _invalidate_board,
+        channel_board,
+        service_get_all_channels,
+    )
+    from app.services.user_service import service_get_user
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        # 구독이 붙으면 놓친 무효화 대비로 모든 네임스페이스가 고정되므로 짧게 잡고 풀릴 때까지 대기
+        read_routing.pin_seconds = 0.2
+        await cache.start()
+        await asyncio.sleep(0.3)
+        await Tortoise.generate_schemas(safe=True)
+        await connections.get(READ_CONNECTION).execute_script(get_schema_sql(connections.get("default"), safe=True))
+
+        # primary 에만 있는 사용자/스트림 (복제 지연 상황)
+        user = await User.create(
+            username="replica_check", password="x", full_name="복제 확인", email="replica_check@example.com"
+        )
+        await LiveModel.create(
+            user=user,
+            username=user.username,
+            full_name=user.full_name,
+            channel_number=1,
+            active_channel=1,
+            janus_room_id=1001,
+        )
+
+        async def found_user() -> bool:
+            try:
+                await service_get_user(user.id)
+                return True
+            except HTTPException:
+                return False
+
+        async def board_active() -> int:
+            first, last = channel_board.window("default", 0)
+            return (await service_get_all_channels("default", 0, first, last)).active_channels
+
+        checks: dict[str, Callable[[], Awaitable[bool]]] = {}
+
+        async def unknown_lag_uses_primary() -> bool:
+            return await found_user()
+
+        async def healthy_replica_serves_reads() -> bool:
+            await replica_lag_monitor.run_once()
+            return read_routing.healthy and not await found_user() and await board_active() == 0
+
+        async def own_write_pins_primary() -> bool:
+            await pin_primary_reads("user", str(user.id))
+            await _invalidate_board(1)
+            pinned = await found_user() and await board_active() == 1
+            await asyncio.sleep(0.3)
+            return pinned and not await found_user() and await board_active() == 0
+
+        async def lagging_replica_uses_primary() -> bool:
+            read_routing.lag = read_routing.max_lag + 1
+            try:
+                return await found_user() and await board_active() == 1
+            finally:
+                await replica_lag_monitor.run_once()
+
+        async def transaction_uses_primary() -> bool:
+            async with in_transaction("default"):
+                with read_routing.reads("user", str(user.id)):
+                    return await User.filter(id=user.id).exists()
+
+        async def writes_use_primary() -> bool:
+            with read_routing.reads("user", str(user.id)):
+                await User.filter(id=user.id).update(full_name="복제 확인 2")
+            return await User.filter(id=user.id, full_name="복제 확인 2").exists()
+
+        async def routing_enabled_with_shared_cache() -> bool:
+            return read_routing.enabled
+
+        async def local_cache_disables_replica() -> bool:
+            reason = replica_routing_blocker(True, LocalCache().shared)
+            routing = ReadRouting(pin_seconds=1.0, max_lag=1.0, enabled=True, is_replica=True, disabled_reason=reason)
+            routing.lag = 0.0
+            return reason is not None and not routing.enabled and routing._target("user", None) == (None, "disabled")
+
+        checks = {
+            "routing_enabled_with_shared_cache": routing_enabled_with_shared_cache,
+            "local_cache_disables_replica": local_cache_disables_replica,
+            "unknown_lag_uses_primary": unknown_lag_uses_primary,
+            "healthy_replica_serves_reads": healthy_replica_serves_reads,
+            "own_write_pins_primary": own_write_pins_primary,
+            "lagging_replica_uses_primary": lagging_replica_uses_primary,
+            "transaction_uses_primary": transaction_uses_primary,
+            "writes_use_primary": writes_use_primary,
+        }
+        return {name: await check() for name, check in checks.items()}
+    finally:
+        await cache.close()
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    apply_defaults()
+    tmpdir = None
+    if not os.environ.get("DB_URL"):
+        tmpdir = tempfile.TemporaryDirectory()
+        os.environ["DB_URL"] = f"sqlite://{tmpdir.name}/primary.sqlite3"
+        os.environ["DB_READ_URL"] = f"sqlite://{tmpdir.name}/replica.sqlite3"
+
+    results = asyncio.run(run())
+    for name, ok in results.items():
+        print(f"{name}: {'OK' if ok else 'FAIL'}")
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""라이브/사용자 API 벤치마크
+
+main.py 의 FastAPI 앱을 프로세스 안에서 띄우고(기본: SQLite 임시 파일) 시나리오별
+처리량, p50/p95/p99 지연, 이벤트 루프 지연을 측정해 JSON 으로 저장한다.
+
+    python -m benchmarks.run                              # 전체 시나리오
+    python -m benchmarks.run --scenario start_storm --scenario channel_poll
+    python -m benchmarks.run --compare benchmarks/results/이전결과.json
+    DB_URL=mysql://user:pw@127.0.0.1:3306/ics_bench python -m benchmarks.run
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from benchmarks._env import apply_defaults
+
+RESULTS_DIR = Path(__file__).parent / "results"
+PASSWORD = "bench-password"
+STREAMERS = 16
+TICK_SECONDS = 0.005
+
+
+def percentile(sorted_values: list[float], q: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 3)
+
+
+class LoopLagMonitor:
+    """주기적으로 깨어나 예정 시각 대비 지연(ms)을 기록"""
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            self.samples.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    def __enter__(self) -> "LoopLagMonitor":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    def summary(self) -> dict[str, float | None]:
+        samples = sorted(self.samples)
+        return {
+            "loop_lag_p50_ms": percentile(samples, 0.50),
+            "loop_lag_p99_ms": percentile(samples, 0.99),
+            "loop_lag_max_ms": round(samples[-1], 3) if samples else None,
+        }
+
+
+class Recorder:
+    """요청별 지연/상태 코드 수집"""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.statuses: dict[str, int] = {}
+
+    async def timed(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        response = await call()
+        self.latencies.append((time.perf_counter() - started) * 1000)
+        key = str(response.status_code)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        return response
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "elapsed_s": round(elapsed, 4),
+            "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "status_counts": self.statuses,
+        }
+
+
+async def measure(body: Callable[[Recorder], Awaitable[None]]) -> dict[str, Any]:
+    recorder = Recorder()
+    with LoopLagMonitor() as monitor:
+        started = time.perf_counter()
+        await body(recorder)
+        elapsed = time.perf_counter() - started
+    return {**recorder.summary(elapsed), **monitor.summary()}
+
+
+class BenchContext:
+    def __init__(self, client: Any, admin_token: str, streamers: list[tuple[str, str]]):
+        self.client = client
+        self.admin_token = admin_token
+        # (username, token)
+        self.streamers = streamers
+
+    @staticmethod
+    def auth(token: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {token}"}
+
+
+# ---------- 시나리오 ----------
+
+
+async def scenario_login_burst(ctx: BenchContext, args: argparse.Namespace) -> dict[str, Any]:
+    """스트리머 전원이 동시에 /token 로그인 (bcrypt 검증 폭주)"""
+
+    async def body(recorder: Recorder) -> None:
+        async def login(username: str) -> None:
+            await recorder.timed(
+                lambda: ctx.client.post("/api/v1/users/token", data={"username": username, "password": PASSWORD})
+            )
+
+        await asyncio.gather(*(login(username) for _ in range(args.login_rounds) for username, _ in ctx.streamers))
+
+    return await measure(body)
+
+
+async def scenario_start_storm(ctx: BenchContext, args: argparse.Namespace) -> dict[str, Any]:
+    """16명 동시 방송 시작 후 전원 종료"""
+    payload = {
+        "stream_title": "bench",
+        "stream_description": "",
+        "stream_category": "일반",
+        "tags": [],
+        "is_public": True,
+        "quality_setting": "HD",
+    }
+
+    async def start(token: str) -> Any:
+        return await ctx.client.post("/api/v1/live/start", json=payload, headers=ctx.auth(token))
+
+    async def body(recorder: Recorder) -> None:
+        await asyncio.gather(*(recorder.timed(partial(start, token)) for _, token in ctx.streamers))
+
+    result = await measure(body)
+    await asyncio.gather(*(ctx.client.post("/api/v1/live/stop", headers=ctx.auth(token)) for _, token in ctx.streamers))
+    return result
+
+
+async def scenario_channel_poll(ctx: BenchContext, args: argparse.Namespace) -> dict[str, Any]:
+    """관리자 모니터링 화면 N 개가 /admin/channels 를 poll_hz 로 폴링 (ETag 재검증 포함)"""
+    interval = 1.0 / args.poll_hz
+
+    async def body(recorder: Recorder) -> None:
+        async def poller() -> None:
+            etag = None
+            deadline = time.perf_counter() + args.duration
+            while time.perf_counter() < deadline:
+                headers = ctx.auth(ctx.admin_token)
+                if etag:
+                    headers["If-None-Match"] = etag
+                response = await recorder.timed(lambda: ctx.client.get("/api/v1/live/admin/channels", headers=headers))
+                etag = response.headers.get("etag", etag)
+                await asyncio.sleep(interval)
+
+        await asyncio.gather(*(poller() for _ in range(args.pollers)))
+
+    return await measure(body)
+
+
+async def scenario_authed_reads(ctx: BenchContext, args: argparse.Namespace) -> dict[str, Any]:
+    """토큰 인증 읽기 (/channels) 동시 요청 -> get_current_user 경로 비용"""
+
+    async def body(recorder: Recorder) -> None:
+        async def reader(token: str) -> None:
+            for _ in range(args.reads):
+                await recorder.timed(lambda: ctx.client.get("/api/v1/live/channels", headers=ctx.auth(token)))
+
+        await asyncio.gather(*(reader(token) for _, token in ctx.streamers))
+
+    return await measure(body)
+
+
+SCENARIOS: dict[str, Callable[[BenchContext, argparse.Namespace], Awaitable[dict[str, Any]]]] = {
+    "login_burst": scenario_login_burst,
+    "start_storm": scenario_start_storm,
+    "channel_poll": scenario_channel_poll,
+    "authed_reads": scenario_authed_reads,
+}
+
+
+# ---------- 실행 ----------
+
+
+async def seed() -> None:
+    from app.core.password import password_hasher
+    from app.models.live_model import LiveModel
+    from app.models.user_model import User, UserRole
+
+    hashed = await password_hasher.hash(PASSWORD)
+    await LiveModel.filter(username__startswith="bench_").delete()
+    await User.filter(username__startswith="bench_").delete()
+    await User.create(
+        username="bench_admin",
+        password=hashed,
+        full_name="bench admin",
+        email="bench_admin@example.local",
+        role=UserRole.ADMIN,
+    )
+    await User.bulk_create(
+        [
+            User(
+                username=f"bench_streamer_{i}",
+                password=hashed,
+                full_name=f"bench streamer {i}",
+                email=f"bench_streamer_{i}@example.local",
+                role=UserRole.STREAMER,
+                channel_number=i + 1,
+            )
+            for i in range(STREAMERS)
+        ]
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    import httpx
+
+    from main import app
+
+    results: dict[str, Any] = {}
+    async with app.router.lifespan_context(app):
+        await seed()
+        # 앱 예외는 500 응답으로 기록
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def token_for(username: str) -> str:
+                response = await client.post("/api/v1/users/token", data={"username": username, "password": PASSWORD})
+                response.raise_for_status()
+                return str(response.json()["access_token"])
+
+            admin_token = await token_for("bench_admin")
+            streamers = [(f"bench_streamer_{i}", "") for i in range(STREAMERS)]
+            tokens = await asyncio.gather(*(token_for(username) for username, _ in streamers))
+            ctx = BenchContext(client, admin_token, [(u, t) for (u, _), t in zip(streamers, tokens)])
+
+            for name in args.scenario or list(SCENARIOS):
+                results[name] = await SCENARIOS[name](ctx, args)
+                print(f"{name}: {json.dumps(results[name], ensure_ascii=False)}")
+    return results
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> dict[str, Any]:
+    """시나리오별 주요 지표 변화율(%)"""
+    diff: dict[str, Any] = {}
+    for name, result in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        diff[name] = {}
+        for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "loop_lag_p99_ms"):
+            if result.get(key) is not None and before.get(key):
+                diff[name][key] = round((result[key] - before[key]) / before[key] * 100, 1)
+    return diff
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="여러 번 지정 가능, 기본 전체")
+    parser.add_argument("--login-rounds", type=int, default=2, help="login_burst: 스트리머당 로그인 횟수")
+    parser.add_argument("--pollers", type=int, default=8, help="channel_poll: 동시 폴링 화면 수")
+    parser.add_argument("--poll-hz", type=float, default=10.0, help="channel_poll: 화면당 초당 요청")
+    parser.add_argument("--duration", type=float, default=5.0, help="channel_poll: 측정 시간(초)")
+    parser.add_argument("--reads", type=int, default=50, help="authed_reads: 스트리머당 요청 수")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본 benchmarks/results/<시각>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    apply_defaults()
+    tmpdir = None
+    if not os.environ.get("DB_URL"):
+        tmpdir = tempfile.TemporaryDirectory()
+        os.environ["DB_URL"] = f"sqlite://{tmpdir.name}/bench.sqlite3"
+
+    results = asyncio.run(run(args))
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "db": os.environ["DB_URL"].split("://", 1)[0],
+            "args": {k: str(v) for k, v in vars(args).items() if k not in ("output", "compare")},
+        },
+        "results": results,
+    }
+    if args.compare:
+        report["compare"] = compare(results, json.loads(args.compare.read_text())["results"])
+        print(f"compare: {json.dumps(report['compare'], ensure_ascii=False)}")
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"saved: {output}")
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
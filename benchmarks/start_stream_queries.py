@@ -0,0 +1,106 @@
+"""스트림 시작/재시작/종료 경로의 DB 쿼리 수 확인 (예산 초과 시 종료 코드 1)
+
+인증에서 이미 조회한 사용자를 넘기므로 시작 경로는 기존 스트림 조회 1회 + 쓰기만 남아야 한다.
+
+    python -m benchmarks.start_stream_queries
+    DB_URL=mysql://user:pw@127.0.0.1:3306/ics_bench python -m benchmarks.start_stream_queries
+
+같은 확인을 pytest 로도 실행한다 (tests/test_start_stream_queries.py).
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Any, Awaitable, Callable
+
+from benchmarks._env import apply_defaults
+
+# 경로별 허용 쿼리 수 (트랜잭션 BEGIN/COMMIT 제외)
+QUERY_BUDGETS = {
+    "start": 2,  # 기존 스트림 조회 + INSERT
+    "restart": 3,  # 기존 스트림 조회 + 이력 INSERT + UPDATE
+    "stop": 3,  # 활성 스트림 조회 + 이력 INSERT + DELETE
+}
+
+
+def over_budget(counts: dict[str, int]) -> dict[str, int]:
+    """예산을 넘은 경로 -> 쿼리 수 (모두 통과하면 빈 dict)"""
+    return {path: count for path, count in counts.items() if count > QUERY_BUDGETS[path]}
+
+
+async def count_queries(call: Callable[[], Awaitable[Any]]) -> int:
+    from app.core.metrics import RequestStats, current_request_stats
+
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        await call()
+    finally:
+        current_request_stats.reset(token)
+    return stats.db_queries
+
+
+async def run() -> dict[str, int]:
+    from tortoise import Tortoise
+
+    from app.configs.database_settings import TORTOISE_ORM
+    from app.core.metrics import instrument_tortoise
+    from app.dtos.live.live_request import LiveStreamCreateRequest
+    from app.models.live_history_model import LiveHistoryModel
+    from app.models.live_model import LiveModel
+    from app.models.user_model import User, UserRole
+    from app.services.channel_backends import channel_backend
+    from app.services.live_service import service_start_stream, service_stop_stream
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        await channel_backend.setup()
+        instrument_tortoise()
+
+        await LiveModel.filter(username="bench_queries").delete()
+        await LiveHistoryModel.filter(username="bench_queries").delete()
+        await User.filter(username="bench_queries").delete()
+        user = await User.create(
+            username="bench_queries",
+            password="-",
+            full_name="bench queries",
+            email="bench_queries@example.local",
+            role=UserRole.STREAMER,
+        )
+        data = LiveStreamCreateRequest(
+            stream_title="bench",
+            stream_description="",
+            stream_category="일반",
+            tags=[],
+            is_public=True,
+            quality_setting="HD",
+        )
+        return {
+            "start": await count_queries(lambda: service_start_stream(user, data)),
+            "restart": await count_queries(lambda: service_start_stream(user, data)),
+            "stop": await count_queries(lambda: service_stop_stream(user.id)),
+        }
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    apply_defaults()
+    tmpdir = None
+    if not os.environ.get("DB_URL"):
+        tmpdir = tempfile.TemporaryDirectory()
+        os.environ["DB_URL"] = f"sqlite://{tmpdir.name}/queries.sqlite3"
+
+    counts = asyncio.run(run())
+    failed = over_budget(counts)
+    for path, count in counts.items():
+        print(f"{path}: {count} queries (budget {QUERY_BUDGETS[path]}) {'OVER' if path in failed else 'OK'}")
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,43 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import JSONResponse
-from tortoise.contrib.fastapi import register_tortoise
+from tortoise.contrib.fastapi import RegisterTortoise, tortoise_exception_handlers
 from fastapi.middleware.cors import CORSMiddleware
 from app.configs.database_settings import TORTOISE_ORM
+from app.core.responses import ModelJSONResponse
 
 
 load_dotenv(dotenv_path="envs/.env.local")
 
 DB_URL = os.getenv("DB_URL")
 
-app = FastAPI()
+# 기본 응답 직렬화 orjson (서비스 모델을 직접 돌려주는 라우트는 ModelJSONResponse 로 재검증 생략)
+app = FastAPI(default_response_class=ModelJSONResponse, exception_handlers=tortoise_exception_handlers())
+
+# 구조화 로그 (큐 + 백그라운드 스레드)
+from app.configs import settings
+from app.core.log import RequestIdMiddleware, log_pipeline
+
+log_pipeline.start(
+    level=settings.LOG_LEVEL,
+    debug_sample_every=settings.LOG_DEBUG_SAMPLE_EVERY,
+    json_format=settings.LOG_JSON,
+    max_queue=settings.LOG_QUEUE_SIZE,
+)
+logger = logging.getLogger("app.main")
 
 # 로그인 이후 프로필 정보 변경 시 나타나는 422 오류 로그 확인
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     exc_str = f"{exc}".replace("\n", " ").replace("   ", " ")
-    print(f"422 오류 발생: {exc_str}")
+    logger.info("422 오류 발생", extra={"path": request.url.path, "error": exc_str})
     content = {
         "status_code": 10422,
         "message": exc_str,
@@ -44,17 +62,101 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# tortoise orm 관리
-register_tortoise(
-    app,
-    config=TORTOISE_ORM,
-    generate_schemas=True,
-    add_exception_handlers=True,
+# 응답 압축 (JSON 목록/채널 보드), 메트릭 미들웨어 안쪽이라 압축 시간도 라우트 지연에 포함
+from app.core.compression import CompressionMiddleware
+
+if settings.HTTP_COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.HTTP_COMPRESSION_MIN_SIZE,
+        gzip_level=settings.HTTP_GZIP_LEVEL,
+        brotli_quality=settings.HTTP_BROTLI_QUALITY,
+    )
+
+# 라우트별 지연/DB 쿼리 수집 (X-Profile: 1 요청 시 Server-Timing 헤더)
+from app.core.metrics import MetricsMiddleware
+
+app.add_middleware(MetricsMiddleware, profile_header=settings.METRICS_PROFILE_HEADER_ENABLED)
+# 요청 id (로그 상관관계, 가장 바깥에서 설정)
+app.add_middleware(RequestIdMiddleware)
+
+# DB 연결 풀 계측 (획득 대기/사용 중 연결 수, 대기 상한 초과 시 503), 첫 쿼리 전에 설치
+from app.core.db_pool import pool_monitor
+
+pool_monitor.install()
+
+# 메트릭 수집 (DB 클라이언트 계측, bcrypt 통계, 이벤트 루프 지연)
+from app.core.metrics import (
+    instrument_tortoise,
+    monitor_event_loop_lag,
+    register_db_pool_metrics,
+    register_password_hasher_metrics,
 )
+from app.core.password import password_hasher
+
+register_password_hasher_metrics(password_hasher)
+register_db_pool_metrics(pool_monitor)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """앱 시작/종료 작업 (시작 순서의 역순으로 종료, 로그 큐는 마지막에 비움)
+
+    선택 백엔드(Janus 등)는 설정으로 켠 경우에만 import 한다.
+    """
+    from app.core.auth import user_cache
+    from app.core.cache import cache
+    from app.core.db_routing import replica_lag_monitor
+    from app.services.channel_backends import channel_backend
+    from app.services.live_history_service import history_archiver
+    from app.services.live_service import stream_reaper
+    from app.services.room_id_pool import room_id_pool
+
+    try:
+        # tortoise orm 관리 (스키마는 `aerich upgrade` 로 미리 적용, DB_GENERATE_SCHEMAS 는 로컬 개발용)
+        async with RegisterTortoise(app, config=TORTOISE_ORM, generate_schemas=settings.DB_GENERATE_SCHEMAS):
+            # 채널 할당 백엔드 초기화 (tortoise 초기화 이후 실행)
+            await channel_backend.setup()
+            await room_id_pool.reconcile()
+            # 공유 캐시 (redis 백엔드면 무효화 구독 시작)
+            await cache.start()
+            if user_cache.ttl <= 0 < settings.USER_CACHE_TTL_SECONDS:
+                logger.warning("워커가 여럿인데 공유 캐시가 없어 인증 사용자 캐시 비활성화 (CACHE_BACKEND=redis 필요)")
+            instrument_tortoise()
+            loop_lag_task = asyncio.create_task(monitor_event_loop_lag(settings.METRICS_LOOP_LAG_INTERVAL_SECONDS))
+            # 스트림 이력 아카이브, heartbeat 가 끊긴 스트림 종료 백그라운드 작업
+            if settings.LIVE_HISTORY_ARCHIVE_ENABLED:
+                history_archiver.start()
+            if settings.LIVE_REAPER_ENABLED:
+                stream_reaper.start()
+            # 읽기 복제본 지연 확인 (복제본이 설정된 경우만, 지연 초과 시 읽기를 primary 로)
+            replica_lag_monitor.start()
+            try:
+                yield
+            finally:
+                await replica_lag_monitor.stop()
+                await stream_reaper.stop()
+                await history_archiver.stop()
+                loop_lag_task.cancel()
+                await cache.close()
+                if settings.JANUS_ENABLED:
+                    from app.services.janus_service import janus_client
+
+                    await janus_client.close()
+                # bcrypt 스레드 풀 정리
+                password_hasher.shutdown()
+    finally:
+        # 로그 큐 비우기 (다른 종료 작업의 로그까지 기록)
+        log_pipeline.stop()
+
+
+app.router.lifespan_context = lifespan
 
 # 라우터 등록 관리
 from app.routers.user_router import router as user_router
 from app.routers.live_router import router as live_router
+from app.routers.metrics_router import router as metrics_router
 
 app.include_router(user_router, prefix="/api/v1/users")
-app.include_router(live_router, prefix="/api")
\ No newline at end of file
+app.include_router(live_router, prefix="/api")
+app.include_router(metrics_router)
\ No newline at end of file
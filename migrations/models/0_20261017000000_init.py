@@ -0,0 +1,110 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `aerich` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `version` VARCHAR(255) NOT NULL,
+            `app` VARCHAR(100) NOT NULL,
+            `content` JSON NOT NULL
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `user` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+            `modified_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+            `username` VARCHAR(40) NOT NULL UNIQUE,
+            `password` VARCHAR(128) NOT NULL,
+            `full_name` VARCHAR(40) NOT NULL,
+            `email` VARCHAR(255) NOT NULL UNIQUE,
+            `agree_terms` BOOL NOT NULL DEFAULT 0,
+            `role` VARCHAR(8) NOT NULL COMMENT 'ADMIN: admin\\nSTREAMER: streamer' DEFAULT 'streamer',
+            `affiliation` VARCHAR(100) COMMENT '소속',
+            `channel_number` INT COMMENT '정적 할당된 채널 번호',
+            `facility` VARCHAR(50) COMMENT '채널 풀 시설, 없으면 기본 시설'
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `lives` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+            `modified_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+            `username` VARCHAR(50) NOT NULL COMMENT '스트리머 사용자명',
+            `full_name` VARCHAR(100) NOT NULL COMMENT '스트리머 실명',
+            `channel_number` INT NOT NULL COMMENT '채널 번호 (시설별 구간)',
+            `janus_room_id` INT NOT NULL UNIQUE COMMENT 'Janus room ID',
+            `stream_category` VARCHAR(50) NOT NULL DEFAULT '일반',
+            `stream_title` VARCHAR(200) NOT NULL COMMENT '스트림 제목' DEFAULT '라이브 스트림',
+            `stream_description` LONGTEXT,
+            `tags` JSON NOT NULL,
+            `thumbnail_url` VARCHAR(500),
+            `is_public` BOOL NOT NULL DEFAULT 1,
+            `quality_setting` VARCHAR(20) NOT NULL DEFAULT 'HD',
+            `is_active` BOOL NOT NULL COMMENT '스트림 활성 상태' DEFAULT 1,
+            `active_channel` INT UNIQUE COMMENT '활성 채널 점유 마커',
+            `started_at` DATETIME(6) NOT NULL COMMENT '스트림 시작 시간' DEFAULT CURRENT_TIMESTAMP(6),
+            `last_heartbeat_at` DATETIME(6) COMMENT '마지막 heartbeat 시각',
+            `ended_at` DATETIME(6) COMMENT '스트림 종료 시간',
+            `user_id` INT,
+            UNIQUE KEY `uid_lives_user_id_73b147` (`user_id`),
+            CONSTRAINT `fk_lives_user_d6ed864d` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE CASCADE,
+            KEY `idx_lives_usernam_ce67b7` (`username`),
+            KEY `idx_lives_channel_bd7399` (`channel_number`),
+            KEY `idx_lives_channel_62dd0b` (`channel_number`, `is_active`),
+            KEY `idx_lives_is_acti_1054d5` (`is_active`, `janus_room_id`),
+            KEY `idx_lives_is_acti_ab2c5e` (`is_active`, `stream_category`, `started_at`),
+            KEY `idx_lives_is_publ_c3734a` (`is_public`, `is_active`, `channel_number`),
+            KEY `idx_lives_user_id_238960` (`user_id`, `is_active`),
+            KEY `idx_lives_started_8494a6` (`started_at`),
+            KEY `idx_lives_last_he_fdd9ab` (`last_heartbeat_at`)
+        ) CHARACTER SET utf8mb4 COMMENT='라이브 스트림 정보';
+        CREATE TABLE IF NOT EXISTS `live_history_archives` (
+            `username` VARCHAR(50) NOT NULL COMMENT '스트리머 사용자명',
+            `full_name` VARCHAR(100) NOT NULL COMMENT '스트리머 실명',
+            `channel_number` INT NOT NULL COMMENT '채널 번호',
+            `janus_room_id` INT NOT NULL COMMENT 'Janus room ID',
+            `stream_category` VARCHAR(50) NOT NULL,
+            `stream_title` VARCHAR(200) NOT NULL,
+            `stream_description` LONGTEXT,
+            `tags` JSON NOT NULL,
+            `is_public` BOOL NOT NULL,
+            `quality_setting` VARCHAR(20) NOT NULL,
+            `started_at` DATETIME(6) NOT NULL COMMENT '스트림 시작 시간',
+            `ended_at` DATETIME(6) NOT NULL COMMENT '스트림 종료 시간',
+            `duration` INT NOT NULL COMMENT '방송 시간 (초 단위)',
+            `end_reason` VARCHAR(20) NOT NULL COMMENT '종료 사유 (stopped/restarted/expired)' DEFAULT 'stopped',
+            `id` BIGINT NOT NULL PRIMARY KEY,
+            `user_id` INT COMMENT '스트리머 ID (사용자 삭제 후에도 유지)',
+            `archive_month` INT NOT NULL COMMENT '종료 월 (YYYYMM)',
+            KEY `idx_live_histor_user_id_dcd888` (`user_id`, `started_at`),
+            KEY `idx_live_histor_archive_c7f8ae` (`archive_month`)
+        ) CHARACTER SET utf8mb4 COMMENT='라이브 스트림 종료 이력 아카이브';
+        CREATE TABLE IF NOT EXISTS `live_histories` (
+            `username` VARCHAR(50) NOT NULL COMMENT '스트리머 사용자명',
+            `full_name` VARCHAR(100) NOT NULL COMMENT '스트리머 실명',
+            `channel_number` INT NOT NULL COMMENT '채널 번호',
+            `janus_room_id` INT NOT NULL COMMENT 'Janus room ID',
+            `stream_category` VARCHAR(50) NOT NULL,
+            `stream_title` VARCHAR(200) NOT NULL,
+            `stream_description` LONGTEXT,
+            `tags` JSON NOT NULL,
+            `is_public` BOOL NOT NULL,
+            `quality_setting` VARCHAR(20) NOT NULL,
+            `started_at` DATETIME(6) NOT NULL COMMENT '스트림 시작 시간',
+            `ended_at` DATETIME(6) NOT NULL COMMENT '스트림 종료 시간',
+            `duration` INT NOT NULL COMMENT '방송 시간 (초 단위)',
+            `end_reason` VARCHAR(20) NOT NULL COMMENT '종료 사유 (stopped/restarted/expired)' DEFAULT 'stopped',
+            `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `user_id` INT,
+            CONSTRAINT `fk_live_his_user_319a7d98` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE SET NULL,
+            KEY `idx_live_histor_user_id_b5349e` (`user_id`, `started_at`),
+            KEY `idx_live_histor_started_b15fea` (`started_at`)
+        ) CHARACTER SET utf8mb4 COMMENT='라이브 스트림 종료 이력';
+        CREATE TABLE IF NOT EXISTS `channel_slots` (
+            `channel_number` INT NOT NULL PRIMARY KEY COMMENT '채널 번호',
+            `user_id` INT COMMENT '점유 사용자 ID, 비어 있으면 NULL',
+            `claimed_at` DATETIME(6) COMMENT '점유 시각'
+        ) CHARACTER SET utf8mb4 COMMENT='채널 슬롯 점유 정보';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
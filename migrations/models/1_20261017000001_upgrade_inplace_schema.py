@@ -0,0 +1,95 @@
+from tortoise import BaseDBAsyncClient
+
+# 이전 버전(앱 시작 시 generate_schemas)으로 만든 DB 를 현재 모델에 맞춤.
+# 0_init 으로 새로 만든 DB 는 이미 최신이므로 information_schema 를 보고 빠진 것만 적용한다.
+
+LIVES_INDEXES = {
+    "idx_lives_is_acti_1054d5": "(`is_active`, `janus_room_id`)",
+    "idx_lives_is_acti_ab2c5e": "(`is_active`, `stream_category`, `started_at`)",
+    "idx_lives_is_publ_c3734a": "(`is_public`, `is_active`, `channel_number`)",
+    "idx_lives_last_he_fdd9ab": "(`last_heartbeat_at`)",
+}
+
+
+async def _columns(db: BaseDBAsyncClient, table: str) -> set[str]:
+    _, rows = await db.execute_query(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS " "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        [table],
+    )
+    return {row["COLUMN_NAME"] for row in rows}
+
+
+async def _indexes(db: BaseDBAsyncClient, table: str) -> dict[str, tuple[bool, tuple[str, ...]]]:
+    """인덱스 이름 -> (유니크 여부, 컬럼)"""
+    _, rows = await db.execute_query(
+        "SELECT INDEX_NAME, NON_UNIQUE, COLUMN_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY INDEX_NAME, SEQ_IN_INDEX",
+        [table],
+    )
+    indexes: dict[str, tuple[bool, tuple[str, ...]]] = {}
+    for row in rows:
+        unique, columns = indexes.get(row["INDEX_NAME"], (not int(row["NON_UNIQUE"]), ()))
+        indexes[row["INDEX_NAME"]] = (unique, columns + (row["COLUMN_NAME"],))
+    return indexes
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    statements = []
+
+    if "facility" not in await _columns(db, "user"):
+        statements.append("ALTER TABLE `user` ADD `facility` VARCHAR(50) COMMENT '채널 풀 시설, 없으면 기본 시설';")
+
+    lives_columns = await _columns(db, "lives")
+    if "active_channel" not in lives_columns:
+        # lives 에는 활성 스트림만 남김 (종료된 행은 이력으로 이동)
+        statements += [
+            "INSERT INTO `live_histories` (`user_id`, `username`, `full_name`, `channel_number`, "
+            "`janus_room_id`, `stream_category`, `stream_title`, `stream_description`, `tags`, "
+            "`is_public`, `quality_setting`, `started_at`, `ended_at`, `duration`, `end_reason`) "
+            "SELECT `user_id`, `username`, `full_name`, `channel_number`, `janus_room_id`, "
+            "`stream_category`, `stream_title`, `stream_description`, `tags`, `is_public`, "
+            "`quality_setting`, `started_at`, COALESCE(`ended_at`, `modified_at`), "
+            "GREATEST(TIMESTAMPDIFF(SECOND, `started_at`, COALESCE(`ended_at`, `modified_at`)), 0), "
+            "'stopped' FROM `lives` WHERE `is_active` = 0;",
+            "DELETE FROM `lives` WHERE `is_active` = 0;",
+            "ALTER TABLE `lives` ADD `active_channel` INT UNIQUE COMMENT '활성 채널 점유 마커';",
+            # 같은 채널의 활성 행이 여럿이면 가장 먼저 시작한 행만 점유
+            "UPDATE `lives` l JOIN (SELECT MIN(`id`) AS `id` FROM `lives` GROUP BY `channel_number`) f "
+            "ON f.`id` = l.`id` SET l.`active_channel` = l.`channel_number`;",
+        ]
+    if "last_heartbeat_at" not in lives_columns:
+        statements += [
+            "ALTER TABLE `lives` ADD `last_heartbeat_at` DATETIME(6) COMMENT '마지막 heartbeat 시각';",
+            "UPDATE `lives` SET `last_heartbeat_at` = `started_at`;",
+        ]
+
+    indexes = await _indexes(db, "lives")
+    # 사용자당 활성 스트림 1개: (user_id, is_active) 유니크 -> (user_id) 유니크
+    if (True, ("user_id",)) not in indexes.values():
+        statements.append("ALTER TABLE `lives` ADD UNIQUE INDEX `uid_lives_user_id_73b147` (`user_id`);")
+    for name, (unique, columns) in indexes.items():
+        if unique and columns == ("user_id", "is_active"):
+            statements.append(f"ALTER TABLE `lives` DROP INDEX `{name}`;")
+    for name, definition in LIVES_INDEXES.items():
+        if name not in indexes:
+            statements.append(f"ALTER TABLE `lives` ADD INDEX `{name}` {definition};")
+    # 활성 방 room id 유니크 (워커 간 중복 발급 거부), 겹치는 행은 가장 먼저 만든 행만 id 유지
+    if (True, ("janus_room_id",)) not in indexes.values():
+        statements += [
+            "UPDATE `lives` l JOIN (SELECT `janus_room_id`, MIN(`id`) AS `keep_id` FROM `lives` "
+            "GROUP BY `janus_room_id` HAVING COUNT(*) > 1) d ON d.`janus_room_id` = l.`janus_room_id` "
+            "JOIN (SELECT MAX(`janus_room_id`) AS `top` FROM `lives`) m "
+            "SET l.`janus_room_id` = m.`top` + l.`id` WHERE l.`id` <> d.`keep_id`;",
+            "ALTER TABLE `lives` ADD UNIQUE INDEX `janus_room_id` (`janus_room_id`);",
+        ]
+    for name, (unique, columns) in indexes.items():
+        if not unique and columns == ("janus_room_id",):
+            statements.append(f"ALTER TABLE `lives` DROP INDEX `{name}`;")
+
+    # 적용할 것이 없어도 aerich 는 스크립트를 실행하므로 빈 쿼리 대신 no-op
+    return "\n".join(statements) or "SELECT 1;"
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
@@ -0,0 +1,54 @@
+"""pytest 공통 설정
+
+- 앱 설정 필수값(벤치마크 기본값)과 세션용 sqlite DB_URL 을 MonkeyPatch 로 넣고 세션이 끝나면 되돌린다.
+  Settings 는 첫 import 때 만들어지므로 테스트 모듈 수집 전에 설정한다 (pytest_configure).
+- db 픽스처: 테스트마다 새 sqlite 파일로 Tortoise 초기화 + 앱 시작 시와 같은 메모리 상태 재구성
+"""
+
+import os
+import tempfile
+from typing import AsyncIterator
+
+import pytest
+
+from benchmarks._env import DEFAULTS
+
+_env = pytest.MonkeyPatch()
+_session_dir = tempfile.TemporaryDirectory()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    for key, value in DEFAULTS.items():
+        if key not in os.environ:
+            _env.setenv(key, value)
+    if not os.environ.get("DB_URL"):
+        _env.setenv("DB_URL", f"sqlite://{_session_dir.name}/session.sqlite3")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    _env.undo()
+    _session_dir.cleanup()
+
+
+@pytest.fixture
+async def db(tmp_path: os.PathLike[str]) -> AsyncIterator[None]:
+    """테스트 전용 sqlite DB (스키마 생성, 채널/room id 풀과 캐시를 새 DB 기준으로)"""
+    from tortoise import Tortoise
+
+    from app.configs.database_settings import TORTOISE_ORM
+    from app.core.cache import LocalCache, cache
+    from app.services.channel_backends import channel_backend
+    from app.services.room_id_pool import room_id_pool
+
+    await Tortoise.init(config={**TORTOISE_ORM, "connections": {"default": f"sqlite://{tmp_path}/test.sqlite3"}})
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        if isinstance(cache, LocalCache):
+            cache._entries.clear()
+        # 사용자 캐시, 채널 보드 스냅샷 등 이전 테스트의 로컬 사본 제거
+        cache._dispatch_all()
+        await channel_backend.setup()
+        await room_id_pool.reconcile()
+        yield
+    finally:
+        await Tortoise.close_connections()
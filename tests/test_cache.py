@@ -0,0 +1,46 @@
+import pytest
+
+from app.core.cache import LocalCache
+
+
+async def test_local_cache_expires_and_evicts_least_recent() -> None:
+    cache = LocalCache(max_entries=2)
+    await cache.set("a:1", b"1", ttl=60.0)
+    await cache.set("a:2", b"2", ttl=60.0)
+    await cache.set("a:expired", b"x", ttl=-1.0)
+
+    # 가장 오래 쓰지 않은 a:1 이 밀려남
+    assert await cache.get("a:1") is None
+    assert await cache.get("a:2") == b"2"
+    assert await cache.get("a:expired") is None
+
+
+async def test_invalidate_drops_shared_key_and_calls_handlers() -> None:
+    cache = LocalCache()
+    seen: list[str] = []
+    cache.on_invalidate("user", seen.append)
+    cache.on_invalidate("other", lambda key: pytest.fail("다른 네임스페이스 핸들러 호출"))
+    await cache.set("user:7", b"cached", ttl=60.0)
+
+    await cache.invalidate("user", "7")
+
+    assert seen == ["7"]
+    assert await cache.get("user:7") is None
+
+
+async def test_failing_handler_does_not_block_others() -> None:
+    cache = LocalCache()
+    seen: list[str] = []
+
+    def broken(key: str) -> None:
+        raise RuntimeError(key)
+
+    cache.on_invalidate("board", broken)
+    cache.on_invalidate("board", seen.append)
+    cache.on_message("events", seen.append)
+
+    await cache.invalidate("board")
+    # 구독 재연결 등 메시지를 놓쳤을 수 있을 때는 모든 핸들러에 전체 무효화
+    cache._dispatch_all()
+
+    assert seen == ["", "", ""]
@@ -0,0 +1,111 @@
+import pytest
+
+from app.services.channel_allocator import ChannelAllocator, ChannelPools, nearest_bit
+from app.services.channel_policy import ChannelAssignments, ChannelPolicy
+
+
+def test_nearest_bit_prefers_lower_on_tie() -> None:
+    assert nearest_bit(0, 3) is None
+    assert nearest_bit(0b1000_0001, 3) == 0
+    assert nearest_bit(0b1000_0001, 4) == 7
+    assert nearest_bit(0b0010_1000, 4) == 3
+    assert nearest_bit(0b0000_0100, 0) == 2
+
+
+def test_allocator_claims_lowest_and_reuses_released() -> None:
+    allocator = ChannelAllocator(capacity=3, first_channel=10)
+
+    assert [allocator.claim(user_id) for user_id in (1, 2, 3)] == [10, 11, 12]
+    assert allocator.claim(4) is None
+    assert allocator.owner_of(11) == 2
+
+    allocator.release(11)
+    assert allocator.is_free(11)
+    assert allocator.claim(5) == 11
+    # 구간 밖 채널은 무시
+    assert not allocator.claim_specific(13)
+    allocator.release(99)
+    assert allocator.free_count == 0
+
+
+def test_allocator_load_keeps_uncommitted_claims() -> None:
+    allocator = ChannelAllocator(capacity=4)
+    pending = allocator.claim(user_id=1)
+    committed = allocator.claim(user_id=2)
+    assert committed is not None
+    allocator.confirm(committed)
+
+    # DB 에는 다른 워커의 채널 3 만 있음 -> 커밋 전인 채널 1 은 유지, 확정된 채널 2 는 DB 기준으로 비움
+    allocator.load([(3, 7)])
+
+    assert allocator.used_channels == {pending, 3}
+    assert allocator.owner_of(3) == 7
+    assert allocator.is_free(committed)
+
+
+def test_pools_split_channels_by_facility() -> None:
+    pools = ChannelPools({"seoul": 2, "busan": 3})
+
+    assert [pools.facility_of(channel_number) for channel_number in (0, 1, 2, 3, 5, 6)] == [
+        None,
+        "seoul",
+        "seoul",
+        "busan",
+        "busan",
+        None,
+    ]
+    assert pools.claim(1) == 1
+    assert pools.claim(2, facility="busan") == 3
+    with pytest.raises(KeyError):
+        pools.claim(3, facility="daegu")
+
+    pools.load([(2, 4), (5, 5), (9, 9)])
+    assert pools.used_channels == {1, 2, 3, 5}
+    assert pools.free_count == 1
+
+
+def test_pools_reject_empty_facilities() -> None:
+    with pytest.raises(ValueError):
+        ChannelPools({})
+    with pytest.raises(ValueError):
+        ChannelPools({"seoul": 0})
+
+
+def test_policy_assigned_nearest_and_reserved_fallback() -> None:
+    pools = ChannelPools({"default": 4})
+    assignments = ChannelAssignments(pools)
+    assignments.load([(1, 3), (2, 1)])
+    policy = ChannelPolicy(assignments)
+    pool = pools.pool()
+
+    assert policy.choose(pool, user_id=1) == (3, "assigned")
+    # 배정 없는 사용자는 다른 사용자의 배정 채널(1, 3)을 피함
+    assert policy.choose(pool, user_id=9) == (2, "nearest")
+
+    pool.claim_specific(3, user_id=8)
+    # 배정 채널이 쓰이면 가장 가까운 빈 채널 (2, 4 중 같은 거리면 낮은 쪽)
+    assert policy.choose(pool, user_id=1) == (2, "nearest")
+
+    pool.claim_specific(2, user_id=8)
+    pool.claim_specific(4, user_id=8)
+    # 남은 채널이 다른 사용자 배정 채널뿐이면 그 채널
+    assert policy.choose(pool, user_id=9) == (1, "reserved_fallback")
+    pool.claim_specific(1, user_id=8)
+    assert policy.choose(pool, user_id=9) is None
+
+
+def test_policy_priority_reserve_keeps_last_channels_for_assigned_users() -> None:
+    pools = ChannelPools({"default": 3})
+    assignments = ChannelAssignments(pools)
+    assignments.assign(1, 3)
+    policy = ChannelPolicy(assignments, priority_reserve=1)
+    pool = pools.pool()
+    pool.claim_specific(1)
+
+    assert policy.choose(pool, user_id=9) == (2, "nearest")
+    pool.claim_specific(2)
+    assert policy.choose(pool, user_id=9) is None
+    assert policy.choose(pool, user_id=1) == (3, "assigned")
+
+    assignments.remove(1)
+    assert assignments.reserved_mask(pool) == 0
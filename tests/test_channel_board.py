@@ -0,0 +1,115 @@
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from app.core.cache import LocalCache
+from app.core.http_cache import conditional_response, etag_for
+from app.services.channel_allocator import ChannelPools
+from app.services.channel_board import ChannelBoard, ChannelBoardSnapshot
+
+
+class Board(BaseModel):
+    channels: list[int]
+
+
+class Summary(BaseModel):
+    count: int
+
+
+class CountingBuilder:
+    """빌더 호출 수 집계 (호출할 때마다 보드가 바뀌도록 build 번호를 채널에 넣음)"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> BaseModel:
+        self.calls += 1
+        return Board(channels=[self.calls])
+
+
+def summarize(board: BaseModel) -> BaseModel:
+    assert isinstance(board, Board)
+    return Summary(count=len(board.channels))
+
+
+def request_with(if_none_match: str) -> Request:
+    return Request({"type": "http", "method": "GET", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+async def test_snapshot_rebuilds_only_after_invalidate() -> None:
+    builder = CountingBuilder()
+    snapshot = ChannelBoardSnapshot(builder, max_age=60.0, views={"summary": summarize})
+
+    body, etag = await snapshot.get()
+    assert await snapshot.get() == (body, etag)
+    assert etag == etag_for(body)
+    # 같은 버전의 다른 형태는 이미 만든 보드에서
+    await snapshot.get("summary")
+    assert builder.calls == 1
+
+    snapshot.invalidate()
+    new_body, new_etag = await snapshot.get()
+    assert builder.calls == 2
+    assert new_body != body and new_etag != etag
+
+
+async def test_snapshot_expires_after_max_age() -> None:
+    builder = CountingBuilder()
+    snapshot = ChannelBoardSnapshot(builder, max_age=0.0)
+
+    await snapshot.get()
+    await snapshot.get()
+
+    assert builder.calls == 2
+
+
+async def test_snapshot_reuses_body_built_by_another_worker() -> None:
+    shared = LocalCache()
+    first, second = CountingBuilder(), CountingBuilder()
+    this_worker = ChannelBoardSnapshot(first, max_age=60.0, shared=shared, views={"summary": summarize})
+    other_worker = ChannelBoardSnapshot(second, max_age=60.0, shared=shared, views={"summary": summarize})
+
+    built = await this_worker.get()
+    summary = await this_worker.get("summary")
+
+    assert await other_worker.get() == built
+    assert await other_worker.get("summary") == summary
+    assert (first.calls, second.calls) == (1, 0)
+
+
+async def test_board_invalidates_only_changed_window() -> None:
+    calls: list[tuple[str, int]] = []
+
+    async def build(facility: str, page: int, first: int, last: int) -> BaseModel:
+        calls.append((facility, page))
+        return Board(channels=list(range(first, last + 1)))
+
+    board = ChannelBoard(build, ChannelPools({"seoul": 4, "busan": 2}), page_size=2, max_age=60.0)
+    assert board.page_count("seoul") == 2
+    assert board.window("seoul", 1) == (3, 4)
+    assert board.window_key(5) == "busan:0"
+    assert board.window_key(7) is None
+
+    body, _ = await board.get("seoul", 1)
+    assert Board.model_validate_json(body).channels == [3, 4]
+    await board.get("busan", 0)
+
+    board.invalidate(board.window_key(4) or "")
+    await board.get("seoul", 1)
+    await board.get("busan", 0)
+    assert calls == [("seoul", 1), ("busan", 0), ("seoul", 1)]
+
+    board.invalidate()
+    await board.get("busan", 0)
+    assert calls[-1] == ("busan", 0)
+
+
+def test_conditional_response_returns_304_on_matching_etag() -> None:
+    body = b'{"channels":[]}'
+    etag = etag_for(body)
+
+    assert conditional_response(request_with(f'W/{etag}, "other"'), body).status_code == 304
+    assert conditional_response(request_with("*"), body).status_code == 304
+    response = conditional_response(request_with('"other"'), body)
+    assert response.status_code == 200
+    assert response.body == body
+    assert response.headers["etag"] == etag
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any
+
+import pytest
+import tortoise
+from fastapi import HTTPException
+from tortoise.backends.base.client import TransactionContextPooled
+from tortoise.backends.mysql.client import MySQLClient
+
+from app.core.db_pool import MonitoredPool, PoolMonitor, tortoise_supported
+
+
+class FakePool:
+    """asyncmy 풀 대신: 빈 연결이 없으면 release 될 때까지 acquire 대기"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.size = maxsize
+        self._free: asyncio.Queue[object] = asyncio.Queue()
+        for _ in range(maxsize):
+            self._free.put_nowait(object())
+
+    @property
+    def freesize(self) -> int:
+        return self._free.qsize()
+
+    async def acquire(self) -> object:
+        return await self._free.get()
+
+    def release(self, connection: object) -> None:
+        self._free.put_nowait(connection)
+
+
+@pytest.fixture
+def restore_tortoise_internals(monkeypatch: pytest.MonkeyPatch) -> None:
+    # install() 이 바꾼 메서드를 테스트 후 되돌림
+    monkeypatch.setattr(MySQLClient, "create_connection", MySQLClient.create_connection)
+    monkeypatch.setattr(TransactionContextPooled, "__aenter__", TransactionContextPooled.__aenter__)
+
+
+def test_tortoise_supported() -> None:
+    assert tortoise_supported(tortoise.__version__)
+    assert tortoise_supported("0.25.4")
+    assert not tortoise_supported("0.26.0")
+    assert not tortoise_supported("1.0")
+
+
+def test_install_skips_untested_tortoise(monkeypatch: pytest.MonkeyPatch, restore_tortoise_internals: None) -> None:
+    monkeypatch.setattr(tortoise, "__version__", "0.26.0")
+    create_connection, enter = MySQLClient.create_connection, TransactionContextPooled.__aenter__
+
+    PoolMonitor(acquire_timeout=1.0).install()
+
+    assert MySQLClient.create_connection is create_connection
+    assert TransactionContextPooled.__aenter__ is enter
+
+
+def test_install_wraps_pool_creation(restore_tortoise_internals: None) -> None:
+    create_connection = MySQLClient.create_connection
+
+    PoolMonitor(acquire_timeout=1.0).install()
+
+    assert MySQLClient.create_connection is not create_connection
+    assert getattr(MySQLClient.create_connection, "__wrapped__") is create_connection
+
+
+async def test_acquire_timeout_returns_503_and_stats() -> None:
+    pool = MonitoredPool(FakePool(maxsize=1), "default", acquire_timeout=0.05)
+    connection: Any = await pool.acquire()
+
+    with pytest.raises(HTTPException) as e:
+        await pool.acquire()
+
+    assert e.value.status_code == 503
+    assert pool.stats() == {"in_use": 1, "idle": 0, "waiting": 0, "max_size": 1}
+    pool.release(connection)
+    assert pool.stats()["idle"] == 1
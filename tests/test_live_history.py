@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.live_history_model import LiveHistoryArchiveModel, LiveHistoryModel
+from app.models.user_model import User, UserRole
+from app.services.live_history_service import (
+    HistoryArchiver,
+    service_get_stream_history,
+)
+from app.services.pagination import encode_cursor
+
+NOW = datetime(2024, 6, 15, tzinfo=timezone.utc)
+
+
+async def create_history(user: User, days_ago: int) -> LiveHistoryModel:
+    started_at = NOW - timedelta(days=days_ago, hours=1)
+    return await LiveHistoryModel.create(
+        user=user,
+        username=user.username,
+        full_name=user.full_name,
+        channel_number=1,
+        janus_room_id=1000 + days_ago,
+        stream_category="일반",
+        stream_title=f"{days_ago}일 전 방송",
+        is_public=True,
+        quality_setting="HD",
+        started_at=started_at,
+        ended_at=started_at + timedelta(hours=1),
+        duration=3600,
+    )
+
+
+@pytest.fixture
+async def streamer(db: None) -> User:
+    return await User.create(
+        username="history_streamer",
+        password="-",
+        full_name="history_streamer",
+        email="history_streamer@example.local",
+        role=UserRole.STREAMER,
+    )
+
+
+async def test_archive_batch_moves_only_old_rows(streamer: User) -> None:
+    old = [await create_history(streamer, days_ago) for days_ago in (40, 50, 60)]
+    recent = await create_history(streamer, 1)
+    archiver = HistoryArchiver(retention_days=30, batch_size=2)
+    cutoff = NOW - timedelta(days=30)
+
+    assert await archiver.archive_batch(cutoff) == 2
+    assert await archiver.archive_batch(cutoff) == 1
+    assert await archiver.archive_batch(cutoff) == 0
+
+    assert [row.id for row in await LiveHistoryModel.all()] == [recent.id]
+    archived = await LiveHistoryArchiveModel.all().order_by("id")
+    assert [row.id for row in archived] == [row.id for row in old]
+    assert all(row.user_id == streamer.id for row in archived)
+    assert archived[0].archive_month == 202405
+
+
+async def test_purge_archive_drops_months_past_retention(streamer: User) -> None:
+    for days_ago in (20, 80):
+        await create_history(streamer, days_ago)
+    archiver = HistoryArchiver(retention_days=0, archive_retention_months=2)
+    await archiver.archive_batch(NOW)
+
+    assert await archiver.purge_archive(NOW) == 1
+    assert [row.archive_month for row in await LiveHistoryArchiveModel.all()] == [202405]
+
+
+async def test_history_pages_across_recent_and_archive(streamer: User) -> None:
+    for days_ago in (1, 2, 40, 50):
+        await create_history(streamer, days_ago)
+    await HistoryArchiver(retention_days=30).archive_batch(NOW - timedelta(days=30))
+
+    titles: list[str] = []
+    cursor = None
+    while True:
+        page = await service_get_stream_history(user_id=streamer.id, limit=3, cursor=cursor)
+        titles += [history.stream_title for history in page.histories]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert titles == ["1일 전 방송", "2일 전 방송", "40일 전 방송", "50일 전 방송"]
+
+
+@pytest.mark.parametrize("cursor", ["%%%", encode_cursor(1), encode_cursor("yesterday", 1), encode_cursor(NOW, "x")])
+async def test_history_rejects_invalid_cursor(db: None, cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service_get_stream_history(cursor=cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.dtos.live.live_request import LiveStreamCreateRequest
+from app.dtos.live.live_response import LiveStreamListResponse, StreamStopResponse
+from app.models.live_history_model import LiveHistoryModel
+from app.models.live_model import LiveModel
+from app.models.user_model import User, UserRole
+from app.services.channel_allocator import channel_pools
+from app.services.live_service import (
+    StreamReaper,
+    service_get_all_streams,
+    service_get_public_streams,
+    service_start_stream,
+    service_stop_stream,
+)
+from app.services.pagination import encode_cursor
+from app.services.room_id_pool import room_id_pool
+
+STREAM = LiveStreamCreateRequest(
+    stream_title="테스트 방송",
+    stream_description="",
+    stream_category="일반",
+    tags=[],
+    is_public=True,
+    quality_setting="HD",
+)
+
+
+async def create_streamer(username: str) -> User:
+    return await User.create(
+        username=username,
+        password="-",
+        full_name=username,
+        email=f"{username}@example.local",
+        role=UserRole.STREAMER,
+    )
+
+
+async def test_start_with_deleted_cached_user_fails_without_retrying(db: None) -> None:
+    """다른 워커에서 삭제된 사용자(캐시 사본)로 시작 -> FK 위반은 채널 충돌이 아니므로 재시도 없이 실패"""
+    user = await create_streamer("stale_user")
+    await User.filter(id=user.id).delete()
+    free_before = channel_pools.free_count
+
+    with pytest.raises(HTTPException) as exc_info:
+        await asyncio.wait_for(service_start_stream(user, STREAM), timeout=5)
+
+    assert exc_info.value.status_code == 500
+    assert await LiveModel.all().count() == 0
+    # 점유했던 채널과 room id 는 반환
+    assert channel_pools.free_count == free_before
+    assert room_id_pool.active_count == 0
+
+
+async def test_start_skips_room_id_taken_by_another_worker(db: None) -> None:
+    """JANUS_ENABLED=False 라 방 생성 실패 신호가 없어도 lives 유니크 제약으로 다른 id 를 받음"""
+    other, user = await create_streamer("other_worker"), await create_streamer("this_worker")
+    # 다른 워커가 같은 풀 상태에서 먼저 발급/커밋한 id
+    taken = room_id_pool.acquire()
+    assert taken is not None
+    room_id_pool.release(taken)
+    room_id_pool.load([])
+    await LiveModel.create(
+        user=other,
+        username=other.username,
+        full_name=other.full_name,
+        channel_number=16,
+        active_channel=16,
+        janus_room_id=taken,
+    )
+
+    response = await service_start_stream(user, STREAM)
+
+    assert response["stream"]["janus_room_id"] != taken
+    assert await LiveModel.filter(janus_room_id=taken).count() == 1
+
+
+async def test_restart_skips_room_id_taken_by_another_worker(db: None) -> None:
+    other, user = await create_streamer("other_worker"), await create_streamer("this_worker")
+    await service_start_stream(user, STREAM)
+    taken = room_id_pool.acquire()
+    assert taken is not None
+    room_id_pool.release(taken)
+    room_id_pool.load([live.janus_room_id for live in await LiveModel.all()])
+    await LiveModel.create(
+        user=other,
+        username=other.username,
+        full_name=other.full_name,
+        channel_number=16,
+        active_channel=16,
+        janus_room_id=taken,
+    )
+
+    response = await service_start_stream(user, STREAM)
+
+    assert response["stream"]["janus_room_id"] not in (taken, None)
+    stopped = await service_stop_stream(user.id)
+    assert isinstance(stopped, StreamStopResponse) and stopped.success
+
+
+async def test_start_retries_channel_taken_by_another_worker(db: None) -> None:
+    """로컬 비트맵에는 비어 있지만 다른 워커가 커밋한 채널 -> 사용 중으로 두고 다음 채널로"""
+    other, user = await create_streamer("other_worker"), await create_streamer("this_worker")
+    await LiveModel.create(
+        user=other,
+        username=other.username,
+        full_name=other.full_name,
+        channel_number=1,
+        active_channel=1,
+        janus_room_id=9999,
+    )
+    assert channel_pools.is_free(1)
+
+    response = await asyncio.wait_for(service_start_stream(user, STREAM), timeout=5)
+
+    assert response["stream"]["channel_number"] == 2
+    assert not channel_pools.is_free(1)
+    assert await LiveModel.filter(user_id=user.id, active_channel=2).exists()
+
+
+async def test_reaper_ends_streams_without_heartbeat(db: None) -> None:
+    stale, alive = await create_streamer("stale_streamer"), await create_streamer("alive_streamer")
+    await service_start_stream(stale, STREAM)
+    await service_start_stream(alive, STREAM)
+    now = datetime.now(timezone.utc)
+    await LiveModel.filter(user_id=stale.id).update(last_heartbeat_at=now - timedelta(minutes=5))
+    free_before = channel_pools.free_count
+
+    reaped = await StreamReaper(timeout=60.0).reap_batch(now)
+
+    assert reaped == 1
+    assert await LiveModel.filter(user_id=stale.id).count() == 0
+    assert await LiveModel.filter(user_id=alive.id).exists()
+    history = await LiveHistoryModel.get(user_id=stale.id)
+    assert (history.channel_number, history.end_reason) == (1, "expired")
+    assert channel_pools.free_count == free_before + 1
+    assert channel_pools.is_free(1)
+
+
+async def test_stream_lists_page_with_cursor(db: None) -> None:
+    for index in range(3):
+        await service_start_stream(await create_streamer(f"streamer_{index}"), STREAM)
+
+    channels: list[int] = []
+    cursor = None
+    for _ in range(3):
+        page = await service_get_public_streams(limit=2, cursor=cursor)
+        assert isinstance(page, LiveStreamListResponse) and page.total_count == 3
+        channels += [stream.channel_number for stream in page.streams]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert channels == [1, 2, 3]
+
+    first = await service_get_all_streams(limit=2)
+    assert first.next_cursor is not None
+    rest = await service_get_all_streams(limit=2, cursor=first.next_cursor)
+    assert rest.next_cursor is None
+    ids = [stream.id for stream in [*first.streams, *rest.streams]]
+    assert sorted(ids, reverse=True) == ids and len(set(ids)) == 3
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor!",
+        encode_cursor(1),
+        encode_cursor("yesterday", 1),
+        encode_cursor(datetime.now(timezone.utc), True),
+        encode_cursor(datetime.now(timezone.utc), "1"),
+    ],
+)
+async def test_started_at_list_rejects_invalid_cursor(db: None, cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service_get_all_streams(cursor=cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", [encode_cursor(True), encode_cursor("1"), encode_cursor(1, 2)])
+async def test_public_list_rejects_invalid_cursor(db: None, cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service_get_public_streams(cursor=cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    started_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(started_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == [started_at.isoformat(), 42]
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm90LWpzb24", encode_cursor(1), encode_cursor(1, 2, 3)])
+def test_decode_cursor_rejects_malformed_or_wrong_size(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, 2)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_decode_cursor_rejects_non_list() -> None:
+    # base64('{"id": 1}')
+    with pytest.raises(HTTPException):
+        decode_cursor("eyJpZCI6IDF9", 1)
@@ -0,0 +1,36 @@
+from app.services.room_id_pool import RoomIdPool
+
+
+def test_load_keeps_uncommitted_ids() -> None:
+    pool = RoomIdPool(first_room_id=1, last_room_id=10)
+    pool.load([])
+    in_flight = pool.acquire()
+    committed = pool.acquire()
+    assert in_flight is not None and committed is not None
+    pool.confirm(committed)
+
+    # 재동기화 시점 DB 에는 아직 커밋 전인 in_flight 가 없음
+    pool.load([committed])
+
+    assert pool.acquire() not in (in_flight, committed)
+
+
+def test_fresh_ids_start_after_db_max_and_wrap() -> None:
+    pool = RoomIdPool(first_room_id=1, last_room_id=5)
+    pool.load([2, 3])
+    assert pool.acquire() == 4
+    assert pool.acquire() == 5
+    # 끝에 닿으면 처음부터, 사용 중인 id 는 건너뜀
+    assert pool.acquire() == 1
+    assert pool.acquire() is None
+
+
+def test_released_ids_wait_for_cooldown() -> None:
+    pool = RoomIdPool(first_room_id=1, last_room_id=2, cooldown=60)
+    pool.load([])
+    first = pool.acquire()
+    assert first is not None
+    pool.release(first)
+    assert pool.acquire() not in (first, None)
+    # 남은 id 는 cooldown 중인 id 뿐
+    assert pool.acquire() is None
@@ -0,0 +1,11 @@
+import asyncio
+
+from benchmarks.start_stream_queries import QUERY_BUDGETS, over_budget, run
+
+
+def test_start_stream_query_budgets() -> None:
+    """스트림 시작/재시작/종료 쿼리 수가 예산(start 2, restart 3, stop 3) 이내 (환경 변수는 conftest)"""
+    counts = asyncio.run(run())
+
+    assert set(counts) == set(QUERY_BUDGETS)
+    assert over_budget(counts) == {}
@@ -0,0 +1,25 @@
+import pytest
+
+from app.core.auth import user_cache_ttl
+from app.core.cache import CacheBackend
+from app.core.user_cache import UserCache
+from app.models.user_model import User
+
+
+def test_local_cache_with_several_workers_disables_user_cache() -> None:
+    assert user_cache_ttl(30.0, shared_cache=False, workers=1) == 30.0
+    assert user_cache_ttl(30.0, shared_cache=True, workers=4) == 30.0
+    assert user_cache_ttl(30.0, shared_cache=False, workers=4) == 0.0
+
+
+def test_disabled_user_cache_keeps_nothing() -> None:
+    user_cache = UserCache(ttl=0.0)
+    user_cache.set(User(id=1, username="streamer"))
+
+    assert user_cache.get(user_id=1) is None
+    assert user_cache.get(username="streamer") is None
+
+
+def test_cache_backend_requires_storage_methods() -> None:
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]